@@ -3,12 +3,14 @@
 Public API:
     - run(): Single prompt execution
     - run_many(): Multi-prompt source-pattern execution
+    - iter_many(): Multi-prompt execution yielding results as they complete
     - interact(): One explicit v2 interaction over an Environment and Input
     - prepare_environment(): Build a reusable Environment, front-loading cache I/O
     - defer(): Deferred submission of one or more interactions
     - inspect_deferred(): Inspect a deferred job
     - collect_deferred(): Collect terminal deferred results
     - cancel_deferred(): Cancel a deferred job
+    - shutdown(): Close pooled provider clients
     - Source: Explicit input types
     - Config: Configuration dataclass
 """
@@ -17,29 +19,18 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
+import importlib
 import logging
 from typing import TYPE_CHECKING, Any, cast
 
-from pollux.config import (
-    _API_KEY_ENV_VARS,
-    _LOCAL_BASE_URL_ENV_VAR,
-    Config,
-    ProviderName,
-    resolve_api_key,
-)
-from pollux.deferred import (
-    DeferredHandle,
-    DeferredSnapshot,
-    cancel_deferred_handle,
-    collect_deferred_handle,
-    inspect_deferred_handle,
-    submit_deferred,
-)
+from pollux._pool import ProviderPool
 from pollux.errors import (
     APIError,
     CacheError,
+    CircuitOpenError,
     ConfigurationError,
     ContextOverflowError,
+    DeadlineExceededError,
     DeferredNotReadyError,
     InternalError,
     PlanningError,
@@ -48,43 +39,60 @@ from pollux.errors import (
     SourceError,
     ToolCallParseError,
 )
-from pollux.interaction import (
-    CachePolicy,
-    CacheSetting,
-    Continuation,
-    Environment,
-    EnvironmentSnapshot,
-    Event,
-    Input,
-    Message,
-    Output,
-    OutputCollection,
-    OutputRequirements,
-    ToolCall,
-    ToolCallDelta,
-    ToolChoice,
-    ToolDeclaration,
-    ToolResult,
-)
-from pollux.interaction.execute import (
-    execute_interaction,
-    execute_interactions,
-    resolve_persistent_cache,
-    stream_interaction,
-)
-from pollux.providers.base import (
-    CloseableProvider,
-    ProviderReadiness,
-    ReadinessProvider,
-)
-from pollux.retry import RetryPolicy
-from pollux.source import Source
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Callable, Sequence
-
-    from pollux.interaction.schema import ResponseSchemaInput
-    from pollux.providers.base import Provider
+    from collections.abc import Callable
+
+    from pollux._api import (
+        Session,
+        cancel_deferred,
+        check_ready,
+        collect_deferred,
+        defer,
+        inspect_deferred,
+        interact,
+        iter_many,
+        local_reasoning,
+        prepare_environment,
+        run,
+        run_many,
+        stream,
+    )
+    from pollux.concurrency import AdaptiveConcurrency
+    from pollux.config import Config, ProviderName
+    from pollux.deferred import DeferredHandle, DeferredSnapshot
+    from pollux.hedge import HedgePolicy
+    from pollux.interaction import (
+        CachePolicy,
+        CacheSetting,
+        Continuation,
+        Environment,
+        Event,
+        Input,
+        Message,
+        Output,
+        OutputCollection,
+        OutputError,
+        OutputRequirements,
+        ToolCall,
+        ToolCallDelta,
+        ToolChoice,
+        ToolDeclaration,
+        ToolResult,
+    )
+    from pollux.providers.base import Provider, ProviderReadiness
+    from pollux.ratelimit import RateLimit
+    from pollux.response_cache import (
+        DirectoryResponseCache,
+        MemoryResponseCache,
+        ResponseCache,
+        SQLiteResponseCache,
+    )
+    from pollux.retry import CircuitBreakerPolicy, RetryPolicy
+    from pollux.scheduling import Priority, SchedulerStats
+    from pollux.source import Source
+    from pollux.tokens import HeuristicTokenizer, Tokenizer, TokenPreflight
+    from pollux.transport import HttpTransport
 
 try:
     from importlib.metadata import PackageNotFoundError, version
@@ -98,708 +106,133 @@ logging.getLogger("pollux").addHandler(logging.NullHandler())
 
 logger = logging.getLogger(__name__)
 
+# Public names resolved on first access (PEP 562) so ``import pollux`` does
+# not pay for pydantic, dotenv, provider modules, or the execution path until
+# something that needs them is touched.
+_LAZY_ATTRS: dict[str, str] = {
+    "AdaptiveConcurrency": "pollux.concurrency",
+    "CachePolicy": "pollux.interaction",
+    "CacheSetting": "pollux.interaction",
+    "CircuitBreakerPolicy": "pollux.retry",
+    "Config": "pollux.config",
+    "Continuation": "pollux.interaction",
+    "DeferredHandle": "pollux.deferred",
+    "DeferredSnapshot": "pollux.deferred",
+    "DirectoryResponseCache": "pollux.response_cache",
+    "Environment": "pollux.interaction",
+    "Event": "pollux.interaction",
+    "HedgePolicy": "pollux.hedge",
+    "HeuristicTokenizer": "pollux.tokens",
+    "HttpTransport": "pollux.transport",
+    "Input": "pollux.interaction",
+    "MemoryResponseCache": "pollux.response_cache",
+    "Message": "pollux.interaction",
+    "Output": "pollux.interaction",
+    "OutputCollection": "pollux.interaction",
+    "OutputError": "pollux.interaction",
+    "OutputRequirements": "pollux.interaction",
+    "Priority": "pollux.scheduling",
+    "ProviderReadiness": "pollux.providers.base",
+    "RateLimit": "pollux.ratelimit",
+    "ResponseCache": "pollux.response_cache",
+    "RetryPolicy": "pollux.retry",
+    "SQLiteResponseCache": "pollux.response_cache",
+    "SchedulerStats": "pollux.scheduling",
+    "Session": "pollux._api",
+    "Source": "pollux.source",
+    "ToolCall": "pollux.interaction",
+    "ToolCallDelta": "pollux.interaction",
+    "ToolChoice": "pollux.interaction",
+    "ToolDeclaration": "pollux.interaction",
+    "TokenPreflight": "pollux.tokens",
+    "Tokenizer": "pollux.tokens",
+    "ToolResult": "pollux.interaction",
+    "cancel_deferred": "pollux._api",
+    "check_ready": "pollux._api",
+    "collect_deferred": "pollux._api",
+    "defer": "pollux._api",
+    "inspect_deferred": "pollux._api",
+    "interact": "pollux._api",
+    "iter_many": "pollux._api",
+    "local_reasoning": "pollux._api",
+    "prepare_environment": "pollux._api",
+    "run": "pollux._api",
+    "run_many": "pollux._api",
+    "stream": "pollux._api",
+}
 
-def _build_requirements(
-    *,
-    output: ResponseSchemaInput | None,
-    temperature: float | None,
-    top_p: float | None,
-    max_tokens: int | None,
-    seed: int | None,
-    reasoning_effort: str | None,
-    reasoning_budget_tokens: int | None,
-    tool_choice: ToolChoice | None,
-    provider_options: dict[str, dict[str, Any]] | None,
-) -> OutputRequirements:
-    """Assemble OutputRequirements from the friendly first-class kwargs."""
-    return OutputRequirements(
-        output_schema=output,
-        temperature=temperature,
-        top_p=top_p,
-        max_tokens=max_tokens,
-        seed=seed,
-        reasoning_effort=reasoning_effort,
-        reasoning_budget_tokens=reasoning_budget_tokens,
-        tool_choice=tool_choice,
-        provider_options=provider_options,
-    )
-
-
-async def run(
-    prompt: str | None = None,
-    *,
-    source: Source | None = None,
-    sources: Sequence[Source] = (),
-    config: Config,
-    environment: Environment | None = None,
-    instructions: str | None = None,
-    output: ResponseSchemaInput | None = None,
-    temperature: float | None = None,
-    top_p: float | None = None,
-    max_tokens: int | None = None,
-    seed: int | None = None,
-    reasoning_effort: str | None = None,
-    reasoning_budget_tokens: int | None = None,
-    tool_choice: ToolChoice | None = None,
-    tools: Sequence[ToolDeclaration] | None = None,
-    provider_options: dict[str, dict[str, Any]] | None = None,
-) -> Output:
-    """Run a single prompt, optionally with sources for context.
-
-    The simple v2 facade: returns an :class:`Output` with named facets
-    (``text``, ``structured``, ``reasoning``, ``usage``, ``metrics``, …). For
-    stable environments, continuation, or tool loops, use :func:`interact`.
-
-    Args:
-        prompt: The prompt to run.
-        source: A single source for context (convenience for ``sources=[source]``).
-        sources: Stable sources for context.
-        config: Configuration specifying provider and model.
-        environment: Optional prepared :class:`Environment` (e.g. from
-            :func:`prepare_environment`) carrying instructions, sources, tools,
-            and cache preference. Cannot be combined with inline
-            ``instructions``/``source``/``sources``/``tools``.
-        instructions: Optional system-level instruction.
-        output: Optional Pydantic model or JSON Schema for structured output.
-        temperature: Optional sampling temperature.
-        top_p: Optional nucleus-sampling probability.
-        max_tokens: Optional hard cap on output tokens.
-        seed: Optional sampling seed where supported.
-        reasoning_effort: Optional qualitative reasoning effort.
-        reasoning_budget_tokens: Optional explicit reasoning token budget.
-        tool_choice: Optional tool-choice control.
-        tools: Optional tool declarations.
-        provider_options: Optional raw provider-scoped generation options.
-
-    Returns:
-        The completed :class:`Output`.
-
-    Example:
-        config = Config(provider="anthropic", model="claude-haiku-4-5")
-        result = await run("Summarize.", source=Source.from_file("doc.pdf"), config=config)
-        print(result.text)
-    """
-    if environment is not None and source is not None:
-        raise ConfigurationError(
-            "environment cannot be combined with inline source/sources",
-            hint="Build the Environment with the sources, or drop the environment.",
-        )
-    all_sources = (source,) if source is not None else tuple(sources)
-    collection = await run_many(
-        prompt,
-        sources=all_sources,
-        config=config,
-        environment=environment,
-        instructions=instructions,
-        output=output,
-        temperature=temperature,
-        top_p=top_p,
-        max_tokens=max_tokens,
-        seed=seed,
-        reasoning_effort=reasoning_effort,
-        reasoning_budget_tokens=reasoning_budget_tokens,
-        tool_choice=tool_choice,
-        tools=tools,
-        provider_options=provider_options,
-    )
-    return collection.outputs[0]
-
-
-async def interact(
-    environment: Environment,
-    input: Input,  # noqa: A002 - "input" is the canonical v2 primitive name
-    *,
-    config: Config,
-    output: ResponseSchemaInput | None = None,
-    temperature: float | None = None,
-    top_p: float | None = None,
-    max_tokens: int | None = None,
-    seed: int | None = None,
-    reasoning_effort: str | None = None,
-    reasoning_budget_tokens: int | None = None,
-    tool_choice: ToolChoice | None = None,
-    provider_options: dict[str, dict[str, Any]] | None = None,
-) -> Output:
-    """Run one explicit v2 interaction over an environment and input.
-
-    The v2 interaction facade: build an :class:`Environment` once (instructions,
-    sources, tools, cache preference), then send :class:`Input` turns. Returns an
-    :class:`Output` with named facets (``text``, ``structured``, ``reasoning``,
-    ``tool_calls``, ``continuation``, ``usage``, ``metrics``, ``diagnostics``).
-    Continue by passing the prior output's ``continuation`` and any
-    ``tool_results`` in the next ``Input``.
-
-    Args:
-        environment: Reusable model-facing setup for the interaction.
-        input: The per-turn payload (user content, continuation, tool results).
-        config: Configuration specifying provider and model.
-        output: Optional Pydantic model or JSON Schema for structured output.
-        temperature: Optional sampling temperature.
-        top_p: Optional nucleus-sampling probability.
-        max_tokens: Optional hard cap on output tokens.
-        seed: Optional sampling seed where supported.
-        reasoning_effort: Optional qualitative reasoning effort.
-        reasoning_budget_tokens: Optional explicit reasoning token budget.
-        tool_choice: Optional tool-choice control.
-        provider_options: Optional raw provider-scoped generation options.
-
-    Returns:
-        The completed :class:`Output` for the interaction.
-
-    Example:
-        environment = Environment(instructions=system_prompt, tools=tool_decls)
-        result = await interact(environment, Input("Inspect the repo."), config=cfg)
-        while result.tool_calls:
-            results = [ToolResult(call_id=c.id, content=run_tool(c)) for c in result.tool_calls]
-            result = await interact(
-                environment,
-                Input(continuation=result.continuation, tool_results=results),
-                config=cfg,
-            )
-    """
-    async with Session(config) as session:
-        return await session.interact(
-            environment,
-            input,
-            output=output,
-            temperature=temperature,
-            top_p=top_p,
-            max_tokens=max_tokens,
-            seed=seed,
-            reasoning_effort=reasoning_effort,
-            reasoning_budget_tokens=reasoning_budget_tokens,
-            tool_choice=tool_choice,
-            provider_options=provider_options,
-        )
-
-
-async def stream(
-    environment: Environment,
-    input: Input,  # noqa: A002 - "input" is the canonical v2 primitive name
-    *,
-    config: Config,
-    output: ResponseSchemaInput | None = None,
-    temperature: float | None = None,
-    top_p: float | None = None,
-    max_tokens: int | None = None,
-    seed: int | None = None,
-    reasoning_effort: str | None = None,
-    reasoning_budget_tokens: int | None = None,
-    tool_choice: ToolChoice | None = None,
-    provider_options: dict[str, dict[str, Any]] | None = None,
-) -> AsyncIterator[Event]:
-    """Stream one explicit v2 interaction as :class:`Event` objects.
-
-    The streaming sibling of :func:`interact`: same environment/input/config and
-    the same completed result, observed as a timeline. Iterate the events
-    (``text_delta``, ``reasoning_delta``, ``tool_call_delta``, ``tool_call``,
-    ``usage``, ``finish``) and read the final assembled :class:`Output` from the
-    terminal ``done`` event, whose ``output`` matches what :func:`interact` would
-    return for the same interaction. Consumers never parse SSE or provider chunks.
-
-    A provider that does not support streaming raises ``ConfigurationError``. A
-    mid-stream provider failure raises from the iterator rather than emitting a
-    ``done`` event, so a failed interaction never yields a final output.
-
-    Args:
-        environment: Reusable model-facing setup for the interaction.
-        input: The per-turn payload (user content, continuation, tool results).
-        config: Configuration specifying provider and model.
-        output: Optional Pydantic model or JSON Schema for structured output.
-        temperature: Optional sampling temperature.
-        top_p: Optional nucleus-sampling probability.
-        max_tokens: Optional hard cap on output tokens.
-        seed: Optional sampling seed where supported.
-        reasoning_effort: Optional qualitative reasoning effort.
-        reasoning_budget_tokens: Optional explicit reasoning token budget.
-        tool_choice: Optional tool-choice control.
-        provider_options: Optional raw provider-scoped generation options.
-
-    Yields:
-        Each :class:`Event` in the interaction's timeline, ending in ``done``.
-
-    Example:
-        async for event in stream(environment, Input("Inspect the repo."), config=cfg):
-            if event.type == "text_delta":
-                print(event.text, end="")
-            elif event.type == "done":
-                result = event.output
-    """
-    async with Session(config) as session:
-        async for event in session.stream(
-            environment,
-            input,
-            output=output,
-            temperature=temperature,
-            top_p=top_p,
-            max_tokens=max_tokens,
-            seed=seed,
-            reasoning_effort=reasoning_effort,
-            reasoning_budget_tokens=reasoning_budget_tokens,
-            tool_choice=tool_choice,
-            provider_options=provider_options,
-        ):
-            yield event
-
-
-class Session:
-    """Reusable Pollux runtime for multi-turn agent loops.
-
-    The one-shot helpers create and close a provider per call. ``Session`` owns a
-    single provider instance so clients with many sequential turns can reuse
-    transport resources while still going through the public interaction APIs.
-    """
-
-    def __init__(self, config: Config) -> None:
-        self.config = config
-        self._provider = _get_provider(config)
-        self._closed = False
-
-    async def __aenter__(self) -> Session:  # noqa: PYI034
-        """Enter the async context manager."""
-        return self
-
-    async def __aexit__(
-        self,
-        _exc_type: type[BaseException] | None,
-        _exc: BaseException | None,
-        _tb: object,
-    ) -> None:
-        """Close provider resources when leaving the async context manager."""
-        await self.aclose()
-
-    def _ensure_open(self) -> None:
-        if self._closed:
-            raise ConfigurationError(
-                "Pollux Session is closed",
-                hint="Create a new Session for additional interactions.",
-            )
-
-    async def interact(
-        self,
-        environment: Environment,
-        input: Input,  # noqa: A002 - "input" is the canonical v2 primitive name
-        *,
-        output: ResponseSchemaInput | None = None,
-        temperature: float | None = None,
-        top_p: float | None = None,
-        max_tokens: int | None = None,
-        seed: int | None = None,
-        reasoning_effort: str | None = None,
-        reasoning_budget_tokens: int | None = None,
-        tool_choice: ToolChoice | None = None,
-        provider_options: dict[str, dict[str, Any]] | None = None,
-    ) -> Output:
-        """Run one interaction using the session's provider instance."""
-        self._ensure_open()
-        requirements = _build_requirements(
-            output=output,
-            temperature=temperature,
-            top_p=top_p,
-            max_tokens=max_tokens,
-            seed=seed,
-            reasoning_effort=reasoning_effort,
-            reasoning_budget_tokens=reasoning_budget_tokens,
-            tool_choice=tool_choice,
-            provider_options=provider_options,
-        )
-        return await execute_interaction(
-            environment, input, requirements, self.config, self._provider
-        )
 
-    async def stream(
-        self,
-        environment: Environment,
-        input: Input,  # noqa: A002 - "input" is the canonical v2 primitive name
-        *,
-        output: ResponseSchemaInput | None = None,
-        temperature: float | None = None,
-        top_p: float | None = None,
-        max_tokens: int | None = None,
-        seed: int | None = None,
-        reasoning_effort: str | None = None,
-        reasoning_budget_tokens: int | None = None,
-        tool_choice: ToolChoice | None = None,
-        provider_options: dict[str, dict[str, Any]] | None = None,
-    ) -> AsyncIterator[Event]:
-        """Stream one interaction using the session's provider instance."""
-        self._ensure_open()
-        requirements = _build_requirements(
-            output=output,
-            temperature=temperature,
-            top_p=top_p,
-            max_tokens=max_tokens,
-            seed=seed,
-            reasoning_effort=reasoning_effort,
-            reasoning_budget_tokens=reasoning_budget_tokens,
-            tool_choice=tool_choice,
-            provider_options=provider_options,
-        )
-        async for event in stream_interaction(
-            environment, input, requirements, self.config, self._provider
-        ):
-            yield event
-
-    async def run_many(
-        self,
-        prompts: str | Sequence[str | None] | None = None,
-        *,
-        sources: Sequence[Source] = (),
-        environment: Environment | None = None,
-        instructions: str | None = None,
-        output: ResponseSchemaInput | None = None,
-        temperature: float | None = None,
-        top_p: float | None = None,
-        max_tokens: int | None = None,
-        seed: int | None = None,
-        reasoning_effort: str | None = None,
-        reasoning_budget_tokens: int | None = None,
-        tool_choice: ToolChoice | None = None,
-        tools: Sequence[ToolDeclaration] | None = None,
-        provider_options: dict[str, dict[str, Any]] | None = None,
-    ) -> OutputCollection:
-        """Run source-pattern prompts using the session's provider instance."""
-        self._ensure_open()
-        prompt_tuple = (
-            (prompts,) if isinstance(prompts, (str, type(None))) else tuple(prompts)
-        )
-        if environment is not None:
-            if sources or instructions is not None or tools is not None:
-                raise ConfigurationError(
-                    "environment cannot be combined with inline instructions/sources/tools",
-                    hint="Put instructions, sources, and tools on the Environment, "
-                    "or drop the environment argument.",
-                )
-            resolved_environment = environment
-        else:
-            resolved_environment = Environment(
-                instructions=instructions,
-                sources=tuple(sources),
-                tools=tuple(tools) if tools else (),
-            )
-        inputs = [Input(content=prompt) for prompt in prompt_tuple]
-        requirements = _build_requirements(
-            output=output,
-            temperature=temperature,
-            top_p=top_p,
-            max_tokens=max_tokens,
-            seed=seed,
-            reasoning_effort=reasoning_effort,
-            reasoning_budget_tokens=reasoning_budget_tokens,
-            tool_choice=tool_choice,
-            provider_options=provider_options,
-        )
-        return await execute_interactions(
-            resolved_environment, inputs, requirements, self.config, self._provider
-        )
+def __getattr__(name: str) -> Any:
+    """Import a public name's defining module on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache it so later lookups skip this hook.
+    globals()[name] = value
+    return value
 
-    async def check_ready(self) -> ProviderReadiness:
-        """Return provider readiness for this session's config."""
-        self._ensure_open()
-        if isinstance(self._provider, ReadinessProvider):
-            return await self._provider.check_ready(model=self.config.model)
-        return ProviderReadiness(
-            ready=True,
-            provider=self.config.provider,
-            model=self.config.model,
-            message="Provider has no explicit readiness probe.",
-            model_verified=False,
-        )
 
-    async def aclose(self) -> None:
-        """Close the session's provider resources."""
-        if self._closed:
-            return
-        self._closed = True
-        await _close_provider(self._provider)
-
-
-async def check_ready(config: Config) -> ProviderReadiness:
-    """Run a fast provider readiness probe and close provider resources."""
-    provider = _get_provider(config)
-    try:
-        if isinstance(provider, ReadinessProvider):
-            return await provider.check_ready(model=config.model)
-        return ProviderReadiness(
-            ready=True,
-            provider=config.provider,
-            model=config.model,
-            message="Provider has no explicit readiness probe.",
-            model_verified=False,
-        )
-    finally:
-        await _close_provider(provider)
+def __dir__() -> list[str]:
+    """Include lazily loaded public names."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 
-def local_reasoning(*, enabled: bool = False) -> dict[str, dict[str, Any]]:
-    """Return local provider options for servers with ``enable_thinking`` support."""
-    return {"local": {"chat_template_kwargs": {"enable_thinking": enabled}}}
+async def _close_provider(provider: Provider) -> None:
+    """Close provider resources without masking primary errors."""
+    from pollux.providers.base import CloseableProvider
 
+    if isinstance(provider, CloseableProvider):
+        try:
+            await provider.aclose()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            logger.warning("Provider cleanup failed: %s", exc)
 
-async def defer(
-    prompts: str | Sequence[str | None] | None = None,
-    *,
-    sources: Sequence[Source] = (),
-    config: Config,
-    instructions: str | None = None,
-    output: ResponseSchemaInput | None = None,
-    temperature: float | None = None,
-    top_p: float | None = None,
-    max_tokens: int | None = None,
-    seed: int | None = None,
-    reasoning_effort: str | None = None,
-    reasoning_budget_tokens: int | None = None,
-    provider_options: dict[str, dict[str, Any]] | None = None,
-) -> DeferredHandle:
-    """Submit one or more deferred requests and return a serializable handle.
-
-    The v2 deferred frontdoor: submit a single interaction or a source-pattern
-    collection on a provider-side timeline, then :func:`inspect_deferred` and
-    :func:`collect_deferred` later. Collection returns an
-    :class:`OutputCollection`, the same shape as :func:`run_many`.
-
-    Tool calling, continuation, and persistent caching are out of scope for
-    deferred delivery and are intentionally not part of this surface.
-
-    Args:
-        prompts: One or more prompts to submit.
-        sources: Stable sources shared across the prompts.
-        config: Configuration specifying provider and model.
-        instructions: Optional system-level instruction.
-        output: Optional Pydantic model or JSON Schema for structured output.
-            Pass the same schema to :func:`collect_deferred` to rehydrate.
-        temperature: Optional sampling temperature.
-        top_p: Optional nucleus-sampling probability.
-        max_tokens: Optional hard cap on output tokens.
-        seed: Optional sampling seed where supported.
-        reasoning_effort: Optional qualitative reasoning effort.
-        reasoning_budget_tokens: Optional explicit reasoning token budget.
-        provider_options: Optional raw provider-scoped generation options.
-
-    Returns:
-        A serializable :class:`DeferredHandle` for the submitted job.
-    """
-    prompt_tuple = (
-        (prompts,) if isinstance(prompts, (str, type(None))) else tuple(prompts)
-    )
-    if not prompt_tuple:
-        raise ConfigurationError(
-            "defer() requires at least one prompt",
-            hint="Pass one or more prompts to submit for deferred collection.",
-        )
-    environment = Environment(instructions=instructions, sources=tuple(sources))
-    inputs = [Input(content=prompt) for prompt in prompt_tuple]
-    requirements = _build_requirements(
-        output=output,
-        temperature=temperature,
-        top_p=top_p,
-        max_tokens=max_tokens,
-        seed=seed,
-        reasoning_effort=reasoning_effort,
-        reasoning_budget_tokens=reasoning_budget_tokens,
-        tool_choice=None,
-        provider_options=provider_options,
-    )
-    provider = _get_provider(config)
-    try:
-        return await submit_deferred(
-            environment, inputs, requirements, config, provider
-        )
-    finally:
-        await _close_provider(provider)
 
+# Provider clients borrowed by calls whose Config sets ``reuse_clients``.
+_client_pool = ProviderPool(_close_provider)
 
-async def run_many(
-    prompts: str | Sequence[str | None] | None = None,
-    *,
-    sources: Sequence[Source] = (),
-    config: Config,
-    environment: Environment | None = None,
-    instructions: str | None = None,
-    output: ResponseSchemaInput | None = None,
-    temperature: float | None = None,
-    top_p: float | None = None,
-    max_tokens: int | None = None,
-    seed: int | None = None,
-    reasoning_effort: str | None = None,
-    reasoning_budget_tokens: int | None = None,
-    tool_choice: ToolChoice | None = None,
-    tools: Sequence[ToolDeclaration] | None = None,
-    provider_options: dict[str, dict[str, Any]] | None = None,
-) -> OutputCollection:
-    """Run multiple prompts with shared sources for source-pattern execution.
-
-    Returns an :class:`OutputCollection` whose ``outputs`` preserve input order;
-    ``.answers`` / ``.structured`` give ergonomic per-prompt lists.
-
-    Args:
-        prompts: One or more prompts to run.
-        sources: Stable sources shared across the prompts.
-        config: Configuration specifying provider and model.
-        environment: Optional prepared :class:`Environment` (e.g. from
-            :func:`prepare_environment`) carrying instructions, sources, tools,
-            and cache preference. Cannot be combined with inline
-            ``instructions``/``sources``/``tools``.
-        instructions: Optional system-level instruction.
-        output: Optional Pydantic model or JSON Schema for structured output.
-        temperature: Optional sampling temperature.
-        top_p: Optional nucleus-sampling probability.
-        max_tokens: Optional hard cap on output tokens.
-        seed: Optional sampling seed where supported.
-        reasoning_effort: Optional qualitative reasoning effort.
-        reasoning_budget_tokens: Optional explicit reasoning token budget.
-        tool_choice: Optional tool-choice control.
-        tools: Optional tool declarations.
-        provider_options: Optional raw provider-scoped generation options.
-
-    Returns:
-        The :class:`OutputCollection` for the source pattern.
-
-    Example:
-        config = Config(provider="anthropic", model="claude-haiku-4-5")
-        results = await run_many(
-            ["Question 1?", "Question 2?"],
-            sources=[Source.from_text("Context...")],
-            config=config,
-        )
-        for answer in results.answers:
-            print(answer)
-    """
-    async with Session(config) as session:
-        return await session.run_many(
-            prompts,
-            sources=sources,
-            environment=environment,
-            instructions=instructions,
-            output=output,
-            temperature=temperature,
-            top_p=top_p,
-            max_tokens=max_tokens,
-            seed=seed,
-            reasoning_effort=reasoning_effort,
-            reasoning_budget_tokens=reasoning_budget_tokens,
-            tool_choice=tool_choice,
-            tools=tools,
-            provider_options=provider_options,
-        )
 
+def _acquire_provider(config: Config) -> Provider:
+    """Borrow a pooled provider when the config allows it, else build one.
 
-async def prepare_environment(
-    *,
-    sources: Sequence[Source] = (),
-    config: Config,
-    instructions: str | None = None,
-    tools: Sequence[ToolDeclaration] | None = None,
-    cache: CacheSetting = None,
-    metadata: dict[str, Any] | None = None,
-) -> Environment:
-    """Prepare a reusable :class:`Environment`, front-loading cache/upload I/O.
-
-    Build the stable model-facing setup once and reuse it across
-    :func:`interact`, :func:`run`, and :func:`run_many` calls. When ``cache`` is
-    a :class:`CachePolicy`, the persistent cache is created now (uploading
-    sources and surfacing capability errors early); later interactions over the
-    returned environment reuse it by identity.
-
-    Args:
-        sources: Stable sources to bake into the environment (and its cache).
-        config: Configuration specifying provider and model.
-        instructions: Optional system-level instruction.
-        tools: Optional tool declarations.
-        cache: Cache preference: a :class:`CachePolicy` for persistent caching,
-            ``"auto"`` for provider-managed caching, ``"none"`` to disable, or
-            ``None`` for the default.
-        metadata: Optional provider-neutral metadata for planning.
-
-    Returns:
-        The prepared :class:`Environment`.
-
-    Example:
-        environment = await prepare_environment(
-            sources=[Source.from_file("paper.pdf")],
-            instructions=system_prompt,
-            cache=CachePolicy(ttl_seconds=3600),
-            config=config,
-        )
-        results = await run_many(prompts, environment=environment, config=config)
+    Pooled clients are bound to the running event loop, so outside a loop
+    (e.g. a ``Session`` constructed in sync code) a private one is built.
     """
-    environment = Environment(
-        instructions=instructions,
-        sources=tuple(sources),
-        tools=tuple(tools) if tools else (),
-        cache=cache,
-        metadata=metadata,
-    )
-    if isinstance(cache, CachePolicy):
-        provider = _get_provider(config)
+    if config.reuse_clients:
         try:
-            snapshot = EnvironmentSnapshot.from_environment(
-                environment, provider=config.provider
+            return _client_pool.acquire(
+                (
+                    config.provider,
+                    config.api_key,
+                    config.base_url,
+                    config.request_timeout_s,
+                    config.http_transport,
+                    config.use_mock,
+                ),
+                lambda: _get_provider(config),
             )
-            await resolve_persistent_cache(snapshot, config, provider)
-        finally:
-            await _close_provider(provider)
-    return environment
-
-
-async def inspect_deferred(
-    handle: DeferredHandle,
-) -> DeferredSnapshot:
-    """Inspect the current state of a deferred job."""
-    provider = _resolve_deferred_provider(handle)
-    try:
-        return await inspect_deferred_handle(handle, provider)
-    finally:
-        await _close_provider(provider)
+        except RuntimeError:
+            pass
+    return _get_provider(config)
 
 
-async def collect_deferred(
-    handle: DeferredHandle,
-    *,
-    response_schema: type[Any] | dict[str, Any] | None = None,
-) -> OutputCollection:
-    """Collect a terminal deferred job into an :class:`OutputCollection`.
-
-    Returns the same shape as :func:`run_many`: one :class:`Output` per
-    submitted request, in submission order. Each output's
-    ``diagnostics.raw["deferred"]`` carries the job id and per-item status.
-
-    Args:
-        handle: The deferred handle returned by :func:`defer`.
-        response_schema: Optional Pydantic model or JSON Schema for structured
-            output rehydration. Must match the schema used at submission time.
-    """
-    provider = _resolve_deferred_provider(handle)
-    try:
-        return await collect_deferred_handle(
-            handle,
-            provider,
-            response_schema=response_schema,
-        )
-    finally:
+async def _release_provider(provider: Provider) -> None:
+    """Hand a pooled provider back, or close a private one."""
+    if not await _client_pool.release(provider):
         await _close_provider(provider)
 
 
-async def cancel_deferred(
-    handle: DeferredHandle,
-) -> None:
-    """Request provider-side cancellation for a deferred job."""
-    provider = _resolve_deferred_provider(handle)
-    try:
-        await cancel_deferred_handle(handle, provider)
-    finally:
-        await _close_provider(provider)
-
+async def shutdown() -> None:
+    """Close the pooled provider clients kept by ``Config(reuse_clients=True)``.
 
-async def _close_provider(provider: Provider) -> None:
-    """Close provider resources without masking primary errors."""
-    if isinstance(provider, CloseableProvider):
-        try:
-            await provider.aclose()
-        except asyncio.CancelledError:
-            raise
-        except Exception as exc:
-            logger.warning("Provider cleanup failed: %s", exc)
+    Call it before the event loop ends (for example at the end of the
+    coroutine passed to ``asyncio.run``). Clients still in use close when
+    their last call finishes.
+    """
+    await _client_pool.shutdown()
 
 
 @dataclass(frozen=True)
@@ -835,9 +268,21 @@ def _build_anthropic(api_key: str | None, _base_url: str | None) -> Provider:
 
 
 def _build_openrouter(api_key: str | None, _base_url: str | None) -> Provider:
+    return _build_openrouter_with_transport(api_key, 300.0, None)
+
+
+def _build_openrouter_with_transport(
+    api_key: str | None,
+    request_timeout_s: float,
+    http_transport: HttpTransport | None,
+) -> Provider:
     from pollux.providers.openrouter import OpenRouterProvider
 
-    return OpenRouterProvider(cast("str", api_key))
+    return OpenRouterProvider(
+        cast("str", api_key),
+        timeout_s=request_timeout_s,
+        transport=http_transport,
+    )
 
 
 def _build_local(api_key: str | None, base_url: str | None) -> Provider:
@@ -848,6 +293,7 @@ def _build_local_with_timeout(
     api_key: str | None,
     base_url: str | None,
     request_timeout_s: float,
+    http_transport: HttpTransport | None = None,
 ) -> Provider:
     from pollux.providers.local import LocalProvider
 
@@ -855,6 +301,7 @@ def _build_local_with_timeout(
         base_url=cast("str", base_url),
         api_key=api_key,
         timeout_s=request_timeout_s,
+        transport=http_transport,
     )
 
 
@@ -878,6 +325,7 @@ def _create_provider(
     use_mock: bool = False,
     base_url: str | None = None,
     request_timeout_s: float = 300.0,
+    http_transport: HttpTransport | None = None,
 ) -> Provider:
     """Instantiate a provider client from explicit parameters."""
     if use_mock:
@@ -893,6 +341,8 @@ def _create_provider(
             + ", ".join(repr(name) for name in _PROVIDER_REGISTRY),
         )
 
+    from pollux.config import _API_KEY_ENV_VARS, _LOCAL_BASE_URL_ENV_VAR
+
     if spec.requires_base_url and not base_url:
         raise ConfigurationError(
             f"base_url required for provider={provider!r}",
@@ -915,6 +365,11 @@ def _create_provider(
             api_key,
             base_url,
             request_timeout_s,
+            http_transport,
+        )
+    if provider == "openrouter":
+        return _build_openrouter_with_transport(
+            api_key, request_timeout_s, http_transport
         )
     return spec.build(api_key, base_url)
 
@@ -927,10 +382,13 @@ def _get_provider(config: Config) -> Provider:
         use_mock=config.use_mock,
         base_url=config.base_url,
         request_timeout_s=config.request_timeout_s,
+        http_transport=config.http_transport,
     )
 
 
-def _resolve_deferred_provider(handle: DeferredHandle) -> Provider:
+def _resolve_deferred_provider(
+    handle: DeferredHandle, config: Config | None = None
+) -> Provider:
     """Resolve a provider client for deferred lifecycle calls from the handle."""
     # Gate on the registry flag, not provider.capabilities.deferred_delivery:
     # this runs before instantiation, keyed only by the persisted provider name.
@@ -943,6 +401,16 @@ def _resolve_deferred_provider(handle: DeferredHandle) -> Provider:
             f"Unknown provider on deferred handle: {handle.provider!r}",
             hint="Persist Pollux DeferredHandle values without modifying their provider field.",
         )
+    if config is not None:
+        if config.provider != handle.provider:
+            raise ConfigurationError(
+                f"config.provider {config.provider!r} does not match the deferred "
+                f"handle's provider {handle.provider!r}",
+                hint="Pass the Config used with defer(), or omit config.",
+            )
+        return _acquire_provider(config)
+    from pollux.config import resolve_api_key
+
     api_key = resolve_api_key(cast("ProviderName", handle.provider))
     return _create_provider(handle.provider, api_key)
 
@@ -950,32 +418,49 @@ def _resolve_deferred_provider(handle: DeferredHandle) -> Provider:
 # Re-export for convenience
 __all__ = [
     "APIError",
+    "AdaptiveConcurrency",
     "CacheError",
     "CachePolicy",
     "CacheSetting",
+    "CircuitBreakerPolicy",
+    "CircuitOpenError",
     "Config",
     "ConfigurationError",
     "ContextOverflowError",
     "Continuation",
+    "DeadlineExceededError",
     "DeferredHandle",
     "DeferredNotReadyError",
     "DeferredSnapshot",
+    "DirectoryResponseCache",
     "Environment",
     "Event",
+    "HedgePolicy",
+    "HeuristicTokenizer",
+    "HttpTransport",
     "Input",
     "InternalError",
+    "MemoryResponseCache",
     "Message",
     "Output",
     "OutputCollection",
+    "OutputError",
     "OutputRequirements",
     "PlanningError",
     "PolluxError",
+    "Priority",
     "ProviderReadiness",
+    "RateLimit",
     "RateLimitError",
+    "ResponseCache",
     "RetryPolicy",
+    "SQLiteResponseCache",
+    "SchedulerStats",
     "Session",
     "Source",
     "SourceError",
+    "TokenPreflight",
+    "Tokenizer",
     "ToolCall",
     "ToolCallDelta",
     "ToolCallParseError",
@@ -988,9 +473,11 @@ __all__ = [
     "defer",
     "inspect_deferred",
     "interact",
+    "iter_many",
     "local_reasoning",
     "prepare_environment",
     "run",
     "run_many",
+    "shutdown",
     "stream",
 ]
@@ -0,0 +1,1055 @@
+"""Front-door helpers re-exported by :mod:`pollux`.
+
+``pollux/__init__.py`` loads this module on first use of ``run``,
+``Session`` and friends, so ``import pollux`` stays cheap. Provider
+construction stays in the package module, where tests and callers patch it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, Sequence
+import functools
+from typing import TYPE_CHECKING, Any
+
+from pollux import (
+    _acquire_provider,
+    _release_provider,
+    _resolve_deferred_provider,
+)
+from pollux.deferred import (
+    DeferredHandle,
+    DeferredSnapshot,
+    cancel_deferred_handle,
+    collect_deferred_handle,
+    inspect_deferred_handle,
+    submit_deferred,
+)
+from pollux.errors import ConfigurationError
+from pollux.interaction import (
+    CachePolicy,
+    CacheSetting,
+    Environment,
+    EnvironmentSnapshot,
+    Event,
+    Input,
+    Output,
+    OutputCollection,
+    OutputRequirements,
+    ToolChoice,
+    ToolDeclaration,
+)
+from pollux.interaction._uploads import BackgroundCleanup
+from pollux.interaction.execute import (
+    execute_interaction,
+    execute_interactions,
+    iter_interactions,
+    resolve_persistent_cache,
+    single_output,
+    stream_interaction,
+)
+from pollux.providers.base import ProviderReadiness, ReadinessProvider
+from pollux.retry import RetryBudget
+from pollux.scheduling import Priority, SchedulerStats, SessionScheduler
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable, Mapping
+    from contextlib import AbstractAsyncContextManager
+
+    from pollux.config import Config
+    from pollux.interaction.schema import ResponseSchemaInput
+    from pollux.source import Source
+
+
+def _build_requirements(
+    *,
+    output: ResponseSchemaInput | None,
+    temperature: float | None,
+    top_p: float | None,
+    max_tokens: int | None,
+    seed: int | None,
+    reasoning_effort: str | None,
+    reasoning_budget_tokens: int | None,
+    tool_choice: ToolChoice | None,
+    provider_options: dict[str, dict[str, Any]] | None,
+) -> OutputRequirements:
+    """Assemble OutputRequirements from the friendly first-class kwargs."""
+    return OutputRequirements(
+        output_schema=output,
+        temperature=temperature,
+        top_p=top_p,
+        max_tokens=max_tokens,
+        seed=seed,
+        reasoning_effort=reasoning_effort,
+        reasoning_budget_tokens=reasoning_budget_tokens,
+        tool_choice=tool_choice,
+        provider_options=provider_options,
+    )
+
+
+def _source_environment(
+    *,
+    sources: Sequence[Source],
+    environment: Environment | None,
+    instructions: str | None,
+    tools: Sequence[ToolDeclaration] | None,
+) -> Environment:
+    """Resolve source-pattern kwargs into the shared ``Environment``."""
+    if environment is not None:
+        if sources or instructions is not None or tools is not None:
+            raise ConfigurationError(
+                "environment cannot be combined with inline instructions/sources/tools",
+                hint="Put instructions, sources, and tools on the Environment, "
+                "or drop the environment argument.",
+            )
+        return environment
+    return Environment(
+        instructions=instructions,
+        sources=tuple(sources),
+        tools=tuple(tools) if tools else (),
+    )
+
+
+def _prompt_inputs(prompts: str | Sequence[str | None] | None) -> list[Input]:
+    """Build one ``Input`` per prompt; a bare string or ``None`` is one prompt."""
+    prompt_tuple = (
+        (prompts,) if isinstance(prompts, (str, type(None))) else tuple(prompts)
+    )
+    return [Input(content=prompt) for prompt in prompt_tuple]
+
+
+def _lazy_prompt_inputs(
+    prompts: str | Iterable[str | None] | AsyncIterable[str | None] | None,
+) -> Sequence[Input] | Iterable[Input] | AsyncIterable[Input]:
+    """Like :func:`_prompt_inputs`, but keep non-sequence prompt sources lazy."""
+    if prompts is None or isinstance(prompts, (str, Sequence)):
+        return _prompt_inputs(prompts)
+    if isinstance(prompts, AsyncIterable):
+        return _async_prompt_inputs(prompts)
+    return (Input(content=prompt) for prompt in prompts)
+
+
+async def _async_prompt_inputs(
+    prompts: AsyncIterable[str | None],
+) -> AsyncIterator[Input]:
+    """Map an async prompt source to inputs without buffering it."""
+    async for prompt in prompts:
+        yield Input(content=prompt)
+
+
+async def run(
+    prompt: str | None = None,
+    *,
+    source: Source | None = None,
+    sources: Sequence[Source] = (),
+    config: Config,
+    environment: Environment | None = None,
+    instructions: str | None = None,
+    output: ResponseSchemaInput | None = None,
+    temperature: float | None = None,
+    top_p: float | None = None,
+    max_tokens: int | None = None,
+    seed: int | None = None,
+    reasoning_effort: str | None = None,
+    reasoning_budget_tokens: int | None = None,
+    tool_choice: ToolChoice | None = None,
+    tools: Sequence[ToolDeclaration] | None = None,
+    provider_options: dict[str, dict[str, Any]] | None = None,
+    timeout_s: float | None = None,
+) -> Output:
+    """Run a single prompt, optionally with sources for context.
+
+    The simple v2 facade: returns an :class:`Output` with named facets
+    (``text``, ``structured``, ``reasoning``, ``usage``, ``metrics``, …). For
+    stable environments, continuation, or tool loops, use :func:`interact`.
+
+    Args:
+        prompt: The prompt to run.
+        source: A single source for context (convenience for ``sources=[source]``).
+        sources: Stable sources for context.
+        config: Configuration specifying provider and model.
+        environment: Optional prepared :class:`Environment` (e.g. from
+            :func:`prepare_environment`) carrying instructions, sources, tools,
+            and cache preference. Cannot be combined with inline
+            ``instructions``/``source``/``sources``/``tools``.
+        instructions: Optional system-level instruction.
+        output: Optional Pydantic model or JSON Schema for structured output.
+        temperature: Optional sampling temperature.
+        top_p: Optional nucleus-sampling probability.
+        max_tokens: Optional hard cap on output tokens.
+        seed: Optional sampling seed where supported.
+        reasoning_effort: Optional qualitative reasoning effort.
+        reasoning_budget_tokens: Optional explicit reasoning token budget.
+        tool_choice: Optional tool-choice control.
+        tools: Optional tool declarations.
+        provider_options: Optional raw provider-scoped generation options.
+        timeout_s: Optional wall-clock budget in seconds, retries and
+            uploads included. A call still running when it runs out is
+            cancelled.
+
+    Returns:
+        The completed :class:`Output`.
+
+    Raises:
+        DeadlineExceededError: If *timeout_s* runs out first.
+
+    Example:
+        config = Config(provider="anthropic", model="claude-haiku-4-5")
+        result = await run("Summarize.", source=Source.from_file("doc.pdf"), config=config)
+        print(result.text)
+    """
+    if environment is not None and source is not None:
+        raise ConfigurationError(
+            "environment cannot be combined with inline source/sources",
+            hint="Build the Environment with the sources, or drop the environment.",
+        )
+    all_sources = (source,) if source is not None else tuple(sources)
+    collection = await run_many(
+        prompt,
+        sources=all_sources,
+        config=config,
+        environment=environment,
+        instructions=instructions,
+        output=output,
+        temperature=temperature,
+        top_p=top_p,
+        max_tokens=max_tokens,
+        seed=seed,
+        reasoning_effort=reasoning_effort,
+        reasoning_budget_tokens=reasoning_budget_tokens,
+        tool_choice=tool_choice,
+        tools=tools,
+        provider_options=provider_options,
+        timeout_s=timeout_s,
+    )
+    return single_output(collection)
+
+
+async def interact(
+    environment: Environment,
+    input: Input,  # noqa: A002 - "input" is the canonical v2 primitive name
+    *,
+    config: Config,
+    output: ResponseSchemaInput | None = None,
+    temperature: float | None = None,
+    top_p: float | None = None,
+    max_tokens: int | None = None,
+    seed: int | None = None,
+    reasoning_effort: str | None = None,
+    reasoning_budget_tokens: int | None = None,
+    tool_choice: ToolChoice | None = None,
+    provider_options: dict[str, dict[str, Any]] | None = None,
+    timeout_s: float | None = None,
+) -> Output:
+    """Run one explicit v2 interaction over an environment and input.
+
+    The v2 interaction facade: build an :class:`Environment` once (instructions,
+    sources, tools, cache preference), then send :class:`Input` turns. Returns an
+    :class:`Output` with named facets (``text``, ``structured``, ``reasoning``,
+    ``tool_calls``, ``continuation``, ``usage``, ``metrics``, ``diagnostics``).
+    Continue by passing the prior output's ``continuation`` and any
+    ``tool_results`` in the next ``Input``.
+
+    Args:
+        environment: Reusable model-facing setup for the interaction.
+        input: The per-turn payload (user content, continuation, tool results).
+        config: Configuration specifying provider and model.
+        output: Optional Pydantic model or JSON Schema for structured output.
+        temperature: Optional sampling temperature.
+        top_p: Optional nucleus-sampling probability.
+        max_tokens: Optional hard cap on output tokens.
+        seed: Optional sampling seed where supported.
+        reasoning_effort: Optional qualitative reasoning effort.
+        reasoning_budget_tokens: Optional explicit reasoning token budget.
+        tool_choice: Optional tool-choice control.
+        provider_options: Optional raw provider-scoped generation options.
+        timeout_s: Optional wall-clock budget in seconds, retries and
+            uploads included. A call still running when it runs out is
+            cancelled.
+
+    Returns:
+        The completed :class:`Output` for the interaction.
+
+    Raises:
+        DeadlineExceededError: If *timeout_s* runs out first.
+
+    Example:
+        environment = Environment(instructions=system_prompt, tools=tool_decls)
+        result = await interact(environment, Input("Inspect the repo."), config=cfg)
+        while result.tool_calls:
+            results = [ToolResult(call_id=c.id, content=run_tool(c)) for c in result.tool_calls]
+            result = await interact(
+                environment,
+                Input(continuation=result.continuation, tool_results=results),
+                config=cfg,
+            )
+    """
+    async with Session(config) as session:
+        return await session.interact(
+            environment,
+            input,
+            output=output,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens,
+            seed=seed,
+            reasoning_effort=reasoning_effort,
+            reasoning_budget_tokens=reasoning_budget_tokens,
+            tool_choice=tool_choice,
+            provider_options=provider_options,
+            timeout_s=timeout_s,
+        )
+
+
+async def stream(
+    environment: Environment,
+    input: Input,  # noqa: A002 - "input" is the canonical v2 primitive name
+    *,
+    config: Config,
+    output: ResponseSchemaInput | None = None,
+    temperature: float | None = None,
+    top_p: float | None = None,
+    max_tokens: int | None = None,
+    seed: int | None = None,
+    reasoning_effort: str | None = None,
+    reasoning_budget_tokens: int | None = None,
+    tool_choice: ToolChoice | None = None,
+    provider_options: dict[str, dict[str, Any]] | None = None,
+    timeout_s: float | None = None,
+) -> AsyncIterator[Event]:
+    """Stream one explicit v2 interaction as :class:`Event` objects.
+
+    The streaming sibling of :func:`interact`: same environment/input/config and
+    the same completed result, observed as a timeline. Iterate the events
+    (``text_delta``, ``reasoning_delta``, ``tool_call_delta``, ``tool_call``,
+    ``usage``, ``finish``) and read the final assembled :class:`Output` from the
+    terminal ``done`` event, whose ``output`` matches what :func:`interact` would
+    return for the same interaction. Consumers never parse SSE or provider chunks.
+
+    A provider that does not support streaming raises ``ConfigurationError``. A
+    mid-stream provider failure raises from the iterator rather than emitting a
+    ``done`` event, so a failed interaction never yields a final output.
+
+    Args:
+        environment: Reusable model-facing setup for the interaction.
+        input: The per-turn payload (user content, continuation, tool results).
+        config: Configuration specifying provider and model.
+        output: Optional Pydantic model or JSON Schema for structured output.
+        temperature: Optional sampling temperature.
+        top_p: Optional nucleus-sampling probability.
+        max_tokens: Optional hard cap on output tokens.
+        seed: Optional sampling seed where supported.
+        reasoning_effort: Optional qualitative reasoning effort.
+        reasoning_budget_tokens: Optional explicit reasoning token budget.
+        tool_choice: Optional tool-choice control.
+        provider_options: Optional raw provider-scoped generation options.
+        timeout_s: Optional wall-clock budget in seconds. A stream still
+            open when it runs out is closed and ``DeadlineExceededError``
+            raises from the iterator.
+
+    Yields:
+        Each :class:`Event` in the interaction's timeline, ending in ``done``.
+
+    Example:
+        async for event in stream(environment, Input("Inspect the repo."), config=cfg):
+            if event.type == "text_delta":
+                print(event.text, end="")
+            elif event.type == "done":
+                result = event.output
+    """
+    async with Session(config) as session:
+        async for event in session.stream(
+            environment,
+            input,
+            output=output,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens,
+            seed=seed,
+            reasoning_effort=reasoning_effort,
+            reasoning_budget_tokens=reasoning_budget_tokens,
+            tool_choice=tool_choice,
+            provider_options=provider_options,
+            timeout_s=timeout_s,
+        ):
+            yield event
+
+
+class Session:
+    """Reusable Pollux runtime for multi-turn agent loops.
+
+    The one-shot helpers create and close a provider per call (unless
+    ``Config.reuse_clients`` lets them borrow a pooled one). ``Session`` owns a
+    single provider instance so clients with many sequential turns can reuse
+    transport resources while still going through the public interaction APIs.
+
+    With ``background_cleanup=True``, uploaded files are deleted by background
+    tasks after each call returns instead of before it; :meth:`aclose` waits for
+    pending deletes before closing the provider.
+
+    With ``max_concurrency``, every entry point shares one priority scheduler
+    capped at that many in-flight calls instead of each call running its own
+    ``request_concurrency`` semaphore. ``interact()``/``stream()`` default to
+    ``priority="interactive"`` and ``run_many()``/``iter_many()`` to
+    ``"batch"``; freed slots are shared by ``priority_weights`` (default 4:1),
+    so a large batch cannot starve interactive turns. :meth:`scheduler_stats`
+    reports queue depth and wait times.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        *,
+        background_cleanup: bool = False,
+        max_concurrency: int | None = None,
+        priority_weights: Mapping[Priority, float] | None = None,
+    ) -> None:
+        self.config = config
+        self._scheduler = (
+            SessionScheduler(max_concurrency, weights=priority_weights)
+            if max_concurrency is not None
+            else None
+        )
+        self._provider = _acquire_provider(config)
+        self._cleanup = BackgroundCleanup() if background_cleanup else None
+        # One retry budget spans every call the session makes.
+        self._retry_budget = RetryBudget.from_policy(config.retry)
+        self._closed = False
+
+    async def __aenter__(self) -> Session:  # noqa: PYI034
+        """Enter the async context manager."""
+        return self
+
+    async def __aexit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc: BaseException | None,
+        _tb: object,
+    ) -> None:
+        """Close provider resources when leaving the async context manager."""
+        await self.aclose()
+
+    def scheduler_stats(self) -> SchedulerStats | None:
+        """Queue depth and wait times per priority, or ``None`` without a scheduler."""
+        return self._scheduler.stats() if self._scheduler is not None else None
+
+    def _call_slot(
+        self, priority: Priority
+    ) -> Callable[[], AbstractAsyncContextManager[object]] | None:
+        if self._scheduler is None:
+            return None
+        return functools.partial(self._scheduler.slot, priority)
+
+    def _ensure_open(self) -> None:
+        if self._closed:
+            raise ConfigurationError(
+                "Pollux Session is closed",
+                hint="Create a new Session for additional interactions.",
+            )
+
+    async def interact(
+        self,
+        environment: Environment,
+        input: Input,  # noqa: A002 - "input" is the canonical v2 primitive name
+        *,
+        output: ResponseSchemaInput | None = None,
+        temperature: float | None = None,
+        top_p: float | None = None,
+        max_tokens: int | None = None,
+        seed: int | None = None,
+        reasoning_effort: str | None = None,
+        reasoning_budget_tokens: int | None = None,
+        tool_choice: ToolChoice | None = None,
+        provider_options: dict[str, dict[str, Any]] | None = None,
+        timeout_s: float | None = None,
+        priority: Priority = "interactive",
+    ) -> Output:
+        """Run one interaction using the session's provider instance."""
+        self._ensure_open()
+        requirements = _build_requirements(
+            output=output,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens,
+            seed=seed,
+            reasoning_effort=reasoning_effort,
+            reasoning_budget_tokens=reasoning_budget_tokens,
+            tool_choice=tool_choice,
+            provider_options=provider_options,
+        )
+        return await execute_interaction(
+            environment,
+            input,
+            requirements,
+            self.config,
+            self._provider,
+            cleanup=self._cleanup,
+            retry_budget=self._retry_budget,
+            timeout_s=timeout_s,
+            call_slot=self._call_slot(priority),
+        )
+
+    async def stream(
+        self,
+        environment: Environment,
+        input: Input,  # noqa: A002 - "input" is the canonical v2 primitive name
+        *,
+        output: ResponseSchemaInput | None = None,
+        temperature: float | None = None,
+        top_p: float | None = None,
+        max_tokens: int | None = None,
+        seed: int | None = None,
+        reasoning_effort: str | None = None,
+        reasoning_budget_tokens: int | None = None,
+        tool_choice: ToolChoice | None = None,
+        provider_options: dict[str, dict[str, Any]] | None = None,
+        timeout_s: float | None = None,
+        priority: Priority = "interactive",
+    ) -> AsyncIterator[Event]:
+        """Stream one interaction using the session's provider instance."""
+        self._ensure_open()
+        requirements = _build_requirements(
+            output=output,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens,
+            seed=seed,
+            reasoning_effort=reasoning_effort,
+            reasoning_budget_tokens=reasoning_budget_tokens,
+            tool_choice=tool_choice,
+            provider_options=provider_options,
+        )
+        async for event in stream_interaction(
+            environment,
+            input,
+            requirements,
+            self.config,
+            self._provider,
+            cleanup=self._cleanup,
+            timeout_s=timeout_s,
+            call_slot=self._call_slot(priority),
+        ):
+            yield event
+
+    async def run_many(
+        self,
+        prompts: str | Sequence[str | None] | None = None,
+        *,
+        sources: Sequence[Source] = (),
+        environment: Environment | None = None,
+        instructions: str | None = None,
+        output: ResponseSchemaInput | None = None,
+        temperature: float | None = None,
+        top_p: float | None = None,
+        max_tokens: int | None = None,
+        seed: int | None = None,
+        reasoning_effort: str | None = None,
+        reasoning_budget_tokens: int | None = None,
+        tool_choice: ToolChoice | None = None,
+        tools: Sequence[ToolDeclaration] | None = None,
+        provider_options: dict[str, dict[str, Any]] | None = None,
+        timeout_s: float | None = None,
+        return_exceptions: bool = False,
+        priority: Priority = "batch",
+    ) -> OutputCollection:
+        """Run source-pattern prompts using the session's provider instance."""
+        self._ensure_open()
+        resolved_environment = _source_environment(
+            sources=sources,
+            environment=environment,
+            instructions=instructions,
+            tools=tools,
+        )
+        inputs = _prompt_inputs(prompts)
+        requirements = _build_requirements(
+            output=output,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens,
+            seed=seed,
+            reasoning_effort=reasoning_effort,
+            reasoning_budget_tokens=reasoning_budget_tokens,
+            tool_choice=tool_choice,
+            provider_options=provider_options,
+        )
+        return await execute_interactions(
+            resolved_environment,
+            inputs,
+            requirements,
+            self.config,
+            self._provider,
+            cleanup=self._cleanup,
+            retry_budget=self._retry_budget,
+            timeout_s=timeout_s,
+            return_exceptions=return_exceptions,
+            call_slot=self._call_slot(priority),
+        )
+
+    async def iter_many(
+        self,
+        prompts: str | Iterable[str | None] | AsyncIterable[str | None] | None = None,
+        *,
+        sources: Sequence[Source] = (),
+        environment: Environment | None = None,
+        instructions: str | None = None,
+        output: ResponseSchemaInput | None = None,
+        temperature: float | None = None,
+        top_p: float | None = None,
+        max_tokens: int | None = None,
+        seed: int | None = None,
+        reasoning_effort: str | None = None,
+        reasoning_budget_tokens: int | None = None,
+        tool_choice: ToolChoice | None = None,
+        tools: Sequence[ToolDeclaration] | None = None,
+        provider_options: dict[str, dict[str, Any]] | None = None,
+        timeout_s: float | None = None,
+        return_exceptions: bool = False,
+        priority: Priority = "batch",
+    ) -> AsyncIterator[tuple[int, Output]]:
+        """Yield ``(prompt_index, Output)`` pairs as each prompt completes.
+
+        Non-sequence prompt sources (generators, async iterables) are pulled
+        lazily as concurrency slots free up.
+        """
+        self._ensure_open()
+        resolved_environment = _source_environment(
+            sources=sources,
+            environment=environment,
+            instructions=instructions,
+            tools=tools,
+        )
+        inputs = _lazy_prompt_inputs(prompts)
+        requirements = _build_requirements(
+            output=output,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens,
+            seed=seed,
+            reasoning_effort=reasoning_effort,
+            reasoning_budget_tokens=reasoning_budget_tokens,
+            tool_choice=tool_choice,
+            provider_options=provider_options,
+        )
+        async for item in iter_interactions(
+            resolved_environment,
+            inputs,
+            requirements,
+            self.config,
+            self._provider,
+            cleanup=self._cleanup,
+            retry_budget=self._retry_budget,
+            timeout_s=timeout_s,
+            return_exceptions=return_exceptions,
+            call_slot=self._call_slot(priority),
+        ):
+            yield item
+
+    async def check_ready(self) -> ProviderReadiness:
+        """Return provider readiness for this session's config."""
+        self._ensure_open()
+        if isinstance(self._provider, ReadinessProvider):
+            return await self._provider.check_ready(model=self.config.model)
+        return ProviderReadiness(
+            ready=True,
+            provider=self.config.provider,
+            model=self.config.model,
+            message="Provider has no explicit readiness probe.",
+            model_verified=False,
+        )
+
+    async def aclose(self) -> None:
+        """Flush pending background cleanup, then close provider resources."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._cleanup is not None:
+                await self._cleanup.flush()
+        finally:
+            await _release_provider(self._provider)
+
+
+async def check_ready(config: Config) -> ProviderReadiness:
+    """Run a fast provider readiness probe and close provider resources."""
+    provider = _acquire_provider(config)
+    try:
+        if isinstance(provider, ReadinessProvider):
+            return await provider.check_ready(model=config.model)
+        return ProviderReadiness(
+            ready=True,
+            provider=config.provider,
+            model=config.model,
+            message="Provider has no explicit readiness probe.",
+            model_verified=False,
+        )
+    finally:
+        await _release_provider(provider)
+
+
+def local_reasoning(*, enabled: bool = False) -> dict[str, dict[str, Any]]:
+    """Return local provider options for servers with ``enable_thinking`` support."""
+    return {"local": {"chat_template_kwargs": {"enable_thinking": enabled}}}
+
+
+async def defer(
+    prompts: str | Sequence[str | None] | None = None,
+    *,
+    sources: Sequence[Source] = (),
+    config: Config,
+    instructions: str | None = None,
+    output: ResponseSchemaInput | None = None,
+    temperature: float | None = None,
+    top_p: float | None = None,
+    max_tokens: int | None = None,
+    seed: int | None = None,
+    reasoning_effort: str | None = None,
+    reasoning_budget_tokens: int | None = None,
+    provider_options: dict[str, dict[str, Any]] | None = None,
+) -> DeferredHandle:
+    """Submit one or more deferred requests and return a serializable handle.
+
+    The v2 deferred frontdoor: submit a single interaction or a source-pattern
+    collection on a provider-side timeline, then :func:`inspect_deferred` and
+    :func:`collect_deferred` later. Collection returns an
+    :class:`OutputCollection`, the same shape as :func:`run_many`.
+
+    Tool calling, continuation, and persistent caching are out of scope for
+    deferred delivery and are intentionally not part of this surface.
+
+    Args:
+        prompts: One or more prompts to submit.
+        sources: Stable sources shared across the prompts.
+        config: Configuration specifying provider and model.
+        instructions: Optional system-level instruction.
+        output: Optional Pydantic model or JSON Schema for structured output.
+            Pass the same schema to :func:`collect_deferred` to rehydrate.
+        temperature: Optional sampling temperature.
+        top_p: Optional nucleus-sampling probability.
+        max_tokens: Optional hard cap on output tokens.
+        seed: Optional sampling seed where supported.
+        reasoning_effort: Optional qualitative reasoning effort.
+        reasoning_budget_tokens: Optional explicit reasoning token budget.
+        provider_options: Optional raw provider-scoped generation options.
+
+    Returns:
+        A serializable :class:`DeferredHandle` for the submitted job.
+    """
+    prompt_tuple = (
+        (prompts,) if isinstance(prompts, (str, type(None))) else tuple(prompts)
+    )
+    if not prompt_tuple:
+        raise ConfigurationError(
+            "defer() requires at least one prompt",
+            hint="Pass one or more prompts to submit for deferred collection.",
+        )
+    environment = Environment(instructions=instructions, sources=tuple(sources))
+    inputs = [Input(content=prompt) for prompt in prompt_tuple]
+    requirements = _build_requirements(
+        output=output,
+        temperature=temperature,
+        top_p=top_p,
+        max_tokens=max_tokens,
+        seed=seed,
+        reasoning_effort=reasoning_effort,
+        reasoning_budget_tokens=reasoning_budget_tokens,
+        tool_choice=None,
+        provider_options=provider_options,
+    )
+    provider = _acquire_provider(config)
+    try:
+        return await submit_deferred(
+            environment, inputs, requirements, config, provider
+        )
+    finally:
+        await _release_provider(provider)
+
+
+async def run_many(
+    prompts: str | Sequence[str | None] | None = None,
+    *,
+    sources: Sequence[Source] = (),
+    config: Config,
+    environment: Environment | None = None,
+    instructions: str | None = None,
+    output: ResponseSchemaInput | None = None,
+    temperature: float | None = None,
+    top_p: float | None = None,
+    max_tokens: int | None = None,
+    seed: int | None = None,
+    reasoning_effort: str | None = None,
+    reasoning_budget_tokens: int | None = None,
+    tool_choice: ToolChoice | None = None,
+    tools: Sequence[ToolDeclaration] | None = None,
+    provider_options: dict[str, dict[str, Any]] | None = None,
+    timeout_s: float | None = None,
+    return_exceptions: bool = False,
+) -> OutputCollection:
+    """Run multiple prompts with shared sources for source-pattern execution.
+
+    Returns an :class:`OutputCollection` whose ``outputs`` preserve input order;
+    ``.answers`` / ``.structured`` give ergonomic per-prompt lists.
+
+    Args:
+        prompts: One or more prompts to run.
+        sources: Stable sources shared across the prompts.
+        config: Configuration specifying provider and model.
+        environment: Optional prepared :class:`Environment` (e.g. from
+            :func:`prepare_environment`) carrying instructions, sources, tools,
+            and cache preference. Cannot be combined with inline
+            ``instructions``/``sources``/``tools``.
+        instructions: Optional system-level instruction.
+        output: Optional Pydantic model or JSON Schema for structured output.
+        temperature: Optional sampling temperature.
+        top_p: Optional nucleus-sampling probability.
+        max_tokens: Optional hard cap on output tokens.
+        seed: Optional sampling seed where supported.
+        reasoning_effort: Optional qualitative reasoning effort.
+        reasoning_budget_tokens: Optional explicit reasoning token budget.
+        tool_choice: Optional tool-choice control.
+        tools: Optional tool declarations.
+        provider_options: Optional raw provider-scoped generation options.
+        timeout_s: Optional wall-clock budget in seconds. Calls still
+            running when it runs out are cancelled and returned as error
+            outputs (``metrics.completion_status == "error"``).
+        return_exceptions: Report failed calls as error outputs (empty
+            text, ``Output.error`` set) instead of raising the first failure.
+
+    Returns:
+        The :class:`OutputCollection` for the source pattern.
+
+    Example:
+        config = Config(provider="anthropic", model="claude-haiku-4-5")
+        results = await run_many(
+            ["Question 1?", "Question 2?"],
+            sources=[Source.from_text("Context...")],
+            config=config,
+        )
+        for answer in results.answers:
+            print(answer)
+    """
+    async with Session(config) as session:
+        return await session.run_many(
+            prompts,
+            sources=sources,
+            environment=environment,
+            instructions=instructions,
+            output=output,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens,
+            seed=seed,
+            reasoning_effort=reasoning_effort,
+            reasoning_budget_tokens=reasoning_budget_tokens,
+            tool_choice=tool_choice,
+            tools=tools,
+            provider_options=provider_options,
+            timeout_s=timeout_s,
+            return_exceptions=return_exceptions,
+        )
+
+
+async def iter_many(
+    prompts: str | Iterable[str | None] | AsyncIterable[str | None] | None = None,
+    *,
+    sources: Sequence[Source] = (),
+    config: Config,
+    environment: Environment | None = None,
+    instructions: str | None = None,
+    output: ResponseSchemaInput | None = None,
+    temperature: float | None = None,
+    top_p: float | None = None,
+    max_tokens: int | None = None,
+    seed: int | None = None,
+    reasoning_effort: str | None = None,
+    reasoning_budget_tokens: int | None = None,
+    tool_choice: ToolChoice | None = None,
+    tools: Sequence[ToolDeclaration] | None = None,
+    provider_options: dict[str, dict[str, Any]] | None = None,
+    timeout_s: float | None = None,
+    return_exceptions: bool = False,
+) -> AsyncIterator[tuple[int, Output]]:
+    """Run multiple prompts with shared sources, yielding results as they complete.
+
+    The streaming sibling of :func:`run_many`: same arguments and the same
+    shared upload/cache preparation, but each ``(prompt_index, Output)`` pair is
+    yielded as soon as its call finishes rather than gathered into an
+    :class:`OutputCollection`. Results arrive in completion order, so writers
+    can persist them incrementally and memory stays flat for large batches.
+
+    ``prompts`` may also be a generator or async iterable. Those are pulled
+    lazily, so only about ``request_concurrency`` prompts are materialized at a
+    time however large the source is.
+
+    The first failed call raises from the iterator and cancels calls still in
+    flight. Breaking out of the loop early cancels them too.
+
+    Args:
+        prompts: One or more prompts to run, or a lazy (async) iterable of them.
+        sources: Stable sources shared across the prompts.
+        config: Configuration specifying provider and model.
+        environment: Optional prepared :class:`Environment`. Cannot be combined
+            with inline ``instructions``/``sources``/``tools``.
+        instructions: Optional system-level instruction.
+        output: Optional Pydantic model or JSON Schema for structured output.
+        temperature: Optional sampling temperature.
+        top_p: Optional nucleus-sampling probability.
+        max_tokens: Optional hard cap on output tokens.
+        seed: Optional sampling seed where supported.
+        reasoning_effort: Optional qualitative reasoning effort.
+        reasoning_budget_tokens: Optional explicit reasoning token budget.
+        tool_choice: Optional tool-choice control.
+        tools: Optional tool declarations.
+        provider_options: Optional raw provider-scoped generation options.
+        timeout_s: Optional wall-clock budget in seconds. Calls still
+            running when it runs out are cancelled and returned as error
+            outputs (``metrics.completion_status == "error"``).
+        return_exceptions: Report failed calls as error outputs (empty
+            text, ``Output.error`` set) instead of raising the first failure.
+
+    Yields:
+        ``(prompt_index, Output)`` pairs in completion order.
+
+    Example:
+        async for index, result in iter_many(prompts, sources=sources, config=cfg):
+            writer.write(index, result.to_jsonable())
+    """
+    async with Session(config) as session:
+        async for item in session.iter_many(
+            prompts,
+            sources=sources,
+            environment=environment,
+            instructions=instructions,
+            output=output,
+            temperature=temperature,
+            top_p=top_p,
+            max_tokens=max_tokens,
+            seed=seed,
+            reasoning_effort=reasoning_effort,
+            reasoning_budget_tokens=reasoning_budget_tokens,
+            tool_choice=tool_choice,
+            tools=tools,
+            provider_options=provider_options,
+            timeout_s=timeout_s,
+            return_exceptions=return_exceptions,
+        ):
+            yield item
+
+
+async def prepare_environment(
+    *,
+    sources: Sequence[Source] = (),
+    config: Config,
+    instructions: str | None = None,
+    tools: Sequence[ToolDeclaration] | None = None,
+    cache: CacheSetting = None,
+    metadata: dict[str, Any] | None = None,
+) -> Environment:
+    """Prepare a reusable :class:`Environment`, front-loading cache/upload I/O.
+
+    Build the stable model-facing setup once and reuse it across
+    :func:`interact`, :func:`run`, and :func:`run_many` calls. When ``cache`` is
+    a :class:`CachePolicy`, the persistent cache is created now (uploading
+    sources and surfacing capability errors early); later interactions over the
+    returned environment reuse it by identity.
+
+    Args:
+        sources: Stable sources to bake into the environment (and its cache).
+        config: Configuration specifying provider and model.
+        instructions: Optional system-level instruction.
+        tools: Optional tool declarations.
+        cache: Cache preference: a :class:`CachePolicy` for persistent caching,
+            ``"auto"`` for provider-managed caching, ``"none"`` to disable, or
+            ``None`` for the default.
+        metadata: Optional provider-neutral metadata for planning.
+
+    Returns:
+        The prepared :class:`Environment`.
+
+    Example:
+        environment = await prepare_environment(
+            sources=[Source.from_file("paper.pdf")],
+            instructions=system_prompt,
+            cache=CachePolicy(ttl_seconds=3600),
+            config=config,
+        )
+        results = await run_many(prompts, environment=environment, config=config)
+    """
+    environment = Environment(
+        instructions=instructions,
+        sources=tuple(sources),
+        tools=tuple(tools) if tools else (),
+        cache=cache,
+        metadata=metadata,
+    )
+    if isinstance(cache, CachePolicy):
+        provider = _acquire_provider(config)
+        try:
+            snapshot = EnvironmentSnapshot.from_environment(
+                environment, provider=config.provider
+            )
+            await resolve_persistent_cache(snapshot, config, provider)
+        finally:
+            await _release_provider(provider)
+    return environment
+
+
+async def inspect_deferred(
+    handle: DeferredHandle,
+    *,
+    config: Config | None = None,
+) -> DeferredSnapshot:
+    """Inspect the current state of a deferred job.
+
+    Pass *config* to supply credentials explicitly and, with
+    ``reuse_clients=True``, poll through a pooled provider client.
+    """
+    provider = _resolve_deferred_provider(handle, config)
+    try:
+        return await inspect_deferred_handle(handle, provider)
+    finally:
+        await _release_provider(provider)
+
+
+async def collect_deferred(
+    handle: DeferredHandle,
+    *,
+    response_schema: type[Any] | dict[str, Any] | None = None,
+    config: Config | None = None,
+) -> OutputCollection:
+    """Collect a terminal deferred job into an :class:`OutputCollection`.
+
+    Returns the same shape as :func:`run_many`: one :class:`Output` per
+    submitted request, in submission order. Each output's
+    ``diagnostics.raw["deferred"]`` carries the job id and per-item status.
+
+    Args:
+        handle: The deferred handle returned by :func:`defer`.
+        response_schema: Optional Pydantic model or JSON Schema for structured
+            output rehydration. Must match the schema used at submission time.
+        config: Optional configuration for the handle's provider, as in
+            :func:`inspect_deferred`.
+    """
+    provider = _resolve_deferred_provider(handle, config)
+    try:
+        return await collect_deferred_handle(
+            handle,
+            provider,
+            response_schema=response_schema,
+        )
+    finally:
+        await _release_provider(provider)
+
+
+async def cancel_deferred(
+    handle: DeferredHandle,
+    *,
+    config: Config | None = None,
+) -> None:
+    """Request provider-side cancellation for a deferred job.
+
+    *config* is as in :func:`inspect_deferred`.
+    """
+    provider = _resolve_deferred_provider(handle, config)
+    try:
+        await cancel_deferred_handle(handle, provider)
+    finally:
+        await _release_provider(provider)
@@ -0,0 +1,196 @@
+"""Process-wide pool of provider clients shared by one-shot helpers.
+
+Each one-shot call otherwise builds and closes its own SDK/HTTP client, paying
+client construction and a TLS handshake every time. The pool keeps one
+provider per (event loop, connection key), reference-counted across the calls
+borrowing it, and closes it once it has sat idle for ``idle_timeout_s``.
+Clients are bound to the event loop that created them, so every loop gets its
+own entries. They are closed when the loop shuts down its async generators
+(``asyncio.run`` does, right before closing the loop); entries of a loop that
+was closed or collected without that step are dropped on the next pool call.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import logging
+from typing import TYPE_CHECKING, Any
+import weakref
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Callable, Coroutine, Hashable
+
+    from pollux.providers.base import Provider
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    provider: Provider
+    refs: int = 0
+    idle_timer: asyncio.TimerHandle | None = None
+
+
+@dataclass
+class _LoopEntries:
+    """Pooled providers of one event loop.
+
+    Only a weak reference to the loop is kept; the idle timers in ``entries``
+    do reference it, so records are removed as soon as the loop ends.
+    """
+
+    loop: weakref.ReferenceType[asyncio.AbstractEventLoop]
+    entries: dict[Hashable, _Entry]
+    # Started on the loop so its shutdown_asyncgens() closes the entries.
+    watcher: AsyncGenerator[None, None] | None = None
+
+    def alive(self) -> bool:
+        loop = self.loop()
+        return loop is not None and not loop.is_closed()
+
+
+class ProviderPool:
+    """Reference-counted provider clients keyed per event loop.
+
+    :meth:`acquire` returns the pooled provider for a key, building one on a
+    miss; :meth:`release` hands it back. An entry nobody holds is closed after
+    ``idle_timeout_s``; :meth:`shutdown` closes every entry of the running loop
+    now (in-use entries close when their last holder releases them).
+    """
+
+    def __init__(
+        self,
+        close: Callable[[Provider], Coroutine[Any, Any, None]],
+        *,
+        idle_timeout_s: float = 300.0,
+    ) -> None:
+        self._close = close
+        self.idle_timeout_s = idle_timeout_s
+        # Keyed by id(loop): a strong key would pin loops that already ended.
+        self._loops: dict[int, _LoopEntries] = {}
+        # Providers retired by shutdown() while still borrowed.
+        self._retired: dict[int, _Entry] = {}
+        self._closing: set[asyncio.Task[Any]] = set()
+
+    def acquire(self, key: Hashable, build: Callable[[], Provider]) -> Provider:
+        """Borrow the provider for *key* on the running loop, building it once."""
+        entries = self._entries_for(asyncio.get_running_loop(), create=True)
+        entry = entries.get(key)
+        if entry is None:
+            entry = entries[key] = _Entry(build())
+            logger.debug("Provider pool built %s", type(entry.provider).__name__)
+        if entry.idle_timer is not None:
+            entry.idle_timer.cancel()
+            entry.idle_timer = None
+        entry.refs += 1
+        return entry.provider
+
+    async def release(self, provider: Provider) -> bool:
+        """Return a borrowed *provider*; ``False`` when the pool does not own it."""
+        retired = self._retired.get(id(provider))
+        if retired is not None and retired.provider is provider:
+            retired.refs -= 1
+            if retired.refs <= 0:
+                del self._retired[id(provider)]
+                await self._close(provider)
+            return True
+        loop = asyncio.get_running_loop()
+        for key, entry in self._entries_for(loop).items():
+            if entry.provider is provider:
+                entry.refs -= 1
+                if entry.refs <= 0:
+                    entry.refs = 0
+                    entry.idle_timer = loop.call_later(
+                        self.idle_timeout_s, self._evict_idle, id(loop), key
+                    )
+                return True
+        return False
+
+    def _entries_for(
+        self, loop: asyncio.AbstractEventLoop, *, create: bool = False
+    ) -> dict[Hashable, _Entry]:
+        """Return *loop*'s entries, dropping records of loops that have ended."""
+        for loop_id, ended in list(self._loops.items()):
+            if not ended.alive():
+                # Their clients cannot be closed off their own loop.
+                del self._loops[loop_id]
+        record = self._loops.get(id(loop))
+        if record is not None:
+            return record.entries
+        if not create:
+            return {}
+        record = self._loops[id(loop)] = _LoopEntries(weakref.ref(loop), {})
+        record.watcher = self._watch(record)
+        task = loop.create_task(_start(record.watcher))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+        return record.entries
+
+    async def _watch(self, record: _LoopEntries) -> AsyncGenerator[None, None]:
+        """Close *record*'s providers when its loop shuts down async generators."""
+        try:
+            yield
+        finally:
+            loop = record.loop()
+            if loop is not None and self._loops.get(id(loop)) is record:
+                del self._loops[id(loop)]
+            for entry in record.entries.values():
+                if entry.idle_timer is not None:
+                    entry.idle_timer.cancel()
+                if entry.refs > 0:
+                    self._retired[id(entry.provider)] = entry
+                else:
+                    await self._close(entry.provider)
+            record.entries.clear()
+
+    def _evict_idle(self, loop_id: int, key: Hashable) -> None:
+        record = self._loops.get(loop_id)
+        entry = record.entries.get(key) if record is not None else None
+        if record is None or entry is None or entry.refs > 0:
+            return
+        del record.entries[key]
+        logger.debug("Provider pool closing idle %s", type(entry.provider).__name__)
+        task = asyncio.get_running_loop().create_task(self._close(entry.provider))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def size(self) -> int:
+        """Return the number of pooled providers on the running loop."""
+        return len(self._entries_for(asyncio.get_running_loop()))
+
+    def loop_count(self) -> int:
+        """Return the number of event loops with a pool record."""
+        return len(self._loops)
+
+    async def shutdown(self) -> None:
+        """Close pooled providers on the running loop and forget other loops'.
+
+        Providers still borrowed are closed when their last holder releases
+        them. Entries from other loops cannot be closed from here and are
+        dropped.
+        """
+        loop = asyncio.get_running_loop()
+        record = self._loops.pop(id(loop), None)
+        self._loops.clear()
+        entries = record.entries if record is not None else {}
+        idle: list[Provider] = []
+        for entry in list(entries.values()):
+            if entry.idle_timer is not None:
+                entry.idle_timer.cancel()
+            if entry.refs > 0:
+                self._retired[id(entry.provider)] = entry
+            else:
+                idle.append(entry.provider)
+        entries.clear()
+        for provider in idle:
+            await self._close(provider)
+        closing = [t for t in self._closing if t.get_loop() is loop]
+        if closing:
+            await asyncio.gather(*closing, return_exceptions=True)
+
+
+async def _start(watcher: AsyncGenerator[None, None]) -> None:
+    """Advance *watcher* to its first ``yield`` so the loop tracks it."""
+    await watcher.__anext__()
@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from dataclasses import dataclass, field
 import hashlib
 import logging
 from pathlib import Path
+import sqlite3
+import threading
 import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Protocol
 
 from pollux._singleflight import singleflight_cached
 from pollux.errors import ConfigurationError, InternalError
-from pollux.providers.base import CachingProvider, FileUploadingProvider
+from pollux.providers.base import (
+    CacheRefreshingProvider,
+    CachingProvider,
+    FileUploadingProvider,
+)
 from pollux.providers.models import is_file_part
 from pollux.retry import RetryPolicy, retry_async, should_retry_side_effect
 
@@ -40,31 +47,201 @@ class CacheHandle:
     expires_at: float
 
 
+class CacheStore(Protocol):
+    """Durable backend behind :class:`CacheRegistry`.
+
+    Stores ``key -> (cache_name, expires_at)`` outside the process so other
+    processes (or a restarted one) can reuse provider caches that are still
+    alive server-side. Methods may block on I/O; the registry calls them from
+    a worker thread, never on the event loop.
+    """
+
+    def load(self, key: str) -> tuple[str, float] | None:
+        """Return the stored entry for *key*, or ``None``."""
+        ...
+
+    def save(self, key: str, value: tuple[str, float]) -> None:
+        """Persist the entry for *key*, replacing any previous value."""
+        ...
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+        ...
+
+
+class SQLiteCacheStore:
+    """:class:`CacheStore` backed by one SQLite file shared across processes.
+
+    SQLite's file locking serializes writers, so every worker on a host can
+    point at the same path. Expired rows are dropped when read. Cross-process
+    creation is not single-flight: two processes that miss at the same moment
+    may both create a cache, and the later write wins.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, name TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def load(self, key: str) -> tuple[str, float] | None:
+        """Return the stored entry for *key* unless it has expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT name, expires_at FROM cache_entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            name, expires_at = row
+            if time.time() >= expires_at:
+                self._conn.execute(
+                    "DELETE FROM cache_entries WHERE key = ? AND expires_at = ?",
+                    (key, expires_at),
+                )
+                return None
+            return str(name), float(expires_at)
+
+    def save(self, key: str, value: tuple[str, float]) -> None:
+        """Insert or replace the entry for *key*."""
+        name, expires_at = value
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries (key, name, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, name, expires_at),
+            )
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+@dataclass(frozen=True)
+class CacheRegistryStats:
+    """Point-in-time counters for a :class:`CacheRegistry`.
+
+    ``hits`` counts lookups served by a live handle (including ones loaded from
+    a durable store); ``misses`` counts caches that had to be created;
+    ``refreshes`` counts TTL extensions of hot caches.
+    """
+
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    refreshes: int = 0
+
+
 @dataclass
 class CacheRegistry:
-    """Registry tracking cache entries with expiration."""
+    """Registry tracking cache entries with expiration.
+
+    Entries live in memory, bounded to ``max_entries`` with least-recently-used
+    eviction; expired entries are swept at most every ``sweep_interval_s``.
+    Evicting an entry only forgets the handle—the provider cache still expires
+    on its own TTL. When a :class:`CacheStore` is passed, misses fall through
+    to it and new entries are written through, so handles outlive the process.
+    """
 
-    _entries: dict[str, tuple[str, float]] = field(default_factory=dict)
+    max_entries: int = 1024
+    sweep_interval_s: float = 60.0
+    _entries: OrderedDict[str, tuple[str, float]] = field(default_factory=OrderedDict)
     _inflight: dict[str, asyncio.Future[tuple[str, float]]] = field(
         default_factory=dict
     )
+    _refresh_inflight: dict[str, asyncio.Future[tuple[str, float]]] = field(
+        default_factory=dict
+    )
     _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    _last_sweep: float = field(default_factory=time.monotonic)
+    _hits: int = 0
+    _misses: int = 0
+    _evictions: int = 0
+    _expirations: int = 0
+    _refreshes: int = 0
 
     def get(self, key: str) -> tuple[str, float] | None:
         """Get cache entry if exists and not expired."""
+        self._maybe_sweep()
         entry = self._entries.get(key)
         if entry is None:
             return None
         _, expires_at = entry
         if time.time() >= expires_at:
             del self._entries[key]
+            self._expirations += 1
             logger.debug("Cache expired key=%s…", key[:8])
             return None
+        self._entries.move_to_end(key)
+        self._hits += 1
         return entry
 
+    async def load(
+        self, key: str, store: CacheStore | None = None
+    ) -> tuple[str, float] | None:
+        """Like :meth:`get`, falling through to *store* on a miss.
+
+        The store is read in a worker thread so a busy database never blocks
+        the event loop.
+        """
+        entry = self.get(key)
+        if entry is not None or store is None:
+            return entry
+        loaded = await asyncio.to_thread(store.load, key)
+        if loaded is None:
+            return None
+        self._insert(key, loaded)
+        return self.get(key)
+
     def set(self, key: str, value: tuple[str, float]) -> None:
-        """Store cache entry with expiration time."""
+        """Store cache entry with expiration time (a newly created cache)."""
+        self._misses += 1
+        self._insert(key, value)
+
+    def extend(self, key: str, value: tuple[str, float]) -> None:
+        """Record a refreshed expiry for an existing cache."""
+        self._refreshes += 1
+        self._insert(key, value)
+
+    def stats(self) -> CacheRegistryStats:
+        """Return hit/miss/eviction counters and the current size."""
+        return CacheRegistryStats(
+            size=len(self._entries),
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            refreshes=self._refreshes,
+        )
+
+    def _insert(self, key: str, value: tuple[str, float]) -> None:
         self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._evictions += 1
+            logger.debug("Cache evicted key=%s…", evicted[:8])
+
+    def _maybe_sweep(self) -> None:
+        now = time.monotonic()
+        if now - self._last_sweep < self.sweep_interval_s:
+            return
+        self._last_sweep = now
+        wall = time.time()
+        expired = [k for k, (_, exp) in self._entries.items() if wall >= exp]
+        for key in expired:
+            del self._entries[key]
+        self._expirations += len(expired)
 
 
 def compute_cache_key(
@@ -118,17 +295,23 @@ async def get_or_create_cache(
     tools: list[dict[str, Any]] | list[Any] | None = None,
     ttl_seconds: int,
     retry_policy: RetryPolicy | None = None,
+    store: CacheStore | None = None,
 ) -> tuple[str, float] | None:
     """Get existing cache or create new one with single-flight protection.
 
     File placeholders in *raw_parts* are resolved inside the single-flight
     work function so concurrent callers share both uploads and cache creation.
+    With a *store*, entries are also looked up in and written to it.
     """
     if not provider.capabilities.persistent_cache or not isinstance(
         provider, CachingProvider
     ):
         return None
 
+    cached = await registry.load(key, store)
+    if cached is not None:
+        return cached
+
     async def _work() -> tuple[str, float]:
         logger.debug("Creating cache key=%s…", key[:8])
         policy = retry_policy or RetryPolicy(max_attempts=1)
@@ -141,20 +324,21 @@ async def get_or_create_cache(
                 tools=tools,
                 ttl_seconds=ttl_seconds,
             )
-            return name, time.time() + max(0, ttl_seconds)
-
-        name = await retry_async(
-            lambda: provider.create_cache(
-                model=model,
-                parts=parts,
-                system_instruction=system_instruction,
-                tools=tools,
-                ttl_seconds=ttl_seconds,
-            ),
-            policy=policy,
-            should_retry=should_retry_side_effect,
-        )
-        return name, time.time() + max(0, ttl_seconds)
+        else:
+            name = await retry_async(
+                lambda: provider.create_cache(
+                    model=model,
+                    parts=parts,
+                    system_instruction=system_instruction,
+                    tools=tools,
+                    ttl_seconds=ttl_seconds,
+                ),
+                policy=policy,
+                should_retry=should_retry_side_effect,
+            )
+        entry = name, time.time() + max(0, ttl_seconds)
+        await _persist(store, key, entry)
+        return entry
 
     return await singleflight_cached(
         key,
@@ -166,10 +350,88 @@ async def get_or_create_cache(
     )
 
 
+async def refresh_cache_if_due(
+    provider: Provider,
+    registry: CacheRegistry,
+    *,
+    key: str,
+    entry: tuple[str, float],
+    ttl_seconds: int,
+    refresh_before_s: int,
+    store: CacheStore | None = None,
+) -> tuple[str, float]:
+    """Extend a cache's TTL when it is used within *refresh_before_s* of expiry.
+
+    Single-flighted per key like creation. Best-effort: when the provider
+    cannot refresh, or the refresh fails, the existing entry is returned and
+    the cache expires on its original schedule.
+    """
+    name, expires_at = entry
+    if expires_at - time.time() > refresh_before_s or not isinstance(
+        provider, CacheRefreshingProvider
+    ):
+        return entry
+
+    def _fresh(k: str) -> tuple[str, float] | None:
+        current = registry._entries.get(k)
+        if current is not None and current[1] - time.time() > refresh_before_s:
+            return current
+        return None
+
+    async def _work() -> tuple[str, float]:
+        started = time.time()
+        await provider.refresh_cache(name, ttl_seconds=ttl_seconds)
+        logger.debug("Refreshed cache key=%s…", key[:8])
+        refreshed = name, started + ttl_seconds
+        await _persist(store, key, refreshed)
+        return refreshed
+
+    try:
+        return await singleflight_cached(
+            key,
+            lock=registry._lock,
+            inflight=registry._refresh_inflight,
+            cache_get=_fresh,
+            cache_set=registry.extend,
+            work=_work,
+        )
+    except Exception as exc:
+        logger.debug("Cache refresh failed key=%s…: %s", key[:8], exc)
+        return entry
+
+
+async def _persist(
+    store: CacheStore | None, key: str, value: tuple[str, float]
+) -> None:
+    """Write *value* through to *store* from a worker thread."""
+    if store is not None:
+        await asyncio.to_thread(store.save, key, value)
+
+
 # Module-level registry shared across create_cache calls.
 _registry = CacheRegistry()
 
 
+def registry_stats() -> CacheRegistryStats:
+    """Return counters for the process-wide persistent-cache registry."""
+    return _registry.stats()
+
+
+# Open durable stores, one per resolved path, shared by every Config naming it.
+_stores: dict[Path, CacheStore] = {}
+
+
+def _cache_store(config: Config) -> CacheStore | None:
+    """Return the durable store selected by ``config.cache_registry_path``."""
+    if config.cache_registry_path is None:
+        return None
+    path = Path(config.cache_registry_path).expanduser().resolve()
+    store = _stores.get(path)
+    if store is None:
+        store = _stores[path] = SQLiteCacheStore(path)
+    return store
+
+
 async def _resolve_file_parts(
     parts: list[Any],
     provider: CachingProvider,
@@ -237,10 +499,13 @@ async def create_cache_impl(
     system_instruction: str | None = None,
     tools: list[dict[str, Any]] | list[Any] | None = None,
     ttl_seconds: int = 3600,
+    refresh_before_s: int | None = None,
 ) -> CacheHandle:
     """Core implementation of ``create_cache()``.
 
     Receives an already-initialized provider; the caller manages its lifecycle.
+    With *refresh_before_s*, a reused cache close to expiry has its TTL
+    extended by *ttl_seconds*.
 
     All input validation is intentionally front-loaded before any I/O
     (uploads, API calls).  If the parameter surface grows beyond the
@@ -256,6 +521,14 @@ async def create_cache_impl(
             hint="Pass a positive integer for the cache TTL.",
         )
 
+    if refresh_before_s is not None and (
+        not isinstance(refresh_before_s, int) or not 1 <= refresh_before_s < ttl_seconds
+    ):
+        raise ConfigurationError(
+            f"refresh_before_s must be an integer in [1, ttl_seconds), got {refresh_before_s!r}",
+            hint="Refresh a cache some seconds before it expires, e.g. ttl_seconds // 4.",
+        )
+
     if system_instruction is not None and not isinstance(system_instruction, str):
         raise ConfigurationError(
             f"system_instruction must be a string, got {type(system_instruction).__name__}",
@@ -314,37 +587,41 @@ async def create_cache_impl(
         tools=tools,
     )
 
-    cached = _registry.get(key)
-    if cached is not None:
-        cache_name, expires_at = cached
-        return CacheHandle(
-            name=cache_name,
+    store = _cache_store(config)
+    cached = await _registry.load(key, store)
+    if cached is None:
+        raw_parts = build_shared_parts(src_tuple, provider=config.provider)
+        cached = await get_or_create_cache(
+            provider,
+            _registry,
+            key=key,
             model=model,
-            provider=config.provider,
-            expires_at=expires_at,
+            raw_parts=raw_parts,
+            system_instruction=system_instruction,
+            tools=tools,
+            ttl_seconds=ttl_seconds,
+            retry_policy=config.retry,
+            store=store,
         )
 
-    raw_parts = build_shared_parts(src_tuple, provider=config.provider)
-
-    result = await get_or_create_cache(
-        provider,
-        _registry,
-        key=key,
-        model=model,
-        raw_parts=raw_parts,
-        system_instruction=system_instruction,
-        tools=tools,
-        ttl_seconds=ttl_seconds,
-        retry_policy=config.retry,
-    )
+        if cached is None:
+            raise InternalError(
+                "Cache creation returned None unexpectedly",
+                hint="This is a Pollux internal error. Please report it.",
+            )
 
-    if result is None:
-        raise InternalError(
-            "Cache creation returned None unexpectedly",
-            hint="This is a Pollux internal error. Please report it.",
+    if refresh_before_s is not None:
+        cached = await refresh_cache_if_due(
+            provider,
+            _registry,
+            key=key,
+            entry=cached,
+            ttl_seconds=ttl_seconds,
+            refresh_before_s=refresh_before_s,
+            store=store,
         )
 
-    cache_name, expires_at = result
+    cache_name, expires_at = cached
 
     return CacheHandle(
         name=cache_name,
@@ -0,0 +1,306 @@
+"""Adaptive (AIMD) concurrency control for fan-out execution.
+
+A fixed ``request_concurrency`` has to be hand-tuned per provider, model and
+account tier. With :class:`AdaptiveConcurrency` on ``Config`` the limit starts
+at ``request_concurrency`` and moves on its own: it grows by one slot after a
+full window of saturated successes and shrinks multiplicatively on a
+``RateLimitError`` or when smoothed latency stays well above the recent
+median latency. Limiters are shared process-wide, like rate limiters, so what
+one batch learns carries over to the next.
+
+``Config.global_concurrency`` is the fixed counterpart: a hard cap on calls in
+flight per provider, key and model across the whole process, so many
+concurrent ``run()`` calls or Sessions cannot multiply the intended load.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+import logging
+import statistics
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from pollux.errors import RateLimitError
+from pollux.ratelimit import quota_scope
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from pollux.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Weight of each new sample in the smoothed latency.
+_LATENCY_SMOOTHING = 0.2
+# Successful attempts whose latencies form the baseline median; old samples
+# fall out, so the baseline follows a provider whose normal latency drifts.
+_BASELINE_WINDOW = 100
+# Samples needed before latency is judged against the baseline at all.
+_BASELINE_MIN_SAMPLES = 10
+# Consecutive over-tolerance samples that count as a sustained rise.
+_SUSTAINED_SAMPLES = 5
+
+
+@dataclass(frozen=True)
+class AdaptiveConcurrency:
+    """AIMD policy for the number of concurrent generate calls.
+
+    ``Config.request_concurrency`` is the starting limit, clamped into
+    ``[min_limit, max_limit]``.
+    """
+
+    min_limit: int = 1
+    max_limit: int = 64
+    #: Factor applied to the limit on a rate limit or latency spike.
+    backoff_factor: float = 0.5
+    #: Shrink when smoothed latency stays above this multiple of the median
+    #: of recent latencies; *None* reacts to rate limits only.
+    latency_tolerance: float | None = 2.0
+
+    def __post_init__(self) -> None:
+        """Validate bounds so the limit always admits at least one call."""
+        if self.min_limit < 1:
+            raise ValueError("AdaptiveConcurrency.min_limit must be >= 1")
+        if self.max_limit < self.min_limit:
+            raise ValueError("AdaptiveConcurrency.max_limit must be >= min_limit")
+        if not 0 < self.backoff_factor < 1:
+            raise ValueError("AdaptiveConcurrency.backoff_factor must be in (0, 1)")
+        if self.latency_tolerance is not None and self.latency_tolerance <= 1:
+            raise ValueError(
+                "AdaptiveConcurrency.latency_tolerance must be > 1 or None"
+            )
+
+
+class _Waiter:
+    """A call queued for a slot, resolved on its own event loop."""
+
+    __slots__ = ("admitted", "future")
+
+    def __init__(self, future: asyncio.Future[None]) -> None:
+        self.future = future
+        # Set under the limiter lock when a slot is reserved for this waiter,
+        # possibly before its loop has run the callback that resolves it.
+        self.admitted = False
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class ConcurrencyLimiter:
+    """A resizable FIFO semaphore usable from any event loop and thread.
+
+    Use :meth:`slot` around each provider attempt. Unlike
+    :class:`asyncio.Semaphore` it is not bound to the loop that first waits on
+    it, so one instance can be shared process-wide: a released slot wakes the
+    next waiter on that waiter's own loop, even when it runs in another thread.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self._limit = limit
+        self._inflight = 0
+        self._waiters: deque[_Waiter] = deque()
+        self._lock = threading.Lock()
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently holding a slot."""
+        return self._inflight
+
+    def resize(self, limit: int) -> None:
+        """Change the limit; calls already in flight are never interrupted."""
+        with self._lock:
+            self._limit = limit
+            self._wake()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one slot for the duration of a provider attempt."""
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self) -> None:
+        with self._lock:
+            if self._inflight < self._limit and not self._waiters:
+                self._inflight += 1
+                return
+            waiter = _Waiter(asyncio.get_running_loop().create_future())
+            self._waiters.append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter.admitted:
+                    # Admitted just as we were cancelled: hand the slot on.
+                    self._inflight -= 1
+                    self._wake()
+                else:
+                    self._waiters.remove(waiter)
+            raise
+
+    def _release(self) -> None:
+        with self._lock:
+            self._inflight -= 1
+            self._wake()
+
+    def _wake(self) -> None:
+        # Caller holds ``self._lock``.
+        while self._waiters and self._inflight < self._limit:
+            waiter = self._waiters.popleft()
+            waiter.admitted = True
+            self._inflight += 1
+            try:
+                waiter.future.get_loop().call_soon_threadsafe(_resolve, waiter.future)
+            except RuntimeError:
+                # The waiter's loop has closed; nobody is left to use the slot.
+                waiter.admitted = False
+                self._inflight -= 1
+
+
+class AdaptiveLimiter(ConcurrencyLimiter):
+    """A semaphore whose size follows additive-increase/multiplicative-decrease.
+
+    Use :meth:`slot` around each provider attempt; the attempt's outcome and
+    latency drive the limit. Waiters are admitted in FIFO order.
+    """
+
+    def __init__(self, policy: AdaptiveConcurrency, initial_limit: int) -> None:
+        super().__init__(max(policy.min_limit, min(initial_limit, policy.max_limit)))
+        self.policy = policy
+        # Bumped on every decrease; attempts admitted under an older epoch do
+        # not shrink the limit again, so one burst of 429s halves it once.
+        self._epoch = 0
+        self._successes = 0
+        self._baseline: deque[float] = deque(maxlen=_BASELINE_WINDOW)
+        self._smoothed_latency: float | None = None
+        self._slow_samples = 0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one slot for the duration of a provider attempt."""
+        await self._acquire()
+        with self._lock:
+            epoch = self._epoch
+            saturated = self._inflight >= self._limit
+        started = time.monotonic()
+        try:
+            yield
+        except RateLimitError:
+            with self._lock:
+                self._decrease(epoch)
+            raise
+        else:
+            latency = time.monotonic() - started
+            with self._lock:
+                self._record_success(latency, epoch, saturated=saturated)
+        finally:
+            self._release()
+
+    def _record_success(self, latency: float, epoch: int, *, saturated: bool) -> None:
+        # Caller holds ``self._lock``, as for ``_decrease``.
+        if self._smoothed_latency is None:
+            self._smoothed_latency = latency
+        else:
+            self._smoothed_latency += _LATENCY_SMOOTHING * (
+                latency - self._smoothed_latency
+            )
+        tolerance = self.policy.latency_tolerance
+        if tolerance is not None and len(self._baseline) >= _BASELINE_MIN_SAMPLES:
+            baseline = statistics.median(self._baseline)
+            if self._smoothed_latency > tolerance * baseline:
+                self._slow_samples += 1
+            else:
+                self._slow_samples = 0
+        self._baseline.append(latency)
+        if self._slow_samples >= _SUSTAINED_SAMPLES:
+            self._decrease(epoch)
+            return
+        # Only grow when the limit was actually the bottleneck.
+        if not saturated:
+            return
+        self._successes += 1
+        if self._successes >= self._limit and self._limit < self.policy.max_limit:
+            self._limit += 1
+            self._successes = 0
+            self._wake()
+
+    def _decrease(self, epoch: int) -> None:
+        if epoch != self._epoch:
+            return
+        self._epoch += 1
+        self._successes = 0
+        self._limit = max(
+            self.policy.min_limit, int(self._limit * self.policy.backoff_factor)
+        )
+        # Let the next latency samples re-establish the trend at the new limit.
+        self._smoothed_latency = None
+        self._slow_samples = 0
+
+
+_limiters: dict[tuple[str, str, str | None, AdaptiveConcurrency], AdaptiveLimiter] = {}
+
+
+def adaptive_limiter_for(config: Config) -> AdaptiveLimiter | None:
+    """Return the process-wide adaptive limiter for *config*, or ``None``.
+
+    Configs that share provider, API key, model and policy share one limiter;
+    read its :attr:`~AdaptiveLimiter.limit` to see the learned concurrency.
+    """
+    policy = config.adaptive_concurrency
+    if policy is None:
+        return None
+    key = (*quota_scope(config), policy)
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limiter = _limiters[key] = AdaptiveLimiter(policy, config.request_concurrency)
+    return limiter
+
+
+_global_limiters: dict[tuple[str, str, str | None], ConcurrencyLimiter] = {}
+# ``global_concurrency`` values already seen per scope, to warn once per conflict.
+_global_limits_seen: dict[tuple[str, str, str | None], set[int]] = {}
+
+
+def global_limiter_for(config: Config) -> ConcurrencyLimiter | None:
+    """Return the process-wide in-flight cap for *config*, or ``None`` when unset.
+
+    Every config with the same provider, API key and model shares one limiter,
+    whatever ``Session`` or one-shot call it is used from. When they disagree
+    on ``global_concurrency`` the smallest value seen applies, so the cap never
+    flips back and forth between callers.
+    """
+    limit = config.global_concurrency
+    if limit is None:
+        return None
+    key = quota_scope(config)
+    seen = _global_limits_seen.setdefault(key, set())
+    limiter = _global_limiters.get(key)
+    if limiter is None:
+        limiter = _global_limiters[key] = ConcurrencyLimiter(limit)
+    elif limit not in seen:
+        logger.warning(
+            "Conflicting global_concurrency for %s/%s (%d vs %d); using %d",
+            config.provider,
+            config.model,
+            limit,
+            limiter.limit,
+            min(limit, limiter.limit),
+        )
+        if limit < limiter.limit:
+            limiter.resize(limit)
+    seen.add(limit)
+    return limiter
@@ -8,8 +8,14 @@ from typing import TYPE_CHECKING, Literal, get_args
 
 import dotenv
 
+from pollux.concurrency import AdaptiveConcurrency  # noqa: TC001 - used at runtime
 from pollux.errors import ConfigurationError
-from pollux.retry import RetryPolicy
+from pollux.hedge import HedgePolicy  # noqa: TC001 - used at runtime
+from pollux.ratelimit import RateLimit  # noqa: TC001 - used at runtime in dataclass
+from pollux.response_cache import ResponseCache
+from pollux.retry import CircuitBreakerPolicy, RetryPolicy
+from pollux.tokens import TokenPreflight  # noqa: TC001 - used at runtime
+from pollux.transport import HttpTransport  # noqa: TC001 - used at runtime
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -78,10 +84,50 @@ class Config:
     base_url: str | None = None
     use_mock: bool = False
     request_concurrency: int = 6
-    #: HTTP request timeout in seconds for providers that own their transport.
-    #: Currently applied by the local OpenAI-compatible provider.
+    #: Let the concurrent-call limit adapt (AIMD) to rate limits and latency,
+    #: starting from ``request_concurrency``. Fixed limit when *None*.
+    adaptive_concurrency: AdaptiveConcurrency | None = None
+    #: Cap on generate calls in flight across the whole process for this
+    #: provider, key and model, shared by every Session and one-shot call.
+    #: Unbounded when *None*.
+    global_concurrency: int | None = None
+    #: Max concurrent file uploads while preparing an environment's sources.
+    upload_concurrency: int = 4
+    #: HTTP request timeout in seconds for providers that own their transport
+    #: (the local OpenAI-compatible provider and OpenRouter).
     request_timeout_s: float = 300.0
+    #: Connection-pool, HTTP/2 and timeout tuning for those same providers,
+    #: or a shared httpx transport. Provider defaults when *None*.
+    http_transport: HttpTransport | None = None
     retry: RetryPolicy = field(default_factory=RetryPolicy)
+    #: Fail fast once a provider/model keeps failing; shared process-wide by
+    #: configs with the same provider, key, model and policy. Off when *None*.
+    circuit_breaker: CircuitBreakerPolicy | None = None
+    #: Race a duplicate request against slow idempotent calls (no tools, tool
+    #: results, or uploaded files). Off when *None*.
+    hedge: HedgePolicy | None = None
+    #: Per-minute request/token quotas that pace generate calls; shared
+    #: process-wide by configs with the same provider, key, model and limits.
+    rate_limit: RateLimit | None = None
+    #: Estimate each call's input tokens before uploading or sending, and
+    #: reject estimates over the model's context window. Off when *None*.
+    preflight: TokenPreflight | None = None
+    #: Reuse uploaded files across executions in this process, keyed by
+    #: content hash. Reused files are kept until provider expiry instead of
+    #: being deleted after each call.
+    reuse_uploads: bool = False
+    #: Borrow provider clients from a process-wide pool instead of building
+    #: and closing one per one-shot call, keeping connections warm. Pooled
+    #: clients close after sitting idle, or on ``pollux.shutdown()``.
+    reuse_clients: bool = False
+    #: SQLite file that persists persistent-cache handles across processes.
+    #: Workers on one host pointing at the same path reuse live provider caches
+    #: instead of recreating them. In-memory only when *None*.
+    cache_registry_path: str | os.PathLike[str] | None = None
+    #: Replay stored responses for identical requests (same environment,
+    #: input, requirements, provider and model) instead of calling the
+    #: provider. Off when *None*.
+    response_cache: ResponseCache | None = None
     #: Optional capability declarations that override the provider's static
     #: capabilities for this config (v2 interaction path). A declared capability
     #: wins over the provider's static value; undeclared capabilities fall back to
@@ -111,6 +157,23 @@ class Config:
                 f"request_concurrency must be ≥ 1, got {self.request_concurrency}",
                 hint="This controls how many API calls run in parallel.",
             )
+        if self.global_concurrency is not None and (
+            not isinstance(self.global_concurrency, int) or self.global_concurrency < 1
+        ):
+            raise ConfigurationError(
+                f"global_concurrency must be an integer ≥ 1, got {self.global_concurrency!r}",
+                hint="This caps in-flight API calls across the process; None disables it.",
+            )
+        if not isinstance(self.upload_concurrency, int):
+            raise ConfigurationError(
+                f"upload_concurrency must be an integer, got {type(self.upload_concurrency).__name__}",
+                hint="Pass a whole number ≥ 1 for upload_concurrency.",
+            )
+        if self.upload_concurrency < 1:
+            raise ConfigurationError(
+                f"upload_concurrency must be ≥ 1, got {self.upload_concurrency}",
+                hint="This controls how many file uploads run in parallel.",
+            )
         if not isinstance(self.request_timeout_s, int | float):
             raise ConfigurationError(
                 f"request_timeout_s must be numeric, got {type(self.request_timeout_s).__name__}",
@@ -122,6 +185,14 @@ class Config:
                 hint="Pass a positive timeout in seconds.",
             )
 
+        if self.response_cache is not None and not isinstance(
+            self.response_cache, ResponseCache
+        ):
+            raise ConfigurationError(
+                f"response_cache must implement get() and set(), got {type(self.response_cache).__name__}",
+                hint="Pass MemoryResponseCache(), SQLiteResponseCache(path), or DirectoryResponseCache(path).",
+            )
+
         if self.provider == "local":
             # Local: resolve base_url for real calls, skip API-key resolution entirely.
             if self.base_url is None and not self.use_mock:
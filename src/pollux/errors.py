@@ -125,6 +125,57 @@ class CacheError(APIError):
     """Cache operation failed."""
 
 
+class DeadlineExceededError(APIError):
+    """A call's ``timeout_s`` budget ran out before it completed.
+
+    Batch entry points report it as an error ``Output`` instead of raising.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        timeout_s: float,
+        hint: str | None = None,
+        call_idx: int | None = None,
+    ) -> None:
+        super().__init__(
+            message,
+            hint=hint,
+            retryable=False,
+            phase="generate",
+            call_idx=call_idx,
+            error_category="deadline_exceeded",
+        )
+        self.timeout_s = timeout_s
+
+
+class CircuitOpenError(APIError):
+    """Call rejected without reaching the provider because its circuit is open.
+
+    Raised while a provider/model has failed repeatedly; never retried.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        probe_after_s: float,
+        hint: str | None = None,
+        provider: str | None = None,
+        phase: str | None = None,
+    ) -> None:
+        super().__init__(
+            message,
+            hint=hint,
+            retryable=False,
+            provider=provider,
+            phase=phase,
+            error_category="circuit_open",
+        )
+        self.probe_after_s = probe_after_s
+
+
 class RateLimitError(APIError):
     """Rate limit exceeded (HTTP 429)."""
 
@@ -0,0 +1,151 @@
+"""Hedged requests: race a duplicate against a slow provider call.
+
+Tail latency on user-facing calls is dominated by the occasional slow
+response. With a :class:`HedgePolicy` on ``Config``, an eligible call still
+running ``delay_s`` (or the observed latency quantile) after it cleared the
+concurrency and rate limits fires a duplicate; the first success wins and the
+rest are cancelled. Latency is sampled around the provider call alone, so
+queueing neither inflates the delay nor triggers a hedge. Core only hedges
+idempotent calls: no tools, tool results, or uploaded files.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+import math
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pollux.ratelimit import quota_scope
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from pollux.config import Config
+
+T = TypeVar("T")
+
+# Recent successful latencies kept per provider/model for the quantile delay.
+_LATENCY_SAMPLES = 256
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """When to fire duplicate requests for a slow call."""
+
+    #: Fixed hedge delay; *None* uses the observed ``quantile`` latency.
+    delay_s: float | None = None
+    #: Latency quantile used as the delay when ``delay_s`` is *None*.
+    quantile: float = 0.95
+    #: Samples required before the observed quantile is trusted; calls are
+    #: not hedged until then.
+    min_samples: int = 20
+    #: Duplicates allowed per call, each fired one delay after the last was
+    #: admitted.
+    max_hedges: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate the policy so a hedge is never fired immediately."""
+        if self.delay_s is not None and self.delay_s <= 0:
+            raise ValueError("HedgePolicy.delay_s must be > 0 or None")
+        if not 0 < self.quantile < 1:
+            raise ValueError("HedgePolicy.quantile must be in (0, 1)")
+        if self.min_samples < 1:
+            raise ValueError("HedgePolicy.min_samples must be >= 1")
+        if self.max_hedges < 1:
+            raise ValueError("HedgePolicy.max_hedges must be >= 1")
+
+
+class Hedger:
+    """Latency history and hedge scheduling for one provider/model."""
+
+    def __init__(self, policy: HedgePolicy) -> None:
+        self.policy = policy
+        self._latencies: deque[float] = deque(maxlen=_LATENCY_SAMPLES)
+
+    def delay_s(self) -> float | None:
+        """Current hedge delay, or ``None`` while too few samples exist."""
+        if self.policy.delay_s is not None:
+            return self.policy.delay_s
+        if len(self._latencies) < self.policy.min_samples:
+            return None
+        ordered = sorted(self._latencies)
+        rank = math.ceil(self.policy.quantile * len(ordered)) - 1
+        return ordered[max(0, rank)]
+
+    def observe(self, latency_s: float) -> None:
+        """Record the provider latency of one successful copy."""
+        self._latencies.append(latency_s)
+
+    async def run(
+        self, factory: Callable[[asyncio.Event], Awaitable[T]]
+    ) -> tuple[T, int]:
+        """Await *factory*, racing duplicates; return the result and hedge count.
+
+        Each copy gets an event to set once it has been admitted and is about
+        to call the provider; the delay before the next duplicate starts only
+        then. A failed copy does not end the race while another is still
+        running; the first failure is raised only once every copy has failed.
+        """
+        delay = self.delay_s()
+        admitted = asyncio.Event()
+        pending: list[asyncio.Task[T]] = [asyncio.ensure_future(factory(admitted))]
+        fired = 0
+        first_error: BaseException | None = None
+        try:
+            while pending:
+                hedging = delay is not None and fired < self.policy.max_hedges
+                watched: list[asyncio.Future[Any]] = [*pending]
+                admission: asyncio.Task[bool] | None = None
+                if hedging and not admitted.is_set():
+                    admission = asyncio.ensure_future(admitted.wait())
+                    watched.append(admission)
+                done, _ = await asyncio.wait(
+                    watched,
+                    timeout=delay if hedging and admission is None else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if admission is not None:
+                    admission.cancel()
+                    done.discard(admission)
+                    if not done:
+                        # Admitted: the hedge delay starts now.
+                        continue
+                if not done:
+                    admitted = asyncio.Event()
+                    pending.append(asyncio.ensure_future(factory(admitted)))
+                    fired += 1
+                    continue
+                winner: asyncio.Task[T] | None = None
+                for task in done:
+                    pending.remove(task)
+                    exc = task.exception()
+                    if exc is None:
+                        winner = winner or task
+                    elif first_error is None:
+                        first_error = exc
+                if winner is not None:
+                    return winner.result(), fired
+            assert first_error is not None  # noqa: S101 - every copy failed
+            raise first_error
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+
+_hedgers: dict[tuple[str, str, str | None, HedgePolicy], Hedger] = {}
+
+
+def hedger_for(config: Config) -> Hedger | None:
+    """Return the process-wide hedger for *config*, or ``None`` when unset."""
+    policy = config.hedge
+    if policy is None:
+        return None
+    key = (*quota_scope(config), policy)
+    hedger = _hedgers.get(key)
+    if hedger is None:
+        hedger = _hedgers[key] = Hedger(policy)
+    return hedger
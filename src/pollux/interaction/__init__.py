@@ -27,6 +27,7 @@ from pollux.interaction.output import (
     Diagnostics,
     Metrics,
     Output,
+    OutputError,
     Usage,
     completion_status,
 )
@@ -56,6 +57,7 @@ __all__ = [
     "Metrics",
     "Output",
     "OutputCollection",
+    "OutputError",
     "OutputRequirements",
     "ToolCall",
     "ToolCallDelta",
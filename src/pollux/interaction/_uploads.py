@@ -5,20 +5,31 @@ provider assets once (single-flight deduped) before fanning out, and clean them
 up afterward. Uploads and deletes are optional provider capabilities, so the
 helpers narrow on the :class:`FileUploadingProvider` / :class:`FileDeletingProvider`
 structural protocols.
+
+With ``Config.reuse_uploads`` enabled, uploads are also recorded in a
+process-wide :class:`UploadRegistry` keyed by content hash, so repeated
+executions over the same bytes share one provider file until it expires.
 """
 
 from __future__ import annotations
 
-import asyncio  # noqa: TC003
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import hashlib
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+import time
+from typing import TYPE_CHECKING, Any, cast
+import weakref
 
 from pollux._singleflight import singleflight_cached
 from pollux.errors import APIError, InternalError, PolluxError
+from pollux.providers._utils import delete_files_best_effort
 from pollux.providers.base import FileDeletingProvider
 from pollux.providers.models import ProviderFileAsset, is_file_part
 from pollux.retry import retry_async, should_retry_side_effect
+from pollux.source import cached_sha256_file
 
 if TYPE_CHECKING:
     from pollux.providers.base import FileUploadingProvider, Provider
@@ -26,6 +37,125 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+#: Registry entries are dropped this long before the provider's file expiry so
+#: a reused asset never lapses between lookup and the generate call.
+_EXPIRY_MARGIN_S = 600.0
+
+#: ``(provider, api_key digest, content sha256, mime_type)``
+UploadKey = tuple[str, str, str, str]
+
+
+@dataclass
+class _LoopFlights:
+    """Single-flight state of one event loop; asyncio primitives are loop-bound."""
+
+    loop: weakref.ReferenceType[asyncio.AbstractEventLoop]
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    inflight: dict[UploadKey, asyncio.Future[ProviderFileAsset]] = field(
+        default_factory=dict
+    )
+
+    def alive(self) -> bool:
+        loop = self.loop()
+        return loop is not None and not loop.is_closed()
+
+
+@dataclass
+class UploadRegistry:
+    """Registry of provider uploads reusable across executions.
+
+    Entries are keyed by content rather than path, and scoped to the provider
+    account that owns the file. Inline fallbacks (data the provider never
+    stored) are not recorded. Registry-held assets outlive the execution that
+    created them, so :func:`cleanup_uploads` leaves them to the provider's TTL.
+
+    Like :class:`~pollux.cache.CacheRegistry`, entries are bounded to
+    ``max_entries`` with least-recently-used eviction and expired entries are
+    swept at most every ``sweep_interval_s``. Recorded assets are shared by
+    every event loop; the single-flight lock and in-flight uploads are kept
+    per loop, so successive ``asyncio.run()`` calls can all use the registry.
+    """
+
+    max_entries: int = 1024
+    sweep_interval_s: float = 60.0
+    _entries: OrderedDict[UploadKey, ProviderFileAsset] = field(
+        default_factory=OrderedDict
+    )
+    _held: set[tuple[str, str]] = field(default_factory=set)
+    # Keyed by id(loop): a strong key would pin loops that already ended.
+    _flights: dict[int, _LoopFlights] = field(default_factory=dict)
+    _last_sweep: float = field(default_factory=time.monotonic)
+
+    def get(self, key: UploadKey) -> ProviderFileAsset | None:
+        """Get an uploaded asset if recorded and not about to expire."""
+        self._maybe_sweep()
+        asset = self._entries.get(key)
+        if asset is None:
+            return None
+        if _expiring(asset, time.time()):
+            self._drop(key)
+            logger.debug("Upload expired file_id=%s", asset.file_id)
+            return None
+        self._entries.move_to_end(key)
+        return asset
+
+    def set(self, key: UploadKey, asset: ProviderFileAsset) -> None:
+        """Record a provider-stored asset for reuse."""
+        if asset.is_inline_fallback or asset.file_id.startswith("data:"):
+            return
+        self._maybe_sweep()
+        self._entries[key] = asset
+        self._entries.move_to_end(key)
+        self._held.add((asset.provider, asset.file_id))
+        while len(self._entries) > self.max_entries:
+            evicted = next(iter(self._entries))
+            logger.debug("Upload evicted file_id=%s", self._entries[evicted].file_id)
+            self._drop(evicted)
+
+    def holds(self, asset: ProviderFileAsset) -> bool:
+        """Return True when *asset* is owned by the registry, not one execution."""
+        return (asset.provider, asset.file_id) in self._held
+
+    def flights(self) -> _LoopFlights:
+        """Return the single-flight lock and in-flight uploads of the running loop."""
+        loop = asyncio.get_running_loop()
+        state = self._flights.get(id(loop))
+        if state is None or state.loop() is not loop:
+            for loop_id, stale in list(self._flights.items()):
+                if not stale.alive():
+                    del self._flights[loop_id]
+            state = self._flights[id(loop)] = _LoopFlights(weakref.ref(loop))
+        return state
+
+    def _drop(self, key: UploadKey) -> None:
+        asset = self._entries.pop(key)
+        self._held.discard((asset.provider, asset.file_id))
+
+    def _maybe_sweep(self) -> None:
+        now = time.monotonic()
+        if now - self._last_sweep < self.sweep_interval_s:
+            return
+        self._last_sweep = now
+        wall = time.time()
+        for key in [k for k, a in self._entries.items() if _expiring(a, wall)]:
+            self._drop(key)
+
+
+def _expiring(asset: ProviderFileAsset, now: float) -> bool:
+    return asset.expires_at is not None and now >= asset.expires_at - _EXPIRY_MARGIN_S
+
+
+# Module-level registry shared by every execution with ``reuse_uploads=True``.
+_upload_registry = UploadRegistry()
+
+
+def upload_key(
+    provider: str, api_key: str | None, content_hash: str, mime_type: str
+) -> UploadKey:
+    """Build a registry key without keeping the raw API key in memory."""
+    key_digest = hashlib.sha256((api_key or "").encode()).hexdigest()[:16]
+    return (provider, key_digest, content_hash, mime_type)
+
 
 def _with_call_idx(err: APIError, call_idx: int | None) -> APIError:
     """Return an APIError attributed to *call_idx* without mutating in place.
@@ -61,64 +191,103 @@ async def substitute_upload_parts(
     upload_inflight: dict[tuple[str, str], asyncio.Future[ProviderFileAsset]],
     upload_lock: asyncio.Lock,
     retry_policy: RetryPolicy,
+    concurrency: int = 1,
+    registry: UploadRegistry | None = None,
+    registry_scope: tuple[str, str | None] = ("", None),
 ) -> list[Any]:
-    """Replace local file placeholders with provider file assets."""
-    resolved: list[Any] = []
-
-    for part in parts:
-        if is_file_part(part):
-            file_path = part["file_path"]
-            mime_type = part["mime_type"]
-            provider_hints = part.get("provider_hints")
-            cache_key = (file_path, mime_type)
-
-            async def _work(
-                fp: str = file_path, mt: str = mime_type
-            ) -> ProviderFileAsset:
-                try:
-                    if retry_policy.max_attempts <= 1:
-                        return await provider.upload_file(Path(fp), mt)
-
-                    return await retry_async(
-                        lambda: provider.upload_file(Path(fp), mt),
-                        policy=retry_policy,
-                        should_retry=should_retry_side_effect,
-                    )
-                except PolluxError:
-                    raise
-                except Exception as e:
-                    raise InternalError(
-                        f"Upload failed: {type(e).__name__}: {e}",
-                        hint="This is a Pollux internal error. Please report it.",
-                    ) from e
+    """Replace local file placeholders with provider file assets.
+
+    Distinct files upload concurrently, at most *concurrency* at a time;
+    duplicates share one upload via single-flight and the returned parts keep
+    their original order. If any upload fails, the rest are cancelled and the
+    failure of the earliest part is raised.
 
+    When *registry* is given, each file is looked up by content hash under
+    *registry_scope* (``(provider, api_key)``) before uploading, and new
+    uploads are recorded there for later executions.
+    """
+    sem = asyncio.Semaphore(max(1, concurrency))
+
+    async def _upload(fp: str, mt: str) -> ProviderFileAsset:
+        async with sem:
             try:
-                asset = await singleflight_cached(
-                    cache_key,
-                    lock=upload_lock,
-                    inflight=upload_inflight,
-                    cache_get=upload_cache.get,
-                    cache_set=upload_cache.__setitem__,
-                    work=_work,
-                )
-            except APIError as e:
-                raise _with_call_idx(e, call_idx) from e
-
-            # The provider adapter reconstructs the SDK payload from the asset.
-            if provider_hints is not None:
-                resolved.append(
-                    {
-                        "uri": asset.file_id,
-                        "mime_type": mime_type,
-                        "provider_hints": provider_hints,
-                    }
+                if retry_policy.max_attempts <= 1:
+                    return await provider.upload_file(Path(fp), mt)
+
+                return await retry_async(
+                    lambda: provider.upload_file(Path(fp), mt),
+                    policy=retry_policy,
+                    should_retry=should_retry_side_effect,
                 )
-            else:
-                resolved.append(asset)
-            continue
+            except PolluxError:
+                raise
+            except Exception as e:
+                raise InternalError(
+                    f"Upload failed: {type(e).__name__}: {e}",
+                    hint="This is a Pollux internal error. Please report it.",
+                ) from e
+
+    async def _work(fp: str, mt: str) -> ProviderFileAsset:
+        if registry is None:
+            return await _upload(fp, mt)
+        content_hash = await asyncio.to_thread(cached_sha256_file, fp)
+        key = upload_key(*registry_scope, content_hash, mt)
+        flights = registry.flights()
+        return await singleflight_cached(
+            key,
+            lock=flights.lock,
+            inflight=flights.inflight,
+            cache_get=registry.get,
+            cache_set=registry.set,
+            work=lambda: _upload(fp, mt),
+        )
+
+    async def _resolve(part: dict[str, Any]) -> Any:
+        file_path = part["file_path"]
+        mime_type = part["mime_type"]
+        provider_hints = part.get("provider_hints")
+        try:
+            asset = await singleflight_cached(
+                (file_path, mime_type),
+                lock=upload_lock,
+                inflight=upload_inflight,
+                cache_get=upload_cache.get,
+                cache_set=upload_cache.__setitem__,
+                work=lambda: _work(file_path, mime_type),
+            )
+        except APIError as e:
+            raise _with_call_idx(e, call_idx) from e
+
+        # The provider adapter reconstructs the SDK payload from the asset.
+        if provider_hints is not None:
+            return {
+                "uri": asset.file_id,
+                "mime_type": mime_type,
+                "provider_hints": provider_hints,
+            }
+        return asset
+
+    resolved = list(parts)
+    tasks = {
+        idx: asyncio.create_task(_resolve(part))
+        for idx, part in enumerate(parts)
+        if is_file_part(part)
+    }
+    if not tasks:
+        return resolved
 
-        resolved.append(part)
+    try:
+        await asyncio.wait(tasks.values(), return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
 
+    for task in tasks.values():
+        if not task.cancelled() and task.exception() is not None:
+            raise cast("BaseException", task.exception())
+    for idx, task in tasks.items():
+        resolved[idx] = task.result()
     return resolved
 
 
@@ -129,7 +298,9 @@ async def cleanup_uploads(
     """Delete provider-managed uploaded files (best-effort).
 
     Only applies to providers exposing ``delete_file`` (currently OpenAI).
-    Failures are logged, never raised—the server-side TTL is the backstop.
+    Assets held by the upload registry are kept for reuse. Deletes run
+    concurrently under a small bound. Failures are logged, never raised—the
+    server-side TTL is the backstop.
     """
     if not isinstance(provider, FileDeletingProvider):
         return
@@ -137,12 +308,49 @@ async def cleanup_uploads(
     file_ids = [
         asset.file_id
         for asset in upload_cache.values()
-        if asset.provider == "openai" and not asset.is_inline_fallback
+        if asset.provider == "openai"
+        and not asset.is_inline_fallback
+        and not _upload_registry.holds(asset)
     ]
+    await delete_files_best_effort(provider.delete_file, file_ids, label="Upload")
 
-    for file_id in file_ids:
-        try:
-            await provider.delete_file(file_id)
-            logger.debug("Deleted uploaded file: %s", file_id)
-        except Exception as exc:
-            logger.debug("Failed to delete uploaded file %s: %s", file_id, exc)
+
+class BackgroundCleanup:
+    """Session-owned queue that drains upload cleanup off the result path.
+
+    Executions hand their uploads here instead of deleting inline, so results
+    return as soon as generation finishes. :meth:`flush` awaits every pending
+    cleanup and must run before the owning provider is closed.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def submit(
+        self,
+        upload_cache: dict[tuple[str, str], ProviderFileAsset],
+        provider: Provider,
+    ) -> None:
+        """Schedule cleanup of *upload_cache* in a background task."""
+        if not upload_cache:
+            return
+        task = asyncio.create_task(cleanup_uploads(dict(upload_cache), provider))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def flush(self) -> None:
+        """Wait for all scheduled cleanup to finish."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+async def release_uploads(
+    upload_cache: dict[tuple[str, str], ProviderFileAsset],
+    provider: Provider,
+    background: BackgroundCleanup | None,
+) -> None:
+    """Clean up an execution's uploads inline, or hand them to *background*."""
+    if background is None:
+        await cleanup_uploads(upload_cache, provider)
+    else:
+        background.submit(upload_cache, provider)
@@ -79,6 +79,11 @@ class OutputCollection:
             return "partial"
         return "ok"
 
+    @property
+    def failed_indexes(self) -> list[int]:
+        """Positions of outputs that carry an ``error`` (partial-results mode)."""
+        return [i for i, output in enumerate(self.outputs) if output.error is not None]
+
     def to_jsonable(self) -> dict[str, Any]:
         """Serialize to a JSON-compatible dict with per-output detail and aggregates."""
         payload: dict[str, Any] = {
@@ -23,9 +23,15 @@ if TYPE_CHECKING:
 
 @dataclass(frozen=True, slots=True)
 class CachePolicy:
-    """An explicit persistent-cache preference for an environment."""
+    """An explicit persistent-cache preference for an environment.
+
+    With ``refresh_before_s`` set, a cache that is used within that many
+    seconds of expiring has its TTL extended by ``ttl_seconds`` (where the
+    provider supports it). Caches that stop being used simply expire.
+    """
 
     ttl_seconds: int | None = None
+    refresh_before_s: int | None = None
 
 
 #: ``"auto"`` opts into provider-managed caching; ``"none"`` disables it.
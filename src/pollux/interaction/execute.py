@@ -12,20 +12,40 @@ immutable ``Output`` / ``OutputCollection``.
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, nullcontext
 from dataclasses import replace
+import math
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar, cast
 
 from pollux.cache import create_cache_impl
-from pollux.errors import APIError, ConfigurationError, InternalError, PolluxError
-from pollux.interaction._uploads import cleanup_uploads, substitute_upload_parts
+from pollux.concurrency import adaptive_limiter_for, global_limiter_for
+from pollux.errors import (
+    APIError,
+    ConfigurationError,
+    DeadlineExceededError,
+    InternalError,
+    PolluxError,
+)
+from pollux.hedge import hedger_for
+from pollux.interaction._uploads import (
+    _upload_registry,
+    release_uploads,
+    substitute_upload_parts,
+)
 from pollux.interaction.capabilities import resolve_capabilities
 from pollux.interaction.collection import OutputCollection
 from pollux.interaction.continuation import build_continuation
 from pollux.interaction.environment import CachePolicy, EnvironmentSnapshot
 from pollux.interaction.event import Event
 from pollux.interaction.extract import provider_response_to_output
-from pollux.interaction.output import Usage
+from pollux.interaction.output import (
+    Diagnostics,
+    OutputError,
+    Usage,
+    completion_status,
+)
 from pollux.interaction.tools import ToolCall
 from pollux.interaction.validate import validate_interaction
 from pollux.parts import build_shared_parts, history_text_from_parts
@@ -35,26 +55,57 @@ from pollux.providers.base import (
     StreamingProvider,
     ValidatingProvider,
 )
-from pollux.providers.models import ProviderResponse, is_file_part
+from pollux.providers.models import (
+    ProviderFileAsset,
+    ProviderResponse,
+    is_file_part,
+)
 from pollux.providers.models import ToolCall as ProviderToolCall
-from pollux.retry import retry_async, should_retry_generate
+from pollux.ratelimit import backoff_gate_for, rate_limiter_for
+from pollux.response_cache import lookup_response, response_cache_key, store_response
+from pollux.retry import (
+    RetryBudget,
+    circuit_breaker_for,
+    retry_async,
+    should_retry_generate,
+)
+from pollux.tokens import TokenEstimator
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator, Sequence
+    from collections.abc import (
+        AsyncGenerator,
+        Awaitable,
+        Callable,
+        Coroutine,
+        Iterable,
+    )
     from typing import Any
 
     from pollux.config import Config
+    from pollux.interaction._uploads import BackgroundCleanup
     from pollux.interaction.environment import Environment
     from pollux.interaction.input import Input
     from pollux.interaction.output import Output
     from pollux.interaction.requirements import OutputRequirements
     from pollux.providers.base import Provider
-    from pollux.providers.models import ProviderFileAsset
+    from pollux.providers.models import ProviderStreamChunk
+    from pollux.retry import RetryPolicy
 
+    #: One settled call: its response, the replayable user content, the
+    #: number of hedged duplicates fired for it, and whether the response
+    #: cache served it.
+    _CallResult = tuple[ProviderResponse, str | None, int, bool]
+
+
+T = TypeVar("T")
 
 #: Fallback TTL when a ``CachePolicy`` leaves ``ttl_seconds`` unset.
 _DEFAULT_CACHE_TTL_SECONDS = 3600
 
+#: Pending tasks kept alive per admitted call. Two keeps the semaphore saturated
+#: while bounding coroutine frames for very large fan-outs.
+_DISPATCH_WINDOW_FACTOR = 2
+
 
 async def resolve_persistent_cache(
     snapshot: EnvironmentSnapshot,
@@ -85,6 +136,7 @@ async def resolve_persistent_cache(
         system_instruction=snapshot.instructions,
         tools=tools,
         ttl_seconds=snapshot.cache.ttl_seconds or _DEFAULT_CACHE_TTL_SECONDS,
+        refresh_before_s=snapshot.cache.refresh_before_s,
     )
     return handle.name
 
@@ -113,13 +165,16 @@ async def _prepare_parts(
             upload_inflight={},
             upload_lock=asyncio.Lock(),
             retry_policy=config.retry,
+            concurrency=config.upload_concurrency,
+            registry=_upload_registry if config.reuse_uploads else None,
+            registry_scope=(config.provider, config.api_key),
         )
     return tuple(raw_parts)
 
 
 async def _prepare_snapshot(
     snapshot: EnvironmentSnapshot,
-    n_inputs: int,
+    n_inputs: int | None,
     config: Config,
     provider: Provider,
     caps: Any,
@@ -128,7 +183,8 @@ async def _prepare_snapshot(
     """Freeze resolved cache + uploaded parts onto the snapshot for ``generate``.
 
     Returns the resolved snapshot and the cache mode reflected on ``Output``
-    metrics (``"persistent"`` / ``"implicit"`` / ``"none"``).
+    metrics (``"persistent"`` / ``"implicit"`` / ``"none"``). ``n_inputs`` is
+    ``None`` when inputs are pulled lazily and the fan-out size is unknown.
     """
     cache_name = await resolve_persistent_cache(snapshot, config, provider)
     if cache_name is not None:
@@ -150,20 +206,23 @@ async def _prepare_snapshot(
     return resolved, cache_mode
 
 
-async def execute_interactions(
+async def _plan_interactions(
     environment: Environment,
     inputs: Sequence[Input],
     requirements: OutputRequirements,
     config: Config,
     provider: Provider,
-) -> OutputCollection:
-    """Execute one interaction per input over a shared environment.
+    *,
+    check_tokens: bool = True,
+) -> tuple[EnvironmentSnapshot, Any, TokenEstimator | None]:
+    """Snapshot the environment and validate the fan-out before any side effects.
 
-    Handles capability validation, core-orchestrated uploads (single-flight
-    dedup), concurrency, and retry, then assembles per-interaction ``Output``s.
+    Returns the unresolved snapshot, the effective provider capabilities, and
+    the token estimator when ``config.preflight`` is set. Token preflight and
+    provider-owned model-specific validation run here so a rejected request
+    never leaves uploads or caches behind. Without *check_tokens*, token
+    preflight is left to each call (see :func:`_call_executor`).
     """
-    start_time = time.perf_counter()
-    inputs = tuple(inputs)
     snapshot = EnvironmentSnapshot.from_environment(
         environment, provider=config.provider
     )
@@ -172,37 +231,199 @@ async def execute_interactions(
     validate_interaction(
         requirements, inputs, snapshot, caps, cache_requested=persistent_requested
     )
-
-    retry_policy = config.retry
-    upload_cache: dict[tuple[str, str], ProviderFileAsset] = {}
-
-    # Provider-owned model-specific validation runs before any upload or cache
-    # side effects so a rejected request never leaves remote artifacts behind.
+    estimator = _token_estimator(snapshot, config)
+    if estimator is not None and check_tokens:
+        for idx, inp in enumerate(inputs):
+            estimator.check(inp, call_idx=idx)
     if isinstance(provider, ValidatingProvider):
         for inp in inputs:
             await provider.validate_request(snapshot, inp, requirements, config)
+    return snapshot, caps, estimator
+
+
+def _token_estimator(
+    snapshot: EnvironmentSnapshot, config: Config
+) -> TokenEstimator | None:
+    """Build the preflight token estimator when ``config.preflight`` is set."""
+    return TokenEstimator(snapshot, config) if config.preflight is not None else None
+
 
-    snapshot, cache_mode = await _prepare_snapshot(
-        snapshot, len(inputs), config, provider, caps, upload_cache
+async def _validate_input(
+    inp: Input,
+    snapshot: EnvironmentSnapshot,
+    requirements: OutputRequirements,
+    config: Config,
+    provider: Provider,
+    caps: Any,
+    estimator: TokenEstimator | None,
+) -> None:
+    """Validate one lazily pulled input the way :func:`_plan_interactions` would."""
+    validate_interaction(
+        requirements,
+        [inp],
+        snapshot,
+        caps,
+        cache_requested=isinstance(snapshot.cache, CachePolicy),
     )
+    if estimator is not None:
+        estimator.check(inp)
+    if isinstance(provider, ValidatingProvider):
+        await provider.validate_request(snapshot, inp, requirements, config)
+
 
-    sem = asyncio.Semaphore(config.request_concurrency)
-    user_contents: list[str | None] = [None] * len(inputs)
+def _estimate_tokens(
+    snapshot: EnvironmentSnapshot,
+    inp: Input,
+    requirements: OutputRequirements,
+    config: Config,
+) -> int:
+    """Estimate a call's token cost for rate limiting: text input plus output cap.
 
-    async def _execute_call(call_idx: int) -> ProviderResponse:
-        async with sem:
+    Text is converted at ``RateLimit.chars_per_token``; uploaded files carry no
+    client-side size signal and are reconciled from reported usage afterwards.
+    """
+    chars = len(_compile.system_instruction(snapshot) or "")
+    chars += sum(
+        len(part)
+        for part in _compile.request_parts(snapshot, inp)
+        if isinstance(part, str)
+    )
+    if inp.continuation is not None:
+        chars += sum(len(message.content) for message in inp.continuation.messages)
+    chars_per_token = config.rate_limit.chars_per_token if config.rate_limit else 4.0
+    return math.ceil(chars / chars_per_token) + (requirements.max_tokens or 0)
+
+
+def _hedgeable(snapshot: EnvironmentSnapshot, inp: Input) -> bool:
+    """Whether a duplicate of this call is safe: no tools or uploaded files."""
+    if snapshot.tools or inp.tool_results:
+        return False
+    return not any(
+        isinstance(part, ProviderFileAsset) or is_file_part(part)
+        for part in _compile.request_parts(snapshot, inp)
+    )
+
+
+def _call_executor(
+    snapshot: EnvironmentSnapshot,
+    requirements: OutputRequirements,
+    config: Config,
+    provider: Provider,
+    budget: RetryBudget | None = None,
+    call_slot: Callable[[], AbstractAsyncContextManager[object]] | None = None,
+    preflight: TokenEstimator | None = None,
+) -> Callable[[int, Input], Coroutine[Any, Any, _CallResult]]:
+    """Build the per-call coroutine shared by the gather and streaming paths.
+
+    Each call returns its ``ProviderResponse`` alongside the replayable user
+    content used to build the continuation. Failures are attributed to their
+    ``call_idx``; non-Pollux exceptions are wrapped as provider errors. Each
+    call holds a slot from *call_slot* when given (a session scheduler), else
+    from a semaphore of ``config.request_concurrency`` for this run. With
+    ``config.response_cache``, a stored response for an identical request is
+    returned without taking a slot, and clean completions are stored. With
+    *preflight*, each call checks its own token estimate first, so an overflow
+    fails only that call.
+    """
+    retry_policy = config.retry
+    response_cache = config.response_cache
+    limiter = rate_limiter_for(config)
+    adaptive = adaptive_limiter_for(config)
+    capped = global_limiter_for(config)
+    gate = backoff_gate_for(config)
+    breaker = circuit_breaker_for(config)
+    hedger = hedger_for(config)
+
+    async def _attempt(
+        inp: Input, admitted: asyncio.Event | None = None
+    ) -> ProviderResponse:
+        estimated = 0
+        if limiter is not None:
+            estimated = _estimate_tokens(snapshot, inp, requirements, config)
+            await limiter.acquire(estimated)
+        if admitted is None or hedger is None:
+            response = await provider.generate(snapshot, inp, requirements, config)
+        else:
+            # A hedged copy: its delay and latency sample cover the provider
+            # call alone, not the queueing before it.
+            admitted.set()
+            started = time.monotonic()
+            response = await provider.generate(snapshot, inp, requirements, config)
+            hedger.observe(time.monotonic() - started)
+        if limiter is not None and isinstance(response, ProviderResponse):
+            limiter.settle(estimated, response.usage.get("total_tokens"))
+        return response
+
+    async def _generate(
+        inp: Input, started: float, admitted: asyncio.Event | None = None
+    ) -> ProviderResponse:
+        # A Retry-After seen by any call pauses every new attempt, for as long
+        # as this call's retry policy allows.
+        await gate.wait(_gate_allowance(retry_policy, started))
+        try:
+            with breaker.guard() if breaker is not None else nullcontext():
+                # The process-wide cap and adaptive slots are held per
+                # attempt, so retry backoff frees capacity and every 429 feeds
+                # the adaptive limit.
+                async with capped.slot() if capped is not None else nullcontext():
+                    if adaptive is None:
+                        return await _attempt(inp, admitted)
+                    async with adaptive.slot():
+                        return await _attempt(inp, admitted)
+        except APIError as exc:
+            gate.observe(exc)
+            raise
+
+    if call_slot is None:
+        # The fixed semaphore spans the whole retry loop.
+        sem: AbstractAsyncContextManager[object] = (
+            asyncio.Semaphore(config.request_concurrency)
+            if adaptive is None
+            else nullcontext()
+        )
+
+        def call_slot() -> AbstractAsyncContextManager[object]:
+            return sem
+
+    async def _execute_call(call_idx: int, inp: Input) -> _CallResult:
+        if preflight is not None:
+            preflight.check(inp, call_idx=call_idx)
+        hedges = 0
+        cache_key: str | None = None
+        if response_cache is not None:
+            cache_key = response_cache_key(snapshot, inp, requirements, config)
+            cached = await lookup_response(response_cache, cache_key)
+            if cached is not None:
+                user_content = history_text_from_parts(
+                    _compile.request_parts(snapshot, inp)
+                )
+                return cached, user_content, 0, True
+
+        async def _call() -> ProviderResponse:
+            nonlocal hedges
+            if hedger is None or not _hedgeable(snapshot, inp):
+                return await _generate(inp, started)
+            response, fired = await hedger.run(
+                lambda admitted: _generate(inp, started, admitted)
+            )
+            hedges += fired
+            return response
+
+        async with call_slot():
+            started = time.monotonic()
             try:
-                inp = inputs[call_idx]
-                user_contents[call_idx] = history_text_from_parts(
+                user_content = history_text_from_parts(
                     _compile.request_parts(snapshot, inp)
                 )
                 if retry_policy.max_attempts <= 1:
-                    return await provider.generate(snapshot, inp, requirements, config)
-                return await retry_async(
-                    lambda: provider.generate(snapshot, inp, requirements, config),
-                    policy=retry_policy,
-                    should_retry=should_retry_generate,
-                )
+                    response = await _call()
+                else:
+                    response = await retry_async(
+                        _call,
+                        policy=retry_policy,
+                        should_retry=should_retry_generate,
+                        budget=budget,
+                    )
             except asyncio.CancelledError:
                 raise
             except APIError as exc:
@@ -225,53 +446,326 @@ async def execute_interactions(
                 if getattr(wrapped, "call_idx", None) is None:
                     wrapped.call_idx = call_idx
                 raise wrapped from exc
+        if not isinstance(response, ProviderResponse):
+            raise InternalError(
+                f"Provider returned invalid response type: {type(response).__name__}",
+                hint="Providers must return a ProviderResponse.",
+            )
+        if (
+            response_cache is not None
+            and cache_key is not None
+            and completion_status(response.finish_reason) == "clean"
+        ):
+            await store_response(response_cache, cache_key, response)
+        return response, user_content, hedges, False
+
+    return _execute_call
+
 
-    responses: list[ProviderResponse] = []
+def _gate_allowance(policy: RetryPolicy, started: float) -> float:
+    """Longest Retry-After pause a call started at *started* may wait out.
+
+    Bounded like a retry sleep: by ``max_delay_s`` and by what is left of
+    ``max_elapsed_s``.
+    """
+    allowance = policy.max_delay_s
+    if policy.max_elapsed_s is not None:
+        remaining = policy.max_elapsed_s - (time.monotonic() - started)
+        allowance = min(allowance, remaining)
+    return max(0.0, allowance)
+
+
+def _deadline(timeout_s: float | None) -> float | None:
+    """Return the monotonic deadline for a *timeout_s* budget starting now."""
+    if timeout_s is None:
+        return None
+    if timeout_s <= 0:
+        raise ConfigurationError(
+            f"timeout_s must be > 0, got {timeout_s}",
+            hint="Pass a positive wall-clock budget in seconds, or None.",
+        )
+    return time.monotonic() + timeout_s
+
+
+def _deadline_error(
+    timeout_s: float, call_idx: int | None = None
+) -> DeadlineExceededError:
+    return DeadlineExceededError(
+        f"Call did not complete within timeout_s={timeout_s}",
+        timeout_s=timeout_s,
+        hint="Raise timeout_s, or reduce the work per call.",
+        call_idx=call_idx,
+    )
+
+
+async def _within(
+    awaitable: Awaitable[T], timeout_s: float | None, deadline: float | None
+) -> T:
+    """Await *awaitable*, raising ``DeadlineExceededError`` once *deadline* passes."""
+    if timeout_s is None or deadline is None:
+        return await awaitable
+    remaining = max(0.0, deadline - time.monotonic())
     try:
-        tasks = [asyncio.create_task(_execute_call(i)) for i in range(len(inputs))]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        # Collect all outcomes before raising so a failure never leaves a
-        # background task with an unobserved exception. Raise the lowest-index
-        # failure for deterministic attribution.
-        for item in results:
-            if isinstance(item, BaseException):
-                raise item
-            if not isinstance(item, ProviderResponse):
-                raise InternalError(
-                    f"Provider returned invalid response type: {type(item).__name__}",
-                    hint="Providers must return a ProviderResponse.",
-                )
-            responses.append(item)
+        return await asyncio.wait_for(awaitable, remaining)
+    except asyncio.TimeoutError as exc:
+        raise _deadline_error(timeout_s) from exc
+
+
+def _bounded_executor(
+    execute_call: Callable[[int, Input], Coroutine[Any, Any, _CallResult]],
+    timeout_s: float | None,
+    deadline: float | None,
+) -> Callable[[int, Input], Coroutine[Any, Any, _CallResult]]:
+    """Cancel each call (retries, hedges and all) once *deadline* passes."""
+    if timeout_s is None or deadline is None:
+        return execute_call
+
+    async def _call(call_idx: int, inp: Input) -> _CallResult:
+        remaining = max(0.0, deadline - time.monotonic())
+        try:
+            return await asyncio.wait_for(execute_call(call_idx, inp), remaining)
+        except asyncio.TimeoutError as exc:
+            raise _deadline_error(timeout_s, call_idx) from exc
+
+    return _call
+
+
+def _error_output(
+    exc: BaseException, *, requirements: OutputRequirements, duration_s: float
+) -> Output:
+    """Stand-in ``Output`` for a failed call, reported instead of raised."""
+    output = provider_response_to_output(
+        ProviderResponse(text="", usage={}),
+        requirements=requirements,
+        duration_s=duration_s,
+        # A failed call is an error whatever its category; the category
+        # itself (e.g. context_overflow) stays on ``Output.error``.
+        error_category="error",
+    )
+    return replace(
+        output, diagnostics=Diagnostics(), error=OutputError.from_exception(exc)
+    )
+
+
+async def _aiter_inputs(
+    inputs: Iterable[Input] | AsyncIterable[Input],
+) -> AsyncGenerator[Input, None]:
+    """Adapt a sync or async input source to one async iterator."""
+    if isinstance(inputs, AsyncIterable):
+        async for inp in inputs:
+            yield inp
+    else:
+        for inp in inputs:
+            yield inp
+
+
+def _dispatch_window(config: Config) -> int:
+    """Max tasks alive at once: a few per slot at the highest allowed limit."""
+    policy = config.adaptive_concurrency
+    ceiling = config.request_concurrency if policy is None else policy.max_limit
+    return ceiling * _DISPATCH_WINDOW_FACTOR
+
+
+async def _dispatch(
+    inputs: Iterable[Input] | AsyncIterable[Input],
+    execute_call: Callable[[int, Input], Coroutine[Any, Any, _CallResult]],
+    *,
+    window: int,
+) -> AsyncGenerator[tuple[int, Input, asyncio.Task[_CallResult]], None]:
+    """Run one call per input with at most *window* tasks alive at once.
+
+    Inputs are pulled lazily as slots free up, so a 100k-input fan-out never
+    materializes more than *window* coroutine frames. Settled tasks are yielded
+    with their index and input in completion order (index order among
+    simultaneous completions); the caller observes each task's outcome. Tasks
+    still pending when the consumer stops are cancelled.
+    """
+    source = _aiter_inputs(inputs)
+    pending: dict[asyncio.Task[_CallResult], tuple[int, Input]] = {}
+    next_idx = 0
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(pending) < window:
+                try:
+                    inp = await anext(source)
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                task = asyncio.create_task(execute_call(next_idx, inp))
+                pending[task] = (next_idx, inp)
+                next_idx += 1
+            if not pending:
+                return
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda t: pending[t][0]):
+                idx, inp = pending.pop(task)
+                yield idx, inp, task
     finally:
-        await cleanup_uploads(upload_cache, provider)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        await source.aclose()
 
-    duration_s = time.perf_counter() - start_time
 
+def _assemble_output(
+    inp: Input,
+    response: ProviderResponse,
+    *,
+    user_content: str | None,
+    requirements: OutputRequirements,
+    config: Config,
+    duration_s: float,
+    cache_mode: str,
+    hedges: int,
+    response_cache_hit: bool = False,
+    estimator: TokenEstimator | None = None,
+) -> Output:
+    """Assemble one interaction's ``Output`` from its provider response."""
+    cached = response.usage.get("cached_tokens", 0)
     cache_used = cache_mode == "persistent"
+    cache_hit = cache_used or (
+        cache_mode == "implicit" and isinstance(cached, int) and cached > 0
+    )
+    continuation = build_continuation(
+        inp,
+        response,
+        user_content=user_content,
+        provider=config.provider,
+    )
+    return provider_response_to_output(
+        response,
+        requirements=requirements,
+        duration_s=duration_s,
+        cache_used=cache_used,
+        cache_mode=cache_mode,
+        cache_hit=cache_hit,
+        continuation=continuation,
+        hedges=hedges,
+        response_cache_hit=response_cache_hit,
+        estimated_input_tokens=estimator.estimate(inp) if estimator else None,
+    )
+
+
+async def execute_interactions(
+    environment: Environment,
+    inputs: Sequence[Input],
+    requirements: OutputRequirements,
+    config: Config,
+    provider: Provider,
+    *,
+    cleanup: BackgroundCleanup | None = None,
+    retry_budget: RetryBudget | None = None,
+    timeout_s: float | None = None,
+    return_exceptions: bool = False,
+    call_slot: Callable[[], AbstractAsyncContextManager[object]] | None = None,
+) -> OutputCollection:
+    """Execute one interaction per input over a shared environment.
+
+    Handles capability validation, core-orchestrated uploads (single-flight
+    dedup), concurrency, and retry, then assembles per-interaction ``Output``s.
+    Uploaded files are deleted before returning unless *cleanup* is given, in
+    which case deletion is handed to that background queue. Retries draw on
+    *retry_budget* when given, else on a fresh budget for this run when
+    ``config.retry`` asks for one.
+
+    With *timeout_s*, calls still running when the budget (counted from entry,
+    so it includes upload/cache preparation) runs out are cancelled and
+    reported as error outputs (``completion_status="error"``, the
+    ``DeadlineExceededError`` in ``Output.error``) instead of raising. If
+    preparation itself outlasts the budget, no call has started and
+    ``DeadlineExceededError`` raises.
+
+    With *return_exceptions*, every failed call is reported that way, so one
+    bad input no longer discards the rest of the batch; token preflight then
+    runs per call, so an input over the context window fails alone.
+
+    With *call_slot*, each call holds a slot from that factory (a
+    ``Session``'s priority scheduler) instead of a per-run semaphore.
+    """
+    start_time = time.perf_counter()
+    deadline = _deadline(timeout_s)
+    inputs = tuple(inputs)
+    snapshot, caps, estimator = await _plan_interactions(
+        environment,
+        inputs,
+        requirements,
+        config,
+        provider,
+        check_tokens=not return_exceptions,
+    )
+
+    upload_cache: dict[tuple[str, str], ProviderFileAsset] = {}
+    if retry_budget is None:
+        retry_budget = RetryBudget.from_policy(config.retry)
+    window = _dispatch_window(config)
+
+    results: list[_CallResult | BaseException | None] = [None] * len(inputs)
+    first_error: tuple[int, BaseException] | None = None
+    try:
+        snapshot, cache_mode = await _within(
+            _prepare_snapshot(
+                snapshot, len(inputs), config, provider, caps, upload_cache
+            ),
+            timeout_s,
+            deadline,
+        )
+        execute_call = _bounded_executor(
+            _call_executor(
+                snapshot,
+                requirements,
+                config,
+                provider,
+                retry_budget,
+                call_slot,
+                preflight=estimator if return_exceptions else None,
+            ),
+            timeout_s,
+            deadline,
+        )
+        async for idx, _inp, task in _dispatch(inputs, execute_call, window=window):
+            # Observe every outcome before raising so a failure never leaves a
+            # background task with an unobserved exception. Raise the
+            # lowest-index failure for deterministic attribution.
+            exc = task.exception()
+            if isinstance(exc, DeadlineExceededError) or (
+                return_exceptions and isinstance(exc, Exception)
+            ):
+                results[idx] = exc
+                continue
+            if exc is not None:
+                if first_error is None or idx < first_error[0]:
+                    first_error = (idx, exc)
+                continue
+            results[idx] = task.result()
+        if first_error is not None:
+            raise first_error[1]
+    finally:
+        await release_uploads(upload_cache, provider, cleanup)
+
+    duration_s = time.perf_counter() - start_time
+
     outputs: list[Output] = []
-    for idx, response in enumerate(responses):
-        cached = response.usage.get("cached_tokens", 0)
-        if cache_mode == "persistent":
-            cache_hit = True
-        else:
-            cache_hit = (
-                cache_mode == "implicit" and isinstance(cached, int) and cached > 0
+    for idx, result in enumerate(results):
+        if isinstance(result, BaseException):
+            outputs.append(
+                _error_output(result, requirements=requirements, duration_s=duration_s)
             )
-        continuation = build_continuation(
-            inputs[idx],
-            response,
-            user_content=user_contents[idx],
-            provider=config.provider,
-        )
+            continue
+        response, user_content, hedges, cache_served = cast("_CallResult", result)
         outputs.append(
-            provider_response_to_output(
+            _assemble_output(
+                inputs[idx],
                 response,
+                user_content=user_content,
                 requirements=requirements,
+                config=config,
                 duration_s=duration_s,
-                cache_used=cache_used,
                 cache_mode=cache_mode,
-                cache_hit=cache_hit,
-                continuation=continuation,
+                hedges=hedges,
+                response_cache_hit=cache_served,
+                estimator=estimator,
             )
         )
 
@@ -281,18 +775,176 @@ async def execute_interactions(
     )
 
 
+async def iter_interactions(
+    environment: Environment,
+    inputs: Iterable[Input] | AsyncIterable[Input],
+    requirements: OutputRequirements,
+    config: Config,
+    provider: Provider,
+    *,
+    cleanup: BackgroundCleanup | None = None,
+    retry_budget: RetryBudget | None = None,
+    timeout_s: float | None = None,
+    return_exceptions: bool = False,
+    call_slot: Callable[[], AbstractAsyncContextManager[object]] | None = None,
+) -> AsyncIterator[tuple[int, Output]]:
+    """Execute one interaction per input, yielding ``(index, Output)`` as each lands.
+
+    Same orchestration as :func:`execute_interactions` (validation, shared
+    upload/cache preparation, concurrency, retry), but outputs are yielded in
+    completion order instead of being gathered, so callers can persist results
+    incrementally without holding the whole batch. Each output's
+    ``metrics.duration_s`` is the wall-clock time from the start of the batch to
+    that call's completion. The first failure raises from the iterator and
+    cancels calls still in flight; closing the iterator early does the same.
+
+    ``inputs`` may be any iterable or async iterable. A sequence is validated
+    upfront; other iterables are pulled lazily as concurrency slots free up and
+    each input is validated when pulled.
+
+    With *timeout_s*, calls cut off by the budget are yielded as error outputs
+    and a preparation that outlasts it raises, as in
+    :func:`execute_interactions`; with *return_exceptions*, so is every
+    other failed call instead of raising from the iterator. *call_slot* is as
+    in :func:`execute_interactions`.
+    """
+    start_time = time.perf_counter()
+    deadline = _deadline(timeout_s)
+    lazy = not isinstance(inputs, Sequence)
+    eager = () if lazy else tuple(cast("Sequence[Input]", inputs))
+    snapshot, caps, estimator = await _plan_interactions(
+        environment,
+        eager,
+        requirements,
+        config,
+        provider,
+        check_tokens=not return_exceptions,
+    )
+
+    upload_cache: dict[tuple[str, str], ProviderFileAsset] = {}
+    try:
+        snapshot, cache_mode = await _within(
+            _prepare_snapshot(
+                snapshot,
+                None if lazy else len(eager),
+                config,
+                provider,
+                caps,
+                upload_cache,
+            ),
+            timeout_s,
+            deadline,
+        )
+    except BaseException:
+        await release_uploads(upload_cache, provider, cleanup)
+        raise
+
+    async def _validated(source: AsyncIterator[Input]) -> AsyncIterator[Input]:
+        async for inp in source:
+            await _validate_input(
+                inp,
+                snapshot,
+                requirements,
+                config,
+                provider,
+                caps,
+                None if return_exceptions else estimator,
+            )
+            yield inp
+
+    if retry_budget is None:
+        retry_budget = RetryBudget.from_policy(config.retry)
+    execute_call = _bounded_executor(
+        _call_executor(
+            snapshot,
+            requirements,
+            config,
+            provider,
+            retry_budget,
+            call_slot,
+            preflight=estimator if return_exceptions else None,
+        ),
+        timeout_s,
+        deadline,
+    )
+    window = _dispatch_window(config)
+    source = _validated(_aiter_inputs(inputs)) if lazy else eager
+
+    dispatch = _dispatch(source, execute_call, window=window)
+    try:
+        async for idx, inp, task in dispatch:
+            exc = task.exception()
+            if isinstance(exc, DeadlineExceededError) or (
+                return_exceptions and isinstance(exc, Exception)
+            ):
+                duration_s = time.perf_counter() - start_time
+                yield (
+                    idx,
+                    _error_output(
+                        exc, requirements=requirements, duration_s=duration_s
+                    ),
+                )
+                continue
+            response, user_content, hedges, cache_served = task.result()
+            yield (
+                idx,
+                _assemble_output(
+                    inp,
+                    response,
+                    user_content=user_content,
+                    requirements=requirements,
+                    config=config,
+                    duration_s=time.perf_counter() - start_time,
+                    cache_mode=cache_mode,
+                    hedges=hedges,
+                    response_cache_hit=cache_served,
+                    estimator=estimator,
+                ),
+            )
+    finally:
+        await dispatch.aclose()
+        await release_uploads(upload_cache, provider, cleanup)
+
+
 async def execute_interaction(
     environment: Environment,
     input: Input,  # noqa: A002 - "input" is the canonical v2 primitive name
     requirements: OutputRequirements,
     config: Config,
     provider: Provider,
+    *,
+    cleanup: BackgroundCleanup | None = None,
+    retry_budget: RetryBudget | None = None,
+    timeout_s: float | None = None,
+    call_slot: Callable[[], AbstractAsyncContextManager[object]] | None = None,
 ) -> Output:
-    """Execute a single interaction and return its ``Output``."""
+    """Execute a single interaction and return its ``Output``.
+
+    Unlike a batch, a call cut off by *timeout_s* raises
+    ``DeadlineExceededError``: there is no other result to report it beside.
+    """
     collection = await execute_interactions(
-        environment, [input], requirements, config, provider
+        environment,
+        [input],
+        requirements,
+        config,
+        provider,
+        cleanup=cleanup,
+        retry_budget=retry_budget,
+        timeout_s=timeout_s,
+        call_slot=call_slot,
     )
-    return collection.outputs[0]
+    return single_output(collection)
+
+
+def single_output(collection: OutputCollection) -> Output:
+    """Return a one-call collection's ``Output``, raising a deadline it hit."""
+    output = collection.outputs[0]
+    if output.error is not None and isinstance(
+        output.error.exception, DeadlineExceededError
+    ):
+        raise output.error.exception
+    return output
 
 
 class _ToolCallAssembler:
@@ -337,12 +989,43 @@ class _ToolCallAssembler:
         return pairs
 
 
+async def _bounded_stream(
+    chunks: AsyncIterator[ProviderStreamChunk],
+    timeout_s: float | None,
+    deadline: float | None,
+) -> AsyncGenerator[ProviderStreamChunk, None]:
+    """Relay *chunks*, raising ``DeadlineExceededError`` once *deadline* passes."""
+    if timeout_s is None or deadline is None:
+        async for chunk in chunks:
+            yield chunk
+        return
+    iterator = aiter(chunks)
+    try:
+        while True:
+            remaining = max(0.0, deadline - time.monotonic())
+            try:
+                chunk = await asyncio.wait_for(anext(iterator), remaining)
+            except StopAsyncIteration:
+                return
+            except asyncio.TimeoutError as exc:
+                raise _deadline_error(timeout_s) from exc
+            yield chunk
+    finally:
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
 async def stream_interaction(
     environment: Environment,
     input: Input,  # noqa: A002 - "input" is the canonical v2 primitive name
     requirements: OutputRequirements,
     config: Config,
     provider: Provider,
+    *,
+    cleanup: BackgroundCleanup | None = None,
+    timeout_s: float | None = None,
+    call_slot: Callable[[], AbstractAsyncContextManager[object]] | None = None,
 ) -> AsyncIterator[Event]:
     """Stream one interaction as :class:`Event` objects, ending in ``done``.
 
@@ -352,8 +1035,14 @@ async def stream_interaction(
     terminal ``done`` whose ``output`` matches the non-streaming result. A
     mid-stream provider failure raises from the iterator instead of emitting
     ``done``. Streamed turns are single-input and are not retried mid-stream.
+    With *timeout_s*, a stream not finished when the budget runs out (still
+    preparing, waiting for a slot, or open) is closed and
+    ``DeadlineExceededError`` raises from the iterator. With *call_slot*,
+    the stream holds a slot from that factory until it ends.
     """
     start_time = time.perf_counter()
+    deadline = _deadline(timeout_s)
+    started = time.monotonic()
     snapshot = EnvironmentSnapshot.from_environment(
         environment, provider=config.provider
     )
@@ -362,6 +1051,9 @@ async def stream_interaction(
     validate_interaction(
         requirements, [input], snapshot, caps, cache_requested=persistent_requested
     )
+    estimator = _token_estimator(snapshot, config)
+    if estimator is not None:
+        estimator.check(input)
 
     if not isinstance(provider, StreamingProvider):
         raise ConfigurationError(
@@ -374,9 +1066,15 @@ async def stream_interaction(
         await provider.validate_request(snapshot, input, requirements, config)
 
     upload_cache: dict[tuple[str, str], ProviderFileAsset] = {}
-    snapshot, cache_mode = await _prepare_snapshot(
-        snapshot, 1, config, provider, caps, upload_cache
-    )
+    try:
+        snapshot, cache_mode = await _within(
+            _prepare_snapshot(snapshot, 1, config, provider, caps, upload_cache),
+            timeout_s,
+            deadline,
+        )
+    except BaseException:
+        await release_uploads(upload_cache, provider, cleanup)
+        raise
     user_content = history_text_from_parts(_compile.request_parts(snapshot, input))
 
     text_parts: list[str] = []
@@ -387,32 +1085,52 @@ async def stream_interaction(
     finish_reason: str | None = None
     response_id: str | None = None
 
+    limiter = rate_limiter_for(config)
+    gate = backoff_gate_for(config)
+    breaker = circuit_breaker_for(config)
+    capped = global_limiter_for(config)
+    estimated = 0
+    slot = AsyncExitStack()
+
     try:
-        yield Event(type="start")
-        async for chunk in provider.stream_generate(
-            snapshot, input, requirements, config
-        ):
-            if chunk.text:
-                text_parts.append(chunk.text)
-                yield Event(type="text_delta", text=chunk.text)
-            if chunk.reasoning:
-                reasoning_parts.append(chunk.reasoning)
-                yield Event(type="reasoning_delta", text=chunk.reasoning)
-            for delta in chunk.tool_calls:
-                tool_calls.add(delta)
-                yield Event(type="tool_call_delta", delta=delta)
-            if chunk.usage:
-                # Usage may stream across several chunks (e.g. Anthropic reports
-                # input at message_start and output at message_delta), so merge
-                # rather than replace and surface the cumulative snapshot.
-                usage.update(chunk.usage)
-                yield Event(type="usage", usage=Usage.from_dict(usage))
-            if chunk.provider_state:
-                provider_state.update(chunk.provider_state)
-            if chunk.finish_reason:
-                finish_reason = chunk.finish_reason
-            if chunk.response_id:
-                response_id = chunk.response_id
+        if call_slot is not None:
+            await _within(slot.enter_async_context(call_slot()), timeout_s, deadline)
+        if capped is not None:
+            await _within(slot.enter_async_context(capped.slot()), timeout_s, deadline)
+        await _within(
+            gate.wait(_gate_allowance(config.retry, started)), timeout_s, deadline
+        )
+        if limiter is not None:
+            estimated = _estimate_tokens(snapshot, input, requirements, config)
+            await _within(limiter.acquire(estimated), timeout_s, deadline)
+        with breaker.guard() if breaker is not None else nullcontext():
+            yield Event(type="start")
+            async for chunk in _bounded_stream(
+                provider.stream_generate(snapshot, input, requirements, config),
+                timeout_s,
+                deadline,
+            ):
+                if chunk.text:
+                    text_parts.append(chunk.text)
+                    yield Event(type="text_delta", text=chunk.text)
+                if chunk.reasoning:
+                    reasoning_parts.append(chunk.reasoning)
+                    yield Event(type="reasoning_delta", text=chunk.reasoning)
+                for delta in chunk.tool_calls:
+                    tool_calls.add(delta)
+                    yield Event(type="tool_call_delta", delta=delta)
+                if chunk.usage:
+                    # Usage may stream across several chunks (e.g. Anthropic reports
+                    # input at message_start and output at message_delta), so merge
+                    # rather than replace and surface the cumulative snapshot.
+                    usage.update(chunk.usage)
+                    yield Event(type="usage", usage=Usage.from_dict(usage))
+                if chunk.provider_state:
+                    provider_state.update(chunk.provider_state)
+                if chunk.finish_reason:
+                    finish_reason = chunk.finish_reason
+                if chunk.response_id:
+                    response_id = chunk.response_id
 
         assembled = tool_calls.assembled()
         for public_call, _transport in assembled:
@@ -420,6 +1138,8 @@ async def stream_interaction(
         if finish_reason is not None:
             yield Event(type="finish", finish_reason=finish_reason)
 
+        if limiter is not None:
+            limiter.settle(estimated, usage.get("total_tokens"))
         response = ProviderResponse(
             text="".join(text_parts),
             usage=usage,
@@ -446,7 +1166,12 @@ async def stream_interaction(
             cache_mode=cache_mode,
             cache_hit=cache_hit,
             continuation=continuation,
+            estimated_input_tokens=estimator.estimate(input) if estimator else None,
         )
         yield Event(type="done", output=output)
+    except APIError as exc:
+        gate.observe(exc)
+        raise
     finally:
-        await cleanup_uploads(upload_cache, provider)
+        await slot.aclose()
+        await release_uploads(upload_cache, provider, cleanup)
@@ -66,6 +66,9 @@ def provider_response_to_output(
     cache_hit: bool = False,
     continuation: Continuation | None = None,
     error_category: str | None = None,
+    hedges: int = 0,
+    response_cache_hit: bool = False,
+    estimated_input_tokens: int | None = None,
 ) -> Output:
     """Assemble an :class:`Output` from a ``ProviderResponse`` and execution metrics."""
     tool_calls = tuple(
@@ -82,6 +85,9 @@ def provider_response_to_output(
         completion_status=completion_status(
             response.finish_reason, error_category=error_category
         ),
+        hedges=hedges,
+        response_cache_hit=response_cache_hit,
+        estimated_input_tokens=estimated_input_tokens,
     )
     return Output(
         text=response.text,
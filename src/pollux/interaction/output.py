@@ -110,6 +110,14 @@ class Metrics:
     cache_hit: bool = False
     finish_reason: str | None = None
     completion_status: CompletionStatus = "clean"
+    #: Duplicate requests fired by ``Config.hedge`` for this interaction.
+    hedges: int = 0
+    #: Whether ``Config.response_cache`` served this interaction without a
+    #: provider call.
+    response_cache_hit: bool = False
+    #: Pollux's local estimate of this interaction's input tokens, from
+    #: ``Config.preflight``; *None* when preflight is off.
+    estimated_input_tokens: int | None = None
 
     def to_jsonable(self) -> dict[str, Any]:
         """Serialize to a JSON-compatible dict."""
@@ -121,6 +129,9 @@ class Metrics:
             "cache_hit": self.cache_hit,
             "finish_reason": self.finish_reason,
             "completion_status": self.completion_status,
+            "hedges": self.hedges,
+            "response_cache_hit": self.response_cache_hit,
+            "estimated_input_tokens": self.estimated_input_tokens,
         }
 
 
@@ -135,6 +146,44 @@ class Diagnostics:
         return dict(self.raw) if self.raw else {}
 
 
+@dataclass(frozen=True, slots=True)
+class OutputError:
+    """Why an interaction produced no completion (partial-results mode)."""
+
+    type: str
+    message: str
+    category: str | None = None
+    status_code: int | None = None
+    retryable: bool | None = None
+    call_idx: int | None = None
+    #: The original exception, for re-raising or logging; not serialized.
+    exception: BaseException | None = field(default=None, repr=False, compare=False)
+
+    @classmethod
+    def from_exception(cls, exc: BaseException) -> OutputError:
+        """Describe *exc*, reading Pollux ``APIError`` metadata when present."""
+        return cls(
+            type=type(exc).__name__,
+            message=str(exc),
+            category=getattr(exc, "error_category", None),
+            status_code=getattr(exc, "status_code", None),
+            retryable=getattr(exc, "retryable", None),
+            call_idx=getattr(exc, "call_idx", None),
+            exception=exc,
+        )
+
+    def to_jsonable(self) -> dict[str, Any]:
+        """Serialize to a JSON-compatible dict (the exception is omitted)."""
+        return {
+            "type": self.type,
+            "message": self.message,
+            "category": self.category,
+            "status_code": self.status_code,
+            "retryable": self.retryable,
+            "call_idx": self.call_idx,
+        }
+
+
 def _jsonable_structured(value: Any) -> Any:
     """Return a JSON-compatible structured payload where Pollux can guarantee it."""
     if isinstance(value, BaseModel):
@@ -154,6 +203,8 @@ class Output:
     usage: Usage = field(default_factory=Usage)
     metrics: Metrics = field(default_factory=Metrics)
     diagnostics: Diagnostics = field(default_factory=Diagnostics)
+    #: Set when the call failed and was reported instead of raised.
+    error: OutputError | None = None
 
     def to_jsonable(self) -> dict[str, Any]:
         """Serialize to a JSON-compatible dict (optional facets omitted)."""
@@ -171,4 +222,6 @@ class Output:
         diagnostics = self.diagnostics.to_jsonable()
         if diagnostics:
             payload["diagnostics"] = diagnostics
+        if self.error is not None:
+            payload["error"] = self.error.to_jsonable()
         return payload
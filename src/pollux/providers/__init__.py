@@ -1,11 +1,45 @@
 """Provider implementations."""
 
-from .anthropic import AnthropicProvider
-from .base import Provider, ProviderCapabilities
-from .gemini import GeminiProvider
-from .local import LocalProvider
-from .openai import OpenAIProvider
-from .openrouter import OpenRouterProvider
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .anthropic import AnthropicProvider
+    from .base import Provider, ProviderCapabilities
+    from .gemini import GeminiProvider
+    from .local import LocalProvider
+    from .openai import OpenAIProvider
+    from .openrouter import OpenRouterProvider
+
+# Loaded on first access (PEP 562) so importing one provider module, or
+# ``pollux.providers.base``, does not import every other provider.
+_LAZY_ATTRS: dict[str, str] = {
+    "AnthropicProvider": ".anthropic",
+    "GeminiProvider": ".gemini",
+    "LocalProvider": ".local",
+    "OpenAIProvider": ".openai",
+    "OpenRouterProvider": ".openrouter",
+    "Provider": ".base",
+    "ProviderCapabilities": ".base",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a provider class's module on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Include lazily loaded provider names."""
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
+
 
 __all__ = [
     "AnthropicProvider",
@@ -2,11 +2,77 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
 from contextlib import suppress
 from copy import deepcopy
-from typing import Any
+import logging
+from typing import TYPE_CHECKING, Any
 
 from pollux.errors import APIError, ConfigurationError
+from pollux.source import map_file
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+#: Deletes in flight at once during best-effort file cleanup.
+DELETE_CONCURRENCY = 8
+
+#: Raw bytes encoded per step; a multiple of 3 so chunks never need padding.
+_BASE64_CHUNK_BYTES = 3 * 256 * 1024
+
+
+def file_data_url(path: Path, mime_type: str) -> str:
+    """Encode a local file as a base64 data URL without buffering its bytes.
+
+    The file is memory-mapped and encoded chunk by chunk into one preallocated
+    buffer, so peak memory is the encoded size plus the final string instead of
+    the raw bytes plus several encoded copies.
+    """
+    prefix = f"data:{mime_type};base64,".encode("ascii")
+    with map_file(path) as data:
+        size = len(data)
+        out = bytearray(len(prefix) + 4 * ((size + 2) // 3))
+        out[: len(prefix)] = prefix
+        pos = len(prefix)
+        for start in range(0, size, _BASE64_CHUNK_BYTES):
+            encoded = base64.b64encode(data[start : start + _BASE64_CHUNK_BYTES])
+            out[pos : pos + len(encoded)] = encoded
+            pos += len(encoded)
+    return out.decode("ascii")
+
+
+async def delete_files_best_effort(
+    delete: Callable[[str], Awaitable[None]],
+    file_ids: Iterable[str],
+    *,
+    label: str,
+    concurrency: int = DELETE_CONCURRENCY,
+) -> None:
+    """Delete files concurrently (bounded), logging failures instead of raising.
+
+    Server-side file TTLs are the backstop, so a failed delete never fails the
+    surrounding call.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _delete(file_id: str) -> None:
+        async with sem:
+            try:
+                await delete(file_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.debug(
+                    "%s cleanup failed for file_id=%s: %s", label, file_id, exc
+                )
+            else:
+                logger.debug("Deleted uploaded file: %s", file_id)
+
+    await asyncio.gather(*(_delete(file_id) for file_id in file_ids))
 
 
 def to_strict_schema(schema: dict[str, Any]) -> dict[str, Any]:
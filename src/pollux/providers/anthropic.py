@@ -15,6 +15,7 @@ from pollux.parts import build_shared_parts
 from pollux.providers import _compile
 from pollux.providers._errors import wrap_provider_error
 from pollux.providers._utils import (
+    delete_files_best_effort,
     jsonable_provider_artifact,
     merge_provider_options,
     to_strict_schema,
@@ -687,9 +688,10 @@ class AnthropicProvider:
         client = self._get_client()
 
         try:
+            # Hand the SDK the open file so multipart encoding streams it.
             with path.open("rb") as f:
                 result = await client.beta.files.upload(
-                    file=(path.name, f.read(), mime_type),
+                    file=(path.name, f, mime_type),
                     extra_headers={"anthropic-beta": "files-api-2025-04-14"},
                 )
 
@@ -737,15 +739,11 @@ class AnthropicProvider:
         self, handle: ProviderDeferredHandle
     ) -> None:
         """Best-effort cleanup for provider-owned deferred input files."""
-        for file_id in _provider_handle_owned_file_ids(handle):
-            try:
-                await self.delete_file(file_id)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                logger.debug(
-                    "Anthropic deferred cleanup failed for file_id=%s", file_id
-                )
+        await delete_files_best_effort(
+            self.delete_file,
+            _provider_handle_owned_file_ids(handle),
+            label="Anthropic deferred",
+        )
 
     async def aclose(self) -> None:
         """Close underlying async client resources."""
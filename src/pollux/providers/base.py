@@ -159,6 +159,15 @@ class CachingProvider(Protocol):
         ...
 
 
+@runtime_checkable
+class CacheRefreshingProvider(Protocol):
+    """Optional provider hook for extending a persistent cache's TTL."""
+
+    async def refresh_cache(self, name: str, *, ttl_seconds: int) -> None:
+        """Reset the cache's remaining lifetime to *ttl_seconds* from now."""
+        ...
+
+
 @runtime_checkable
 class CloseableProvider(Protocol):
     """Optional provider hook for releasing transport resources."""
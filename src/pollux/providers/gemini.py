@@ -18,7 +18,11 @@ from pollux.interaction.tools import ToolCallDelta
 from pollux.parts import build_shared_parts
 from pollux.providers import _compile
 from pollux.providers._errors import wrap_provider_error
-from pollux.providers._utils import jsonable_provider_artifact, merge_provider_options
+from pollux.providers._utils import (
+    delete_files_best_effort,
+    jsonable_provider_artifact,
+    merge_provider_options,
+)
 from pollux.providers.base import (
     DeferredItemStatus,
     ProviderCapabilities,
@@ -47,6 +51,8 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 _GEMINI_BATCH_INLINE_LIMIT_BYTES = 20_000_000
+#: Files API retention; uploaded files are deleted server-side after 48 hours.
+_GEMINI_FILE_TTL_SECONDS = 48 * 3600
 
 
 def _provider_hint_payload(
@@ -887,11 +893,17 @@ class GeminiProvider:
             if not isinstance(file_uri, str) or not file_uri:
                 raise APIError("Gemini upload did not return a file uri")
 
+            expires_at = _timestamp_or_none(getattr(result, "expiration_time", None))
             return ProviderFileAsset(
                 file_id=file_uri,
                 provider="gemini",
                 mime_type=mime_type,
                 file_name=file_name,
+                expires_at=(
+                    expires_at
+                    if expires_at is not None
+                    else time.time() + _GEMINI_FILE_TTL_SECONDS
+                ),
             )
         except asyncio.CancelledError:
             raise
@@ -976,6 +988,27 @@ class GeminiProvider:
                 message="Gemini cache creation failed",
             ) from e
 
+    async def refresh_cache(self, name: str, *, ttl_seconds: int) -> None:
+        """Extend a cached content entry's TTL."""
+        client = self._get_client()
+        from google.genai import types
+
+        try:
+            await client.aio.caches.update(
+                name=name,
+                config=types.UpdateCachedContentConfig(ttl=f"{ttl_seconds}s"),
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            raise wrap_provider_error(
+                e,
+                provider="gemini",
+                phase="cache",
+                allow_network_errors=False,
+                message="Gemini cache refresh failed",
+            ) from e
+
     async def delete_file(self, file_id: str) -> None:
         """Delete a previously uploaded file from Gemini storage."""
         client = self._get_client()
@@ -985,13 +1018,11 @@ class GeminiProvider:
         self, handle: ProviderDeferredHandle
     ) -> None:
         """Best-effort cleanup for provider-owned deferred input files."""
-        for file_id in _provider_handle_owned_file_ids(handle):
-            try:
-                await self.delete_file(file_id)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                logger.debug("Gemini deferred cleanup failed for file_id=%s", file_id)
+        await delete_files_best_effort(
+            self.delete_file,
+            _provider_handle_owned_file_ids(handle),
+            label="Gemini deferred",
+        )
 
     def _parse_inlined_batch_responses(
         self,
@@ -17,7 +17,6 @@ vary too much to query reliably).
 from __future__ import annotations
 
 import asyncio
-import base64
 from collections.abc import Mapping
 import json
 from typing import TYPE_CHECKING, Any, cast
@@ -46,7 +45,11 @@ from pollux.providers._openai_compat import (
     parse_usage,
     serialize_tool_calls,
 )
-from pollux.providers._utils import merge_provider_options, to_strict_schema
+from pollux.providers._utils import (
+    file_data_url,
+    merge_provider_options,
+    to_strict_schema,
+)
 from pollux.providers.base import ProviderCapabilities, ProviderReadiness
 from pollux.providers.models import (
     Message,
@@ -54,6 +57,7 @@ from pollux.providers.models import (
     ProviderResponse,
     ProviderStreamChunk,
 )
+from pollux.transport import httpx_client_options
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -63,6 +67,7 @@ if TYPE_CHECKING:
     from pollux.interaction.environment import EnvironmentSnapshot
     from pollux.interaction.input import Input
     from pollux.interaction.requirements import OutputRequirements
+    from pollux.transport import HttpTransport
 
 _DEFAULT_LOCAL_TIMEOUT_S = 300.0
 
@@ -76,16 +81,18 @@ class LocalProvider:
         api_key: str | None = None,
         *,
         timeout_s: float = _DEFAULT_LOCAL_TIMEOUT_S,
+        transport: HttpTransport | None = None,
     ) -> None:
         """Initialize with the server's base URL and an optional auth token.
 
         Most local servers ignore the Authorization header; some require
         *any* value. We default to the literal ``"local"`` so both cases
-        behave the same.
+        behave the same. *transport* tunes the HTTP connection pool.
         """
         self._base_url = base_url
         self._api_key = api_key or "local"
         self._timeout_s = timeout_s
+        self._transport = transport
         self._client: Any = None
 
     @property
@@ -118,9 +125,12 @@ class LocalProvider:
                     "Authorization": f"Bearer {self._api_key}",
                     "Content-Type": "application/json",
                 },
-                timeout=self._timeout_s,
-                limits=httpx.Limits(
-                    max_connections=None, max_keepalive_connections=None
+                **httpx_client_options(
+                    self._transport,
+                    timeout_s=self._timeout_s,
+                    default_limits=httpx.Limits(
+                        max_connections=None, max_keepalive_connections=None
+                    ),
                 ),
             )
         return cast("httpx.AsyncClient", self._client)
@@ -387,15 +397,14 @@ class LocalProvider:
 
     async def upload_file(self, path: Path, mime_type: str) -> ProviderFileAsset:
         """Inline local files for OpenAI-compatible Chat Completions."""
-        try:
-            data = path.read_bytes()
-        except Exception as exc:
-            raise _local_api_error(
-                f"Failed to read local file for inline input: {path}",
-                phase="upload",
-            ) from exc
-
         if _is_text_like_mime_type(mime_type):
+            try:
+                data = path.read_bytes()
+            except Exception as exc:
+                raise _local_api_error(
+                    f"Failed to read local file for inline input: {path}",
+                    phase="upload",
+                ) from exc
             try:
                 text = data.decode("utf-8")
             except UnicodeDecodeError as exc:
@@ -412,8 +421,15 @@ class LocalProvider:
             )
 
         if mime_type.startswith(("image/", "audio/")):
+            try:
+                data_url = file_data_url(path, mime_type)
+            except Exception as exc:
+                raise _local_api_error(
+                    f"Failed to read local file for inline input: {path}",
+                    phase="upload",
+                ) from exc
             return ProviderFileAsset(
-                file_id=_to_data_url(data, mime_type),
+                file_id=data_url,
                 provider="local",
                 mime_type=mime_type,
                 file_name=path.name,
@@ -639,12 +655,6 @@ def _is_text_like_mime_type(mime_type: str) -> bool:
     } or mime_type.endswith(("+json", "+xml"))
 
 
-def _to_data_url(data: bytes, mime_type: str) -> str:
-    """Encode raw file bytes as a base64 data URL."""
-    encoded = base64.b64encode(data).decode("ascii")
-    return f"data:{mime_type};base64,{encoded}"
-
-
 def _parse_response(
     data: Mapping[str, Any],
     *,
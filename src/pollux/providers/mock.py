@@ -111,3 +111,7 @@ class MockProvider:
     ) -> str:
         """Return a mock cache name."""
         return f"cachedContents/mock-{model}"
+
+    async def refresh_cache(self, name: str, *, ttl_seconds: int) -> None:
+        """Accept a mock cache TTL extension."""
+        _ = name, ttl_seconds
@@ -40,6 +40,8 @@ class ProviderFileAsset:
     mime_type: str
     file_name: str | None = None
     is_inline_fallback: bool = False
+    #: Unix timestamp after which the provider deletes the file, when known.
+    expires_at: float | None = None
 
 
 @dataclass(frozen=True)
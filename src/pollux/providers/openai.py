@@ -8,6 +8,7 @@ import io
 import json
 import logging
 from pathlib import Path
+import time
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
@@ -17,6 +18,7 @@ from pollux.parts import build_shared_parts
 from pollux.providers import _compile
 from pollux.providers._errors import wrap_provider_error
 from pollux.providers._utils import (
+    delete_files_best_effort,
     jsonable_provider_artifact,
     merge_provider_options,
     to_strict_schema,
@@ -47,6 +49,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+#: ``expires_after`` requested for uploaded files; they are deleted server-side
+#: after this many seconds even if cleanup never runs.
+_OPENAI_FILE_TTL_SECONDS = 86_400
+
 
 class OpenAIProvider:
     """OpenAI Responses API provider."""
@@ -633,14 +639,25 @@ class OpenAIProvider:
             result = await client.files.create(
                 file=path,
                 purpose="user_data",
-                expires_after={"anchor": "created_at", "seconds": 86_400},
+                expires_after={
+                    "anchor": "created_at",
+                    "seconds": _OPENAI_FILE_TTL_SECONDS,
+                },
             )
 
             file_id = getattr(result, "id", None)
             if not isinstance(file_id, str):
                 raise APIError("OpenAI upload did not return a file id")
+            expires_at = getattr(result, "expires_at", None)
             return ProviderFileAsset(
-                file_id=file_id, provider="openai", mime_type=mime_type
+                file_id=file_id,
+                provider="openai",
+                mime_type=mime_type,
+                expires_at=(
+                    float(expires_at)
+                    if isinstance(expires_at, (int, float))
+                    else time.time() + _OPENAI_FILE_TTL_SECONDS
+                ),
             )
         except asyncio.CancelledError:
             raise
@@ -685,13 +702,11 @@ class OpenAIProvider:
         self, handle: ProviderDeferredHandle
     ) -> None:
         """Best-effort cleanup for provider-owned input files after terminal batches."""
-        for file_id in _provider_handle_owned_file_ids(handle):
-            try:
-                await self.delete_file(file_id)
-            except asyncio.CancelledError:
-                raise
-            except Exception:
-                logger.debug("OpenAI deferred cleanup failed for file_id=%s", file_id)
+        await delete_files_best_effort(
+            self.delete_file,
+            _provider_handle_owned_file_ids(handle),
+            label="OpenAI deferred",
+        )
 
     def _build_responses_create_kwargs(
         self,
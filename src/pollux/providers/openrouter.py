@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 from collections.abc import Mapping
 from dataclasses import dataclass
 import json
@@ -31,7 +30,11 @@ from pollux.providers._openai_compat import (
     parse_usage,
     serialize_tool_calls,
 )
-from pollux.providers._utils import merge_provider_options, to_strict_schema
+from pollux.providers._utils import (
+    file_data_url,
+    merge_provider_options,
+    to_strict_schema,
+)
 from pollux.providers.base import ProviderCapabilities
 from pollux.providers.models import (
     Message,
@@ -39,6 +42,7 @@ from pollux.providers.models import (
     ProviderResponse,
     ProviderStreamChunk,
 )
+from pollux.transport import httpx_client_options
 
 _OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
 _OPENROUTER_METADATA_TTL_S = 300.0
@@ -53,6 +57,7 @@ if TYPE_CHECKING:
     from pollux.interaction.environment import EnvironmentSnapshot
     from pollux.interaction.input import Input
     from pollux.interaction.requirements import OutputRequirements
+    from pollux.transport import HttpTransport
 
 
 @dataclass(frozen=True)
@@ -67,9 +72,17 @@ class _OpenRouterModelMetadata:
 class OpenRouterProvider:
     """OpenRouter provider backed by the HTTP API."""
 
-    def __init__(self, api_key: str) -> None:
-        """Initialize with an API key."""
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        timeout_s: float = 300.0,
+        transport: HttpTransport | None = None,
+    ) -> None:
+        """Initialize with an API key; *transport* tunes the HTTP pool."""
         self.api_key = api_key
+        self._timeout_s = timeout_s
+        self._transport = transport
         self._client: Any = None
         self._metadata_by_model: dict[str, _OpenRouterModelMetadata] = {}
         self._metadata_expires_at = 0.0
@@ -97,7 +110,7 @@ class OpenRouterProvider:
                     "Authorization": f"Bearer {self.api_key}",
                     "Content-Type": "application/json",
                 },
-                timeout=300.0,
+                **httpx_client_options(self._transport, timeout_s=self._timeout_s),
             )
         return cast("httpx.AsyncClient", self._client)
 
@@ -321,7 +334,7 @@ class OpenRouterProvider:
             )
 
         try:
-            data_url = _to_data_url(path.read_bytes(), mime_type)
+            data_url = file_data_url(path, mime_type)
         except Exception as e:
             raise _openrouter_api_error(
                 f"Failed to read file for OpenRouter upload: {path}",
@@ -722,12 +735,6 @@ def _is_pdf_part(part: Any) -> bool:
     return False
 
 
-def _to_data_url(data: bytes, mime_type: str) -> str:
-    """Encode raw file bytes as a base64 data URL."""
-    encoded = base64.b64encode(data).decode("ascii")
-    return f"data:{mime_type};base64,{encoded}"
-
-
 def _pdf_filename(*, uri: str, file_name: str | None = None) -> str:
     """Return the filename OpenRouter expects for PDF content items."""
     if file_name:
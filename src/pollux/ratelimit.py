@@ -0,0 +1,202 @@
+"""Client-side rate limiting against provider RPM/TPM quotas.
+
+Provider quotas are per minute, so ``request_concurrency`` alone either leaves
+quota unused or overshoots into 429s. A :class:`RateLimit` on ``Config`` paces
+each generate call through process-wide token buckets instead: one for
+requests and one for estimated tokens, refilled continuously and reconciled
+against the usage each response reports. Configs that share provider, API
+key, model and limits share one budget, across ``Session`` instances too.
+
+Independently of any configured quota, a :class:`BackoffGate` per
+provider/key/model holds every new attempt once any call is told to back off
+with ``Retry-After``, so concurrent workers stop collecting their own 429s.
+Each caller waits only as long as its own retry policy allows; a longer pause
+fails the call at once with :class:`~pollux.errors.RateLimitError`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import hashlib
+import time
+from typing import TYPE_CHECKING
+
+from pollux.errors import APIError, RateLimitError
+
+if TYPE_CHECKING:
+    from pollux.config import Config
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Per-minute request and token quotas for one provider/model."""
+
+    #: Generate calls allowed per minute; *None* leaves requests unpaced.
+    requests_per_minute: float | None = None
+    #: Tokens (estimated input + ``max_tokens``) allowed per minute; *None*
+    #: leaves tokens unpaced.
+    tokens_per_minute: float | None = None
+    #: Characters per token used to estimate a request's input tokens.
+    chars_per_token: float = 4.0
+
+    def __post_init__(self) -> None:
+        """Validate quotas so the buckets always refill."""
+        if self.requests_per_minute is not None and self.requests_per_minute <= 0:
+            raise ValueError("RateLimit.requests_per_minute must be > 0 or None")
+        if self.tokens_per_minute is not None and self.tokens_per_minute <= 0:
+            raise ValueError("RateLimit.tokens_per_minute must be > 0 or None")
+        if self.chars_per_token <= 0:
+            raise ValueError("RateLimit.chars_per_token must be > 0")
+
+
+class _TokenBucket:
+    """Continuously refilled bucket holding up to one minute of quota.
+
+    Acquisition reserves immediately and may drive the balance negative; the
+    caller then sleeps until the debt is repaid. Reserving up front keeps
+    waiters roughly FIFO without a lock, so one bucket is safe to share across
+    event loops.
+    """
+
+    def __init__(self, per_minute: float) -> None:
+        self.capacity = float(per_minute)
+        self.rate_per_s = self.capacity / 60.0
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate_per_s)
+
+    async def acquire(self, amount: float) -> None:
+        """Take *amount* (capped at capacity), sleeping until it is covered."""
+        amount = min(amount, self.capacity)
+        self._refill()
+        self.tokens -= amount
+        if self.tokens >= 0:
+            return
+        try:
+            await asyncio.sleep(-self.tokens / self.rate_per_s)
+        except asyncio.CancelledError:
+            self.tokens += amount
+            raise
+
+    def adjust(self, delta: float) -> None:
+        """Charge (positive) or refund (negative) *delta* after the fact."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+class RateLimiter:
+    """Request and token buckets for one provider/model quota."""
+
+    def __init__(self, limit: RateLimit) -> None:
+        self.limit = limit
+        self._requests = (
+            _TokenBucket(limit.requests_per_minute)
+            if limit.requests_per_minute is not None
+            else None
+        )
+        self._tokens = (
+            _TokenBucket(limit.tokens_per_minute)
+            if limit.tokens_per_minute is not None
+            else None
+        )
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        """Wait until one request and *estimated_tokens* fit the quota."""
+        if self._requests is not None:
+            await self._requests.acquire(1)
+        if self._tokens is not None:
+            await self._tokens.acquire(estimated_tokens)
+
+    def settle(self, estimated_tokens: int, actual_tokens: int | None) -> None:
+        """Reconcile the token bucket with the usage the provider reported."""
+        if self._tokens is not None and actual_tokens is not None:
+            self._tokens.adjust(actual_tokens - estimated_tokens)
+
+
+def quota_scope(config: Config) -> tuple[str, str, str | None]:
+    """Return the (provider, api key digest, model) a provider quota applies to."""
+    key_digest = hashlib.sha256((config.api_key or "").encode()).hexdigest()[:16]
+    return config.provider, key_digest, config.model
+
+
+_limiters: dict[tuple[str, str, str | None, RateLimit], RateLimiter] = {}
+
+
+def rate_limiter_for(config: Config) -> RateLimiter | None:
+    """Return the process-wide limiter for *config*, or ``None`` when unset."""
+    limit = config.rate_limit
+    if limit is None:
+        return None
+    key = (*quota_scope(config), limit)
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limiter = _limiters[key] = RateLimiter(limit)
+    return limiter
+
+
+class BackoffGate:
+    """Shared pause honoring the latest server ``Retry-After`` for one scope."""
+
+    def __init__(self, *, provider: str | None = None) -> None:
+        self.provider = provider
+        self._until = 0.0
+
+    @property
+    def remaining_s(self) -> float:
+        """Seconds until new attempts may proceed (``0.0`` when open)."""
+        return max(0.0, self._until - time.monotonic())
+
+    def pause(self, seconds: float) -> None:
+        """Hold new attempts for *seconds*, never shortening an active pause."""
+        self._until = max(self._until, time.monotonic() + seconds)
+
+    def observe(self, exc: BaseException) -> None:
+        """Pause when *exc* carries a positive ``retry_after_s`` hint."""
+        if isinstance(exc, APIError):
+            retry_after = exc.retry_after_s
+            if isinstance(retry_after, int | float) and retry_after > 0:
+                self.pause(float(retry_after))
+
+    async def wait(self, max_wait_s: float | None = None) -> None:
+        """Sleep until the pause elapses; return at once when open.
+
+        Raises:
+            RateLimitError: If the pause would outlast *max_wait_s*, before
+                sleeping at all. It is not retryable: the caller's budget
+                cannot cover the wait.
+        """
+        limit = None if max_wait_s is None else time.monotonic() + max_wait_s
+        # Loop because another call may extend the pause while we sleep.
+        while (remaining := self.remaining_s) > 0:
+            if limit is not None and self._until > limit:
+                raise RateLimitError(
+                    f"Provider asked to back off for {remaining:.1f}s, longer "
+                    "than this call may wait",
+                    hint="Raise RetryPolicy.max_delay_s and max_elapsed_s to "
+                    "wait out Retry-After pauses, or retry later.",
+                    retryable=False,
+                    status_code=429,
+                    retry_after_s=remaining,
+                    provider=self.provider,
+                    phase="generate",
+                    error_category="rate_limit",
+                )
+            await asyncio.sleep(remaining)
+
+
+_gates: dict[tuple[str, str, str | None], BackoffGate] = {}
+
+
+def backoff_gate_for(config: Config) -> BackoffGate:
+    """Return the process-wide Retry-After gate for *config*'s provider scope."""
+    scope = quota_scope(config)
+    gate = _gates.get(scope)
+    if gate is None:
+        gate = _gates[scope] = BackoffGate(provider=config.provider)
+    return gate
@@ -0,0 +1,377 @@
+"""Response cache: replay identical requests instead of re-sending them.
+
+Nightly re-scoring, CI evals and pipeline retries send the same prompt, sources,
+requirements and model again and again. With a :class:`ResponseCache` on
+``Config``, core looks each call up by a request fingerprint before calling
+``Provider.generate`` and stores clean completions afterwards. Three backends
+ship: an in-process LRU, a SQLite file shared across processes, and a
+directory of JSON files. Each bounds its size and optionally expires entries.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import contextlib
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Protocol, TypeVar, runtime_checkable
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from pollux.config import Config
+    from pollux.interaction.environment import EnvironmentSnapshot
+    from pollux.interaction.input import Input
+    from pollux.interaction.requirements import OutputRequirements
+    from pollux.providers.models import ProviderResponse
+
+logger = logging.getLogger(__name__)
+
+#: Bump when the key payload or stored response shape changes incompatibly.
+_KEY_VERSION = 1
+
+#: Share of ``max_entries`` a directory trim frees, so the directory is listed
+#: once per that many new entries rather than on every write.
+_TRIM_HEADROOM = 0.1
+
+T = TypeVar("T")
+
+
+@runtime_checkable
+class ResponseCache(Protocol):
+    """Storage for serialized provider responses keyed by request fingerprint.
+
+    Values are the normalized response dicts produced by
+    :func:`pollux.providers.models.provider_response_to_dict`. Implementations
+    decide eviction and expiry; a missing or expired key returns ``None``.
+    """
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the stored response for *key*, or ``None``."""
+        ...
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store the response for *key*, replacing any previous value."""
+        ...
+
+
+def _validate_limits(ttl_s: float | None, max_entries: int | None) -> None:
+    if ttl_s is not None and ttl_s <= 0:
+        raise ValueError("ttl_s must be > 0 or None")
+    if max_entries is not None and max_entries < 1:
+        raise ValueError("max_entries must be >= 1 or None")
+
+
+class MemoryResponseCache:
+    """In-process :class:`ResponseCache` with LRU eviction.
+
+    Holds at most ``max_entries`` responses, evicting the least recently used;
+    entries older than ``ttl_s`` are dropped when read.
+    """
+
+    def __init__(self, *, max_entries: int = 1024, ttl_s: float | None = None) -> None:
+        _validate_limits(ttl_s, max_entries)
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the stored response for *key* unless it has expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if self.ttl_s is not None and time.time() - stored_at >= self.ttl_s:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        """Store *value*, evicting the least recently used entries over the cap."""
+        self._entries[key] = (time.time(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        """Return the number of stored responses, including expired ones."""
+        return len(self._entries)
+
+
+class SQLiteResponseCache:
+    """:class:`ResponseCache` backed by one SQLite file shared across processes.
+
+    Every worker on a host can point at the same path. Entries older than
+    ``ttl_s`` are dropped when read; past ``max_entries`` the least recently
+    read rows are deleted on write.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_entries: int | None = 100_000,
+        ttl_s: float | None = None,
+    ) -> None:
+        _validate_limits(ttl_s, max_entries)
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_used_at ON responses (used_at)"
+            )
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the stored response for *key* unless it has expired."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, stored_at = row
+            if self.ttl_s is not None and now - stored_at >= self.ttl_s:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._conn.execute(
+                "UPDATE responses SET used_at = ? WHERE key = ?", (now, key)
+            )
+        loaded: dict[str, Any] = json.loads(value)
+        return loaded
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        """Insert or replace *value*, then trim to ``max_entries``."""
+        now = time.time()
+        encoded = json.dumps(value, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, stored_at, used_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, encoded, now, now),
+            )
+            if self.max_entries is not None:
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY used_at DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class DirectoryResponseCache:
+    """:class:`ResponseCache` storing one JSON file per entry in a directory.
+
+    Suits caches that are synced or inspected as plain files (CI artifacts,
+    shared volumes). Writes are atomic renames. Entries older than ``ttl_s``
+    are dropped when read; past ``max_entries`` the least recently used files
+    are deleted on write, down to 90% of the cap so the directory is listed
+    only once per batch of new entries.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_entries: int | None = 10_000,
+        ttl_s: float | None = None,
+    ) -> None:
+        _validate_limits(ttl_s, max_entries)
+        self.path = Path(path).expanduser()
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        # Entries this instance believes are on disk; counted on first write
+        # and recounted on every trim, which also catches other writers.
+        self._count: int | None = None
+        self._count_lock = threading.Lock()
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the stored response for *key* unless it has expired."""
+        file = self._file(key)
+        try:
+            entry = json.loads(file.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        if self.ttl_s is not None and time.time() - entry["stored_at"] >= self.ttl_s:
+            file.unlink(missing_ok=True)
+            return None
+        # The modification time doubles as the LRU clock.
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(file)
+        response: dict[str, Any] = entry["response"]
+        return response
+
+    def set(self, key: str, value: dict[str, Any]) -> None:
+        """Write *value* atomically, then trim to ``max_entries``."""
+        file = self._file(key)
+        tmp = file.with_name(f".{file.name}.{os.getpid()}.{threading.get_ident()}")
+        entry = {"stored_at": time.time(), "response": value}
+        tmp.write_text(json.dumps(entry, separators=(",", ":")), encoding="utf-8")
+        added = not file.exists()
+        tmp.replace(file)
+        if self.max_entries is None:
+            return
+        with self._count_lock:
+            if self._count is None:
+                self._count = sum(1 for _ in self.path.glob("*.json"))
+            elif added:
+                self._count += 1
+            if self._count > self.max_entries:
+                keep = self.max_entries - int(self.max_entries * _TRIM_HEADROOM)
+                self._count = self._trim(max(1, keep))
+
+    def _trim(self, keep: int) -> int:
+        """Delete the least recently used files beyond *keep*; return the rest."""
+        by_age: list[tuple[float, Path]] = []
+        for file in self.path.glob("*.json"):
+            try:
+                by_age.append((file.stat().st_mtime, file))
+            except FileNotFoundError:
+                continue
+        if len(by_age) <= keep:
+            return len(by_age)
+        by_age.sort()
+        for _, file in by_age[: len(by_age) - keep]:
+            file.unlink(missing_ok=True)
+        return keep
+
+
+def response_cache_key(
+    snapshot: EnvironmentSnapshot,
+    inp: Input,
+    requirements: OutputRequirements,
+    config: Config,
+) -> str:
+    """Fingerprint one request: environment, input, requirements and model.
+
+    The environment contributes its :meth:`EnvironmentSnapshot.fingerprint`
+    (instructions, source content hashes, tools); the structured-output schema
+    contributes its hash. API keys are deliberately excluded so keys are never
+    written to a durable backend and accounts share deterministic answers.
+    """
+    payload = {
+        "version": _KEY_VERSION,
+        "provider": config.provider,
+        "model": config.model,
+        "base_url": config.base_url,
+        "environment": snapshot.fingerprint(),
+        "input": {
+            "content": inp.content,
+            "history": [m.to_jsonable() for m in inp.history or ()],
+            "continuation": (
+                inp.continuation.to_jsonable() if inp.continuation else None
+            ),
+            "tool_results": [r.to_jsonable() for r in inp.tool_results],
+        },
+        "requirements": {
+            "output_schema": requirements.output_schema_hash(),
+            "temperature": requirements.temperature,
+            "top_p": requirements.top_p,
+            "max_tokens": requirements.max_tokens,
+            "seed": requirements.seed,
+            "reasoning_effort": requirements.reasoning_effort,
+            "reasoning_budget_tokens": requirements.reasoning_budget_tokens,
+            "tool_choice": requirements.tool_choice,
+            "provider_options": requirements.provider_options_for(config.provider),
+        },
+    }
+    encoded = json.dumps(
+        payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True, default=str
+    ).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+async def _call_backend(cache: ResponseCache, fn: Callable[..., T], *args: Any) -> T:
+    """Run a backend method off the event loop unless it is in-process only."""
+    if isinstance(cache, MemoryResponseCache):
+        return fn(*args)
+    return await asyncio.to_thread(fn, *args)
+
+
+async def lookup_response(cache: ResponseCache, key: str) -> ProviderResponse | None:
+    """Return the cached response for *key*; backend failures count as misses.
+
+    File-backed and custom backends run in a worker thread so their I/O never
+    blocks the event loop.
+    """
+    try:
+        payload = await _call_backend(cache, cache.get, key)
+    except Exception as exc:
+        logger.debug("Response cache read failed key=%s…: %s", key[:8], exc)
+        return None
+    if payload is None:
+        return None
+    return _response_from_dict(payload)
+
+
+async def store_response(
+    cache: ResponseCache, key: str, response: ProviderResponse
+) -> None:
+    """Store *response* under *key*; backend failures are logged and ignored."""
+    from pollux.providers.models import provider_response_to_dict
+
+    try:
+        await _call_backend(cache, cache.set, key, provider_response_to_dict(response))
+    except Exception as exc:
+        logger.debug("Response cache write failed key=%s…: %s", key[:8], exc)
+
+
+def _response_from_dict(payload: dict[str, Any]) -> ProviderResponse:
+    """Rebuild a ``ProviderResponse`` from its normalized dict form."""
+    from pollux.providers.models import ProviderResponse, ToolCall
+
+    raw_tool_calls = payload.get("tool_calls")
+    tool_calls = (
+        [
+            ToolCall(
+                id=str(tc.get("id", "")),
+                name=str(tc.get("name", "")),
+                arguments=str(tc.get("arguments", "")),
+            )
+            for tc in raw_tool_calls
+            if isinstance(tc, dict)
+        ]
+        if isinstance(raw_tool_calls, list)
+        else None
+    )
+    usage = payload.get("usage")
+    return ProviderResponse(
+        text=str(payload.get("text", "")),
+        usage=dict(usage) if isinstance(usage, dict) else {},
+        reasoning=payload.get("reasoning"),
+        structured=payload.get("structured"),
+        tool_calls=tool_calls,
+        response_id=payload.get("response_id"),
+        finish_reason=payload.get("finish_reason"),
+        provider_state=payload.get("provider_state"),
+        artifacts=payload.get("artifacts"),
+    )
@@ -9,16 +9,26 @@ Design goals:
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
 import logging
 import random
 import time
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Literal, TypeVar
 
-from pollux.errors import APIError, walk_exception_chain
+from pollux.errors import (
+    APIError,
+    CircuitOpenError,
+    RateLimitError,
+    walk_exception_chain,
+)
+from pollux.ratelimit import quota_scope
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Iterator
+
+    from pollux.config import Config
 
 T = TypeVar("T")
 
@@ -39,6 +49,12 @@ class RetryPolicy:
     jitter: bool = True  # "full jitter" when enabled
     #: Wall-clock deadline across all attempts; *None* disables the deadline.
     max_elapsed_s: float | None = 15.0
+    #: Cap retries at this fraction of first attempts over ``budget_window_s``,
+    #: shared by every call in a run (or a ``Session``); *None* disables it.
+    budget_ratio: float | None = None
+    budget_window_s: float = 60.0
+    #: Retries always allowed per window, so small runs can still retry.
+    budget_min_retries: int = 10
 
     def __post_init__(self) -> None:
         """Validate invariants to keep retry behavior predictable."""
@@ -52,6 +68,198 @@ class RetryPolicy:
             raise ValueError("RetryPolicy.max_delay_s must be >= 0")
         if self.max_elapsed_s is not None and self.max_elapsed_s < 0:
             raise ValueError("RetryPolicy.max_elapsed_s must be >= 0 or None")
+        if self.budget_ratio is not None and self.budget_ratio < 0:
+            raise ValueError("RetryPolicy.budget_ratio must be >= 0 or None")
+        if self.budget_window_s <= 0:
+            raise ValueError("RetryPolicy.budget_window_s must be > 0")
+        if self.budget_min_retries < 0:
+            raise ValueError("RetryPolicy.budget_min_retries must be >= 0")
+
+
+class RetryBudget:
+    """Sliding-window cap on retries relative to first attempts.
+
+    Shared by all calls of a fan-out so a partial outage cannot multiply load
+    by ``max_attempts``: once retries in the window reach
+    ``max(budget_min_retries, budget_ratio * first_attempts)``, further
+    retries are refused and the failure surfaces immediately.
+    """
+
+    def __init__(self, ratio: float, *, window_s: float, min_retries: int) -> None:
+        self.ratio = ratio
+        self.window_s = window_s
+        self.min_retries = min_retries
+        self._attempts: deque[float] = deque()
+        self._retries: deque[float] = deque()
+
+    @classmethod
+    def from_policy(cls, policy: RetryPolicy) -> RetryBudget | None:
+        """Build the budget *policy* asks for, or ``None`` when unbudgeted."""
+        if policy.budget_ratio is None:
+            return None
+        return cls(
+            policy.budget_ratio,
+            window_s=policy.budget_window_s,
+            min_retries=policy.budget_min_retries,
+        )
+
+    def _prune(self, now: float) -> None:
+        horizon = now - self.window_s
+        for events in (self._attempts, self._retries):
+            while events and events[0] <= horizon:
+                events.popleft()
+
+    def record_attempt(self) -> None:
+        """Count one first attempt toward the budget."""
+        self._attempts.append(time.monotonic())
+
+    def try_spend(self) -> bool:
+        """Reserve one retry; return False when the budget is exhausted."""
+        now = time.monotonic()
+        self._prune(now)
+        allowed = max(self.min_retries, self.ratio * len(self._attempts))
+        if len(self._retries) >= allowed:
+            return False
+        self._retries.append(now)
+        return True
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    """When to stop calling a provider/model that keeps failing.
+
+    After ``failure_threshold`` consecutive retryable failures the circuit
+    opens and calls fail fast with :class:`~pollux.errors.CircuitOpenError`.
+    After ``reset_timeout_s`` it half-opens and lets ``half_open_probes`` calls
+    through; a probe success closes it, a probe failure reopens it. Rate limits
+    do not count: a provider answering 429 is up, and throttling is left to
+    retries, Retry-After and adaptive concurrency.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout_s: float = 30.0
+    half_open_probes: int = 1
+
+    def __post_init__(self) -> None:
+        """Validate thresholds so the circuit can always recover."""
+        if self.failure_threshold < 1:
+            raise ValueError("CircuitBreakerPolicy.failure_threshold must be >= 1")
+        if self.reset_timeout_s < 0:
+            raise ValueError("CircuitBreakerPolicy.reset_timeout_s must be >= 0")
+        if self.half_open_probes < 1:
+            raise ValueError("CircuitBreakerPolicy.half_open_probes must be >= 1")
+
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one provider/model scope."""
+
+    def __init__(self, policy: CircuitBreakerPolicy, *, provider: str) -> None:
+        self.policy = policy
+        self.provider = provider
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probes = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; ``open`` turns ``half_open`` once the timeout passes."""
+        if self._opened_at is None:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.policy.reset_timeout_s:
+            return "open"
+        return "half_open"
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """Admit one attempt or raise ``CircuitOpenError``; record its outcome.
+
+        Only failures :func:`should_retry_generate` would retry count toward
+        opening; any other outcome shows the provider is answering. A
+        :class:`~pollux.errors.RateLimitError` is no verdict either way.
+        """
+        probe = self._admit()
+        try:
+            yield
+        except RateLimitError:
+            self._release(probe=probe)
+            raise
+        except Exception as exc:
+            if should_retry_generate(exc):
+                self._on_failure(probe=probe)
+            else:
+                self._on_success(probe=probe)
+            raise
+        except BaseException:
+            # Cancelled mid-attempt: no verdict, but free the probe slot.
+            self._release(probe=probe)
+            raise
+        else:
+            self._on_success(probe=probe)
+
+    def _admit(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return False
+        if state == "half_open" and self._probes < self.policy.half_open_probes:
+            self._probes += 1
+            return True
+        opened_at = self._opened_at or 0.0
+        wait = max(0.0, self.policy.reset_timeout_s - (time.monotonic() - opened_at))
+        raise CircuitOpenError(
+            f"Circuit open for {self.provider} after "
+            f"{self.policy.failure_threshold} consecutive failures",
+            probe_after_s=wait,
+            hint=(
+                "The provider is failing repeatedly; calls fail fast until a "
+                f"probe succeeds (next probe in ~{wait:.0f}s)."
+            ),
+            provider=self.provider,
+            phase="generate",
+        )
+
+    def _release(self, *, probe: bool) -> None:
+        if probe:
+            self._probes -= 1
+
+    def _on_success(self, *, probe: bool) -> None:
+        self._release(probe=probe)
+        # A straggler admitted before the circuit opened says nothing about
+        # the provider now; only a half-open probe may close it.
+        if probe or self._opened_at is None:
+            self._failures = 0
+            self._opened_at = None
+
+    def _on_failure(self, *, probe: bool) -> None:
+        self._release(probe=probe)
+        if probe:
+            self._opened_at = time.monotonic()
+            return
+        self._failures += 1
+        if self._opened_at is None and self._failures >= self.policy.failure_threshold:
+            logger.warning(
+                "Opening circuit for %s after %d consecutive failures",
+                self.provider,
+                self._failures,
+            )
+            self._opened_at = time.monotonic()
+
+
+_breakers: dict[tuple[str, str, str | None, CircuitBreakerPolicy], CircuitBreaker] = {}
+
+
+def circuit_breaker_for(config: Config) -> CircuitBreaker | None:
+    """Return the process-wide breaker for *config*, or ``None`` when unset."""
+    policy = config.circuit_breaker
+    if policy is None:
+        return None
+    key = (*quota_scope(config), policy)
+    breaker = _breakers.get(key)
+    if breaker is None:
+        breaker = _breakers[key] = CircuitBreaker(policy, provider=config.provider)
+    return breaker
 
 
 def _retry_after_from_error(exc: BaseException) -> float | None:
@@ -144,14 +352,18 @@ async def retry_async(
     *,
     policy: RetryPolicy,
     should_retry: Callable[[BaseException], bool] = should_retry_generate,
+    budget: RetryBudget | None = None,
 ) -> T:
     """Run an async factory with bounded retries.
 
     The *should_retry* callback controls which exceptions are retried;
-    non-retryable exceptions propagate immediately.
+    non-retryable exceptions propagate immediately. A shared *budget* refuses
+    retries once the fan-out has spent its share, failing fast instead.
     """
     start = time.monotonic()
     last_exc: BaseException | None = None
+    if budget is not None:
+        budget.record_attempt()
 
     for attempt in range(1, policy.max_attempts + 1):
         try:
@@ -174,6 +386,12 @@ async def retry_async(
                     raise
                 delay = min(delay, remaining)
 
+            if budget is not None and not budget.try_spend():
+                logger.debug(
+                    "Retry budget exhausted; not retrying %s", type(exc).__name__
+                )
+                raise
+
             logger.debug(
                 "Retrying after %s (attempt %d/%d, delay %.2fs)",
                 type(exc).__name__,
@@ -0,0 +1,151 @@
+"""Session-wide priority scheduling for provider calls.
+
+A ``Session`` shared by interactive ``interact()`` traffic and bulk
+``run_many()`` jobs would otherwise run one FIFO semaphore per call, so a large
+batch starves interactive turns. With ``Session(max_concurrency=...)`` every
+entry point draws from one :class:`SessionScheduler` instead: calls queue by
+priority class and freed slots go to the class with the earliest virtual start
+time (start-time fair queuing), so each class gets throughput in proportion to
+its weight while none is starved.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+import time
+from typing import TYPE_CHECKING, Literal, get_args
+
+from pollux.errors import ConfigurationError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Mapping
+
+#: Priority class of a scheduled call.
+Priority = Literal["interactive", "batch"]
+
+_PRIORITIES: tuple[Priority, ...] = get_args(Priority)
+
+#: Default share of freed slots: interactive calls get four for every batch one.
+DEFAULT_PRIORITY_WEIGHTS: dict[Priority, float] = {"interactive": 4.0, "batch": 1.0}
+
+
+@dataclass(frozen=True)
+class SchedulerStats:
+    """Point-in-time view of a session scheduler, per priority class."""
+
+    limit: int
+    in_flight: int
+    queued: Mapping[Priority, int]
+    #: Calls admitted so far.
+    served: Mapping[Priority, int]
+    #: Mean and worst time calls spent queued before admission.
+    mean_wait_s: Mapping[Priority, float]
+    max_wait_s: Mapping[Priority, float]
+
+
+class SessionScheduler:
+    """Weighted fair queue of call slots shared by a session's entry points."""
+
+    def __init__(
+        self, limit: int, *, weights: Mapping[Priority, float] | None = None
+    ) -> None:
+        if not isinstance(limit, int) or limit < 1:
+            raise ConfigurationError(
+                f"max_concurrency must be an integer ≥ 1, got {limit!r}",
+                hint="This caps concurrent API calls across the whole Session.",
+            )
+        merged = {**DEFAULT_PRIORITY_WEIGHTS, **(weights or {})}
+        for name, weight in merged.items():
+            if name not in _PRIORITIES or weight <= 0:
+                raise ConfigurationError(
+                    f"Invalid priority weight {name!r}={weight!r}",
+                    hint="Weights are positive numbers keyed by 'interactive' "
+                    "and/or 'batch'.",
+                )
+        self.limit = limit
+        self._weights: dict[Priority, float] = merged
+        self._queues: dict[Priority, deque[asyncio.Future[None]]] = {
+            p: deque() for p in _PRIORITIES
+        }
+        self._inflight = 0
+        # Start-time fair queuing: each class's next virtual start time, and
+        # the virtual clock (start time of the last admitted call).
+        self._vstart: dict[Priority, float] = dict.fromkeys(_PRIORITIES, 0.0)
+        self._clock = 0.0
+        self._served: dict[Priority, int] = dict.fromkeys(_PRIORITIES, 0)
+        self._wait_total: dict[Priority, float] = dict.fromkeys(_PRIORITIES, 0.0)
+        self._wait_max: dict[Priority, float] = dict.fromkeys(_PRIORITIES, 0.0)
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority) -> AsyncIterator[None]:
+        """Hold one session-wide call slot at *priority*."""
+        if priority not in _PRIORITIES:
+            raise ConfigurationError(
+                f"Unknown priority: {priority!r}",
+                hint="Use priority='interactive' or priority='batch'.",
+            )
+        enqueued = time.monotonic()
+        await self._acquire(priority)
+        waited = time.monotonic() - enqueued
+        self._wait_total[priority] += waited
+        self._wait_max[priority] = max(self._wait_max[priority], waited)
+        try:
+            yield
+        finally:
+            self._inflight -= 1
+            self._dispatch()
+
+    def stats(self) -> SchedulerStats:
+        """Return queue depth, admissions, and wait times per priority class."""
+        return SchedulerStats(
+            limit=self.limit,
+            in_flight=self._inflight,
+            queued={p: len(q) for p, q in self._queues.items()},
+            served=dict(self._served),
+            mean_wait_s={
+                p: (self._wait_total[p] / n if (n := self._served[p]) else 0.0)
+                for p in _PRIORITIES
+            },
+            max_wait_s=dict(self._wait_max),
+        )
+
+    async def _acquire(self, priority: Priority) -> None:
+        if self._inflight < self.limit and not any(self._queues.values()):
+            self._admit(priority)
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._queues[priority].append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Admitted just as we were cancelled: pass the slot on.
+                self._inflight -= 1
+                self._dispatch()
+            else:
+                self._queues[priority].remove(waiter)
+            raise
+
+    def _admit(self, priority: Priority) -> None:
+        self._inflight += 1
+        self._served[priority] += 1
+        # A class returning from idle starts at the current clock rather than
+        # cashing in credit for the time it had nothing queued.
+        start = max(self._vstart[priority], self._clock)
+        self._clock = start
+        self._vstart[priority] = start + 1.0 / self._weights[priority]
+
+    def _dispatch(self) -> None:
+        while self._inflight < self.limit:
+            ready = [p for p in _PRIORITIES if self._queues[p]]
+            if not ready:
+                return
+            priority = min(ready, key=lambda p: max(self._vstart[p], self._clock))
+            waiter = self._queues[priority].popleft()
+            if waiter.done():
+                continue
+            self._admit(priority)
+            waiter.set_result(None)
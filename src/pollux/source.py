@@ -2,24 +2,119 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Callable  # noqa: TC003 - used at runtime in dataclass
-from dataclasses import dataclass, replace
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
 import hashlib
 import json
 import mimetypes
+import mmap
+import os
 from pathlib import Path
 import re
-from typing import Any, Literal
+import threading
+from typing import TYPE_CHECKING, Any, Literal
 from urllib.parse import urlparse
 
 from pollux.errors import SourceError
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 SourceType = Literal["text", "file", "youtube", "arxiv", "uri", "json"]
 _ARXIV_HOSTS = {"arxiv.org", "www.arxiv.org"}
 _ARXIV_ID_RE = re.compile(
     r"^(?:\d{4}\.\d{4,5}(?:v\d+)?|[a-z\-]+(?:\.[a-z\-]+)?/\d{7}(?:v\d+)?)$",
     re.IGNORECASE,
 )
+_HASH_CHUNK_BYTES = 1024 * 1024
+# Local files whose digests are remembered process-wide, least recently used
+# dropped first.
+_FILE_DIGESTS_MAX = 1024
+
+
+def sha256_file(path: str | Path) -> str:
+    """Hash a file in fixed-size chunks so large files never load whole."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@contextmanager
+def map_file(path: str | Path) -> Iterator[mmap.mmap | bytes]:
+    """Map a file read-only so consumers can slice it without a full copy.
+
+    Pages are loaded on demand and backed by the page cache, so encoders and
+    hashers can walk multi-GB media incrementally. Empty files yield ``b""``
+    because zero-length mappings are not allowed.
+    """
+    with Path(path).open("rb") as f:
+        if Path(path).stat().st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+
+
+class _ContentDigest:
+    """Memoized SHA-256 of one Source's content.
+
+    In-memory content is hashed once. File content is re-hashed only when the
+    file's ``(st_size, st_mtime_ns, st_ino)`` stamp changes.
+    """
+
+    __slots__ = ("_digest", "_stamped", "path")
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._digest: str | None = None
+        # ``(stamp, digest)`` as one value so concurrent readers never pair a
+        # stamp with another version's digest.
+        self._stamped: tuple[tuple[int, int, int], str] | None = None
+
+    def get(self, loader: Callable[[], bytes]) -> str:
+        """Return the memoized digest, computing it when missing or stale."""
+        if self.path is None:
+            if self._digest is None:
+                self._digest = hashlib.sha256(loader()).hexdigest()
+            return self._digest
+
+        st = self.path.stat()
+        stamp = (st.st_size, st.st_mtime_ns, st.st_ino)
+        stamped = self._stamped
+        if stamped is None or stamped[0] != stamp:
+            stamped = self._stamped = (stamp, sha256_file(self.path))
+        return stamped[1]
+
+
+_file_digests: OrderedDict[str, _ContentDigest] = OrderedDict()
+_file_digests_lock = threading.Lock()
+
+
+def _file_digest(path: str | Path) -> _ContentDigest:
+    """Return the process-wide digest memo for the file at *path*."""
+    key = os.fspath(path)
+    with _file_digests_lock:
+        digest = _file_digests.get(key)
+        if digest is None:
+            digest = _file_digests[key] = _ContentDigest(Path(path))
+            while len(_file_digests) > _FILE_DIGESTS_MAX:
+                _file_digests.popitem(last=False)
+        else:
+            _file_digests.move_to_end(key)
+        return digest
+
+
+def cached_sha256_file(path: str | Path) -> str:
+    """Return :func:`sha256_file` of *path*, re-hashing only after it changes.
+
+    Digests are shared by every :class:`Source` and upload of the same path
+    and recomputed when the file's stat stamp moves.
+    """
+    return _file_digest(path).get(Path(path).read_bytes)
 
 
 @dataclass(frozen=True, slots=True)
@@ -45,6 +140,9 @@ class Source:
     size_bytes: int
     content_loader: Callable[[], bytes]
     provider_hints: tuple[ProviderHint, ...] = ()
+    _digest: _ContentDigest = field(
+        default_factory=_ContentDigest, repr=False, compare=False
+    )
 
     @classmethod
     def from_text(cls, text: str, *, identifier: str | None = None) -> Source:
@@ -116,6 +214,7 @@ class Source:
             mime_type=mt,
             size_bytes=size,
             content_loader=loader,
+            _digest=_file_digest(p),
         )
 
     @classmethod
@@ -200,9 +299,8 @@ class Source:
         return f"https://arxiv.org/pdf/{arxiv_id}.pdf"
 
     def _content_hash(self) -> str:
-        """Compute SHA256 hash of raw content bytes."""
-        content = self.content_loader()
-        return hashlib.sha256(content).hexdigest()
+        """Return the SHA256 hash of raw content bytes (memoized per Source)."""
+        return self._digest.get(self.content_loader)
 
     def gemini_video_settings_for(
         self, provider: str | None
@@ -0,0 +1,208 @@
+"""Preflight token estimation against model context windows.
+
+A provider reports a context overflow only after it has received the whole
+request, often after Pollux has uploaded its files. With a
+:class:`TokenPreflight` on ``Config``, core estimates each call's input tokens
+locally before any upload and raises :class:`~pollux.errors.ContextOverflowError`
+when the estimate exceeds the model's context window. The estimate is also
+reported as ``Output.metrics.estimated_input_tokens``.
+
+Text is counted by a per-provider :class:`Tokenizer` when one is registered,
+else by a characters-per-token heuristic. Binary media (PDFs, images, audio,
+video) and remote sources carry no reliable local signal and count as zero, so
+the estimate is a lower bound: preflight rejects only requests that cannot fit.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import math
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
+
+from pollux.errors import ContextOverflowError
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from pollux.config import Config
+    from pollux.interaction.environment import EnvironmentSnapshot
+    from pollux.interaction.input import Input
+    from pollux.source import Source
+
+#: Context windows in tokens, matched by longest model-name prefix after any
+#: ``vendor/`` routing prefix (``"anthropic/claude-sonnet-4.5"``) is dropped.
+#: Models not listed are not checked unless ``TokenPreflight.context_window``
+#: is set.
+CONTEXT_WINDOWS: dict[str, int] = {
+    "gemini-3": 1_048_576,
+    "gemini-2.5": 1_048_576,
+    "gemini-2.0": 1_048_576,
+    "gemini-1.5-pro": 2_097_152,
+    "gemini-1.5-flash": 1_048_576,
+    "gpt-5": 400_000,
+    "gpt-4.1": 1_047_576,
+    "gpt-4o": 128_000,
+    "o3": 200_000,
+    "o4-mini": 200_000,
+    "claude-": 200_000,
+}
+
+
+@runtime_checkable
+class Tokenizer(Protocol):
+    """Counts the tokens a provider's model would see for a piece of text."""
+
+    def count_tokens(self, text: str) -> int:
+        """Return the token count of *text*."""
+        ...
+
+
+@dataclass(frozen=True)
+class HeuristicTokenizer:
+    """Fast :class:`Tokenizer` that divides character count by a fixed ratio."""
+
+    chars_per_token: float = 4.0
+
+    def __post_init__(self) -> None:
+        """Validate the ratio."""
+        if self.chars_per_token <= 0:
+            raise ValueError("HeuristicTokenizer.chars_per_token must be > 0")
+
+    def count_tokens(self, text: str) -> int:
+        """Return ``ceil(len(text) / chars_per_token)``."""
+        return math.ceil(len(text) / self.chars_per_token)
+
+
+@dataclass(frozen=True)
+class TokenPreflight:
+    """Estimate input tokens before sending and reject context overflows."""
+
+    #: Tokenizers keyed by provider name (``"openai"``, ``"local"``, ...).
+    #: Providers without one use the heuristic.
+    tokenizers: Mapping[str, Tokenizer] = field(default_factory=dict)
+    #: Characters per token for the heuristic fallback.
+    chars_per_token: float = 4.0
+    #: Context window in tokens; looked up in :data:`CONTEXT_WINDOWS` by model
+    #: when *None*.
+    context_window: int | None = None
+    #: Raise ``ContextOverflowError`` for estimates over the window; when
+    #: *False*, estimates are only reported on ``Output.metrics``.
+    reject: bool = True
+
+    def __post_init__(self) -> None:
+        """Validate the ratio, window and tokenizers."""
+        if self.chars_per_token <= 0:
+            raise ValueError("TokenPreflight.chars_per_token must be > 0")
+        if self.context_window is not None and self.context_window < 1:
+            raise ValueError("TokenPreflight.context_window must be >= 1 or None")
+        for provider, tokenizer in self.tokenizers.items():
+            if not isinstance(tokenizer, Tokenizer):
+                raise ValueError(
+                    f"TokenPreflight.tokenizers[{provider!r}] must implement "
+                    "count_tokens(text)"
+                )
+
+
+def context_window_for(model: str | None) -> int | None:
+    """Return the context window for *model* from :data:`CONTEXT_WINDOWS`."""
+    if not model:
+        return None
+    name = model.rsplit("/", 1)[-1].lower()
+    matches = [prefix for prefix in CONTEXT_WINDOWS if name.startswith(prefix)]
+    if not matches:
+        return None
+    return CONTEXT_WINDOWS[max(matches, key=len)]
+
+
+def _is_text_like(mime_type: str) -> bool:
+    """Return True when a source's bytes are text the model reads as text."""
+    if mime_type.startswith("text/"):
+        return True
+    return mime_type in {
+        "application/csv",
+        "application/json",
+        "application/xml",
+        "application/yaml",
+        "application/x-yaml",
+        "application/javascript",
+    } or mime_type.endswith(("+json", "+xml"))
+
+
+class TokenEstimator:
+    """Input-token estimates for the calls of one planned environment.
+
+    The environment (instructions, tools, sources) is counted once; each
+    input adds its own content, prior turns and tool results.
+    """
+
+    def __init__(self, snapshot: EnvironmentSnapshot, config: Config) -> None:
+        """Count the environment's share of every call."""
+        preflight = config.preflight or TokenPreflight()
+        self._tokenizer = preflight.tokenizers.get(config.provider)
+        self._heuristic = HeuristicTokenizer(preflight.chars_per_token)
+        self._provider = config.provider
+        self.reject = preflight.reject
+        self.context_window = preflight.context_window or context_window_for(
+            config.model
+        )
+        self.environment_tokens = self._count(snapshot.instructions or "")
+        for tool in snapshot.tools:
+            self.environment_tokens += self._count(
+                f"{tool.name}\n{tool.description}\n"
+                + json.dumps(tool.parameters, separators=(",", ":"))
+            )
+        for source in snapshot.sources:
+            self.environment_tokens += self._count_source(source)
+
+    def _count(self, text: str) -> int:
+        if not text:
+            return 0
+        tokenizer = self._tokenizer or self._heuristic
+        return tokenizer.count_tokens(text)
+
+    def _count_source(self, source: Source) -> int:
+        if source.source_type not in {"text", "json", "file"}:
+            return 0
+        if not _is_text_like(source.mime_type):
+            return 0
+        if self._tokenizer is None:
+            # Bytes approximate characters; avoids reading large files.
+            return math.ceil(source.size_bytes / self._heuristic.chars_per_token)
+        return self._count(source.content_loader().decode("utf-8", errors="replace"))
+
+    def estimate(self, inp: Input) -> int:
+        """Return the estimated input tokens of one call."""
+        tokens = self.environment_tokens + self._count(inp.content or "")
+        messages = inp.continuation.messages if inp.continuation else inp.history
+        for message in messages or ():
+            tokens += self._count(message.content)
+            for call in message.tool_calls:
+                tokens += self._count(call.arguments_text)
+        for result in inp.tool_results:
+            tokens += self._count(result.content)
+        return tokens
+
+    def check(self, inp: Input, *, call_idx: int | None = None) -> int:
+        """Estimate one call, raising when it cannot fit the context window.
+
+        Raises:
+            ContextOverflowError: If rejection is on and the estimate exceeds
+                the known context window.
+        """
+        tokens = self.estimate(inp)
+        window = self.context_window
+        if self.reject and window is not None and tokens > window:
+            raise ContextOverflowError(
+                f"Estimated {tokens:,} input tokens exceed the {window:,}-token "
+                "context window",
+                n_tokens=tokens,
+                n_ctx=window,
+                hint="Trim sources or history, switch to a longer-context model, "
+                "or set TokenPreflight(reject=False) to send anyway.",
+                retryable=False,
+                provider=self._provider,
+                phase="preflight",
+                call_idx=call_idx,
+            )
+        return tokens
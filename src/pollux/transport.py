@@ -0,0 +1,133 @@
+"""HTTP transport tuning for providers that own their httpx client.
+
+The local OpenAI-compatible and OpenRouter providers talk HTTP through their
+own ``httpx.AsyncClient``. An :class:`HttpTransport` on ``Config`` sizes its
+connection pool, enables HTTP/2 multiplexing, splits connect/read timeouts,
+or injects a shared ``httpx`` transport so several clients reuse one set of
+sockets. SDK-backed providers (Gemini, OpenAI, Anthropic) manage their own
+transport and ignore it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import functools
+import importlib.util
+from typing import TYPE_CHECKING, Any
+
+from pollux.errors import ConfigurationError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import httpx
+
+
+@dataclass(frozen=True)
+class HttpTransport:
+    """Connection-pool and protocol settings for httpx-backed providers."""
+
+    #: Negotiate HTTP/2 so concurrent calls multiplex over few connections.
+    #: Requires the ``h2`` package (``pip install "httpx[http2]"``).
+    http2: bool = False
+    #: Open connections allowed at once; *None* for unbounded.
+    max_connections: int | None = 100
+    #: Idle connections kept for reuse; *None* for unbounded. Size this to
+    #: ``request_concurrency`` so a fan-out does not churn sockets.
+    max_keepalive_connections: int | None = 20
+    #: Seconds an idle connection is kept; *None* to keep it indefinitely.
+    keepalive_expiry_s: float | None = 5.0
+    #: Connect timeout; *None* falls back to ``Config.request_timeout_s``.
+    connect_timeout_s: float | None = None
+    #: Per-read timeout; *None* falls back to ``Config.request_timeout_s``.
+    read_timeout_s: float | None = None
+    #: Shared ``httpx.AsyncBaseTransport`` used instead of a per-client
+    #: connection pool; the pool, HTTP/2 and keepalive settings above are
+    #: then the transport's own. Pollux never closes it.
+    transport: httpx.AsyncBaseTransport | None = None
+
+    def __post_init__(self) -> None:
+        """Validate limits and timeouts."""
+        if self.max_connections is not None and self.max_connections < 1:
+            raise ValueError("HttpTransport.max_connections must be >= 1 or None")
+        if (
+            self.max_keepalive_connections is not None
+            and self.max_keepalive_connections < 0
+        ):
+            raise ValueError(
+                "HttpTransport.max_keepalive_connections must be >= 0 or None"
+            )
+        for name in ("keepalive_expiry_s", "connect_timeout_s", "read_timeout_s"):
+            value = getattr(self, name)
+            if value is not None and value <= 0:
+                raise ValueError(f"HttpTransport.{name} must be > 0 or None")
+
+
+def httpx_client_options(
+    settings: HttpTransport | None,
+    *,
+    timeout_s: float,
+    default_limits: httpx.Limits | None = None,
+) -> dict[str, Any]:
+    """Return ``httpx.AsyncClient`` keyword arguments for *settings*.
+
+    Without *settings* the client keeps the provider's *default_limits* (or
+    httpx's own) and a flat *timeout_s*.
+    """
+    import httpx
+
+    if settings is None:
+        options: dict[str, Any] = {"timeout": timeout_s}
+        if default_limits is not None:
+            options["limits"] = default_limits
+        return options
+
+    if (
+        settings.http2
+        and settings.transport is None
+        and importlib.util.find_spec("h2") is None
+    ):
+        raise ConfigurationError(
+            "HttpTransport(http2=True) requires the 'h2' package",
+            hint='Install it with pip install "httpx[http2]", or set http2=False.',
+        )
+    options = {
+        "timeout": httpx.Timeout(
+            timeout_s,
+            connect=settings.connect_timeout_s or timeout_s,
+            read=settings.read_timeout_s or timeout_s,
+        ),
+        "limits": httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry_s,
+        ),
+        "http2": settings.http2,
+    }
+    if settings.transport is not None:
+        options["transport"] = _shared_transport_class()(settings.transport)
+    return options
+
+
+@functools.cache
+def _shared_transport_class() -> Callable[
+    [httpx.AsyncBaseTransport], httpx.AsyncBaseTransport
+]:
+    """Build (once, importing httpx lazily) a wrapper that ignores ``aclose``.
+
+    ``AsyncClient.aclose`` closes its transport; a shared one must outlive
+    every client that borrows it.
+    """
+    import httpx
+
+    class _SharedTransport(httpx.AsyncBaseTransport):
+        def __init__(self, inner: httpx.AsyncBaseTransport) -> None:
+            self._inner = inner
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            return await self._inner.handle_async_request(request)
+
+        async def aclose(self) -> None:
+            return None
+
+    return _SharedTransport
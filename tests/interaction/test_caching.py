@@ -8,11 +8,16 @@ front-loads that work; ``run``/``run_many`` accept the prepared environment.
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass, field
+import threading
+import time
 from typing import TYPE_CHECKING
 
 import pytest
 
 import pollux
+import pollux.cache
 from pollux.cache import _registry
 from pollux.config import Config
 from pollux.errors import ConfigurationError
@@ -117,6 +122,107 @@ async def test_persistent_cache_reused_across_separate_calls(monkeypatch):
     assert provider.cache_calls == 1
 
 
+@pytest.mark.asyncio
+async def test_hot_cache_near_expiry_is_refreshed_once(monkeypatch):
+    """refresh_before_s extends a cache used close to expiry, single-flighted."""
+
+    @dataclass
+    class _Provider(FakeProvider):
+        refreshed: list[tuple[str, int]] = field(default_factory=list)
+
+        async def refresh_cache(self, name: str, *, ttl_seconds: int) -> None:
+            await asyncio.sleep(0)
+            self.refreshed.append((name, ttl_seconds))
+
+    provider = _Provider()
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: provider)
+    environment = Environment(
+        sources=[Source.from_text("SHARED CONTEXT")],
+        cache=CachePolicy(ttl_seconds=600, refresh_before_s=120),
+    )
+
+    await pollux.run("Q1", environment=environment, config=_cfg())
+    assert provider.refreshed == []  # fresh caches are not extended
+
+    ((key, (name, _)),) = _registry._entries.items()
+    _registry._entries[key] = (name, time.time() + 60)
+    await asyncio.gather(
+        *(pollux.run(f"Q{i}", environment=environment, config=_cfg()) for i in range(3))
+    )
+
+    assert provider.cache_calls == 1
+    assert provider.refreshed == [(name, 600)]
+    assert _registry._entries[key][1] > time.time() + 500
+
+
+@pytest.mark.asyncio
+async def test_cache_registry_path_survives_a_process_restart(monkeypatch, tmp_path):
+    """A durable registry lets a fresh process reuse a still-live provider cache."""
+    provider = FakeProvider()
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: provider)
+    cfg = Config(
+        provider="gemini",
+        model=GEMINI_MODEL,
+        use_mock=True,
+        cache_registry_path=tmp_path / "caches.sqlite",
+    )
+    environment = Environment(
+        sources=[Source.from_text("SHARED CONTEXT")],
+        cache=CachePolicy(ttl_seconds=600),
+    )
+
+    await pollux.run("Q1", environment=environment, config=cfg)
+    # Simulate a restart: in-memory state and open stores are gone.
+    _registry._entries.clear()
+    for store in pollux.cache._stores.values():
+        store.close()
+    pollux.cache._stores.clear()
+    out = await pollux.run("Q2", environment=environment, config=cfg)
+
+    assert provider.cache_calls == 1
+    assert out.metrics.cache_mode == "persistent"
+
+
+@pytest.mark.asyncio
+async def test_cache_registry_store_io_runs_off_the_event_loop(monkeypatch, tmp_path):
+    """Durable-store reads and writes never block the event loop thread."""
+    provider = FakeProvider()
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: provider)
+    path = (tmp_path / "caches.sqlite").resolve()
+    store = pollux.cache.SQLiteCacheStore(path)
+    threads: list[int] = []
+
+    def _load(key: str) -> tuple[str, float] | None:
+        threads.append(threading.get_ident())
+        return pollux.cache.SQLiteCacheStore.load(store, key)
+
+    def _save(key: str, value: tuple[str, float]) -> None:
+        threads.append(threading.get_ident())
+        pollux.cache.SQLiteCacheStore.save(store, key, value)
+
+    monkeypatch.setattr(store, "load", _load)
+    monkeypatch.setattr(store, "save", _save)
+    monkeypatch.setitem(pollux.cache._stores, path, store)
+    cfg = Config(
+        provider="gemini",
+        model=GEMINI_MODEL,
+        use_mock=True,
+        cache_registry_path=path,
+    )
+    environment = Environment(
+        sources=[Source.from_text("SHARED CONTEXT")],
+        cache=CachePolicy(ttl_seconds=600),
+    )
+
+    try:
+        await pollux.run("Q1", environment=environment, config=cfg)
+    finally:
+        store.close()
+
+    assert threads
+    assert threading.get_ident() not in threads
+
+
 @pytest.mark.asyncio
 async def test_prepare_environment_creates_cache_eagerly(monkeypatch):
     """prepare_environment front-loads cache creation; later runs reuse it."""
@@ -6,19 +6,42 @@ it produces `Output`/`OutputCollection` natively.
 
 from __future__ import annotations
 
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any
+
 import pytest
 
 import pollux
+from pollux.concurrency import global_limiter_for
 from pollux.config import Config
+from pollux.errors import ContextOverflowError
+from pollux.hedge import HedgePolicy, hedger_for
 from pollux.interaction.environment import Environment
-from pollux.interaction.execute import execute_interaction, execute_interactions
+from pollux.interaction.execute import (
+    execute_interaction,
+    execute_interactions,
+    iter_interactions,
+)
 from pollux.interaction.input import Input
 from pollux.interaction.output import Output
 from pollux.interaction.requirements import OutputRequirements
+from pollux.interaction.tools import ToolDeclaration
 from pollux.providers.models import ProviderResponse, ToolCall
+from pollux.response_cache import (
+    DirectoryResponseCache,
+    MemoryResponseCache,
+    ResponseCache,
+    SQLiteResponseCache,
+)
+from pollux.source import Source
+from pollux.tokens import TokenPreflight, context_window_for
 from tests.conftest import ANTHROPIC_MODEL, FakeProvider
 from tests.helpers import ScriptedProvider
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 pytestmark = pytest.mark.integration
 
 
@@ -108,3 +131,384 @@ async def test_execute_interactions_collection():
     assert collection.answers == ["ok:Q1", "ok:Q2"]
     assert collection.status == "ok"
     assert len(collection.outputs) == 2
+
+
+@pytest.mark.asyncio
+async def test_iter_interactions_pulls_lazy_inputs_within_a_bounded_window():
+    release = asyncio.Event()
+    pulled = 0
+
+    class _Provider(FakeProvider):
+        async def generate(self, snapshot, input, requirements, config):
+            await release.wait()
+            return await super().generate(snapshot, input, requirements, config)
+
+    def _inputs() -> Iterator[Input]:
+        nonlocal pulled
+        for i in range(100):
+            pulled += 1
+            yield Input(content=f"Q{i}")
+
+    cfg = Config(
+        provider="anthropic",
+        model=ANTHROPIC_MODEL,
+        use_mock=True,
+        request_concurrency=2,
+    )
+    results = iter_interactions(
+        Environment(), _inputs(), OutputRequirements(), cfg, _Provider()
+    )
+
+    async def _first() -> tuple[int, Output]:
+        return await anext(results)
+
+    first = asyncio.create_task(_first())
+    await asyncio.sleep(0.01)
+    # Only a small multiple of request_concurrency is materialized while blocked.
+    assert pulled <= 2 * 2
+    release.set()
+
+    seen = {(await first)[0]}
+    async for idx, _out in results:
+        seen.add(idx)
+    assert seen == set(range(100))
+    assert pulled == 100
+
+
+@pytest.mark.asyncio
+async def test_hedge_fires_duplicate_for_slow_call_and_cancels_loser():
+    cancelled = asyncio.Event()
+
+    class _Provider(FakeProvider):
+        calls = 0
+
+        async def generate(self, snapshot, input, requirements, config):
+            type(self).calls += 1
+            if type(self).calls == 1:
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+            return await super().generate(snapshot, input, requirements, config)
+
+    cfg = Config(
+        provider="anthropic",
+        model=ANTHROPIC_MODEL,
+        use_mock=True,
+        hedge=HedgePolicy(delay_s=0.01),
+    )
+    out = await execute_interaction(
+        Environment(), Input(content="Q"), OutputRequirements(), cfg, _Provider()
+    )
+
+    assert out.text == "ok:Q"
+    assert out.metrics.hedges == 1
+    assert cancelled.is_set()
+
+    # Calls that could repeat side effects (tools) are never hedged.
+    _Provider.calls = 0
+    tool_env = Environment(tools=[ToolDeclaration(name="t", description="d")])
+    task = asyncio.create_task(
+        execute_interaction(
+            tool_env, Input(content="Q"), OutputRequirements(), cfg, _Provider()
+        )
+    )
+    await asyncio.sleep(0.05)
+    assert _Provider.calls == 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+@pytest.mark.asyncio
+async def test_hedge_clock_and_latency_exclude_queueing():
+    cfg = Config(
+        provider="anthropic",
+        model=f"{ANTHROPIC_MODEL}-hedge-queue-test",
+        use_mock=True,
+        global_concurrency=1,
+        hedge=HedgePolicy(delay_s=0.02),
+    )
+    limiter = global_limiter_for(cfg)
+    hedger = hedger_for(cfg)
+    assert limiter is not None
+    assert hedger is not None
+
+    async def _hold_slot() -> None:
+        async with limiter.slot():
+            await asyncio.sleep(0.1)
+
+    holder = asyncio.create_task(_hold_slot())
+    await asyncio.sleep(0)
+    out = await execute_interaction(
+        Environment(), Input(content="Q"), OutputRequirements(), cfg, FakeProvider()
+    )
+    await holder
+
+    # Queued 0.1s behind the held slot, but the provider answered at once.
+    assert out.metrics.hedges == 0
+    assert len(hedger._latencies) == 1
+    assert hedger._latencies[0] < 0.02
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backend", ["memory", "sqlite", "directory"])
+async def test_response_cache_replays_identical_requests(backend, tmp_path):
+    cache: ResponseCache
+    if backend == "memory":
+        cache = MemoryResponseCache()
+    elif backend == "sqlite":
+        cache = SQLiteResponseCache(tmp_path / "responses.sqlite")
+    else:
+        cache = DirectoryResponseCache(tmp_path / "responses")
+    provider = ScriptedProvider()
+    cfg = Config(
+        provider="anthropic",
+        model=ANTHROPIC_MODEL,
+        use_mock=True,
+        response_cache=cache,
+    )
+    env = Environment(instructions="sys")
+
+    first = await execute_interactions(
+        env,
+        [Input(content="A"), Input(content="B")],
+        OutputRequirements(),
+        cfg,
+        provider,
+    )
+    second = await execute_interactions(
+        env,
+        [Input(content="A"), Input(content="C")],
+        OutputRequirements(),
+        cfg,
+        provider,
+    )
+
+    assert [o.metrics.response_cache_hit for o in first.outputs] == [False, False]
+    assert [o.metrics.response_cache_hit for o in second.outputs] == [True, False]
+    assert second.outputs[0].text == first.outputs[0].text == "ok"
+    assert provider.generate_calls == 3
+
+    # Different requirements or environment are different requests.
+    changed = await execute_interaction(
+        env, Input(content="A"), OutputRequirements(temperature=0.5), cfg, provider
+    )
+    other_env = await execute_interaction(
+        Environment(instructions="other"),
+        Input(content="A"),
+        OutputRequirements(),
+        cfg,
+        provider,
+    )
+    assert not changed.metrics.response_cache_hit
+    assert not other_env.metrics.response_cache_hit
+
+
+@pytest.mark.asyncio
+async def test_response_cache_backends_run_off_the_event_loop():
+    loop_thread = threading.get_ident()
+    threads: list[int] = []
+
+    class _Backend:
+        def __init__(self) -> None:
+            self.entries: dict[str, dict[str, Any]] = {}
+
+        def get(self, key: str) -> dict[str, Any] | None:
+            threads.append(threading.get_ident())
+            return self.entries.get(key)
+
+        def set(self, key: str, value: dict[str, Any]) -> None:
+            threads.append(threading.get_ident())
+            self.entries[key] = value
+
+    cfg = Config(
+        provider="anthropic",
+        model=ANTHROPIC_MODEL,
+        use_mock=True,
+        response_cache=_Backend(),
+    )
+    for _ in range(2):
+        await execute_interaction(
+            Environment(), Input(content="Q"), OutputRequirements(), cfg, FakeProvider()
+        )
+
+    assert len(threads) == 3
+    assert loop_thread not in threads
+
+
+def test_directory_response_cache_trims_in_batches(tmp_path, monkeypatch):
+    cache = DirectoryResponseCache(tmp_path, max_entries=100)
+    listings = 0
+    glob = type(tmp_path).glob
+
+    def _counting_glob(self, pattern):
+        nonlocal listings
+        listings += 1
+        return glob(self, pattern)
+
+    monkeypatch.setattr(type(tmp_path), "glob", _counting_glob)
+    for i in range(300):
+        cache.set(f"k{i}", {"text": str(i)})
+        assert len(list(glob(tmp_path, "*.json"))) <= 100
+
+    # Each trim frees 10% of the cap, so the directory is listed about once
+    # per ten new entries instead of on every write.
+    assert listings <= 25
+    assert cache.get("k299") == {"text": "299"}
+    assert cache.get("k0") is None
+
+
+@pytest.mark.asyncio
+async def test_response_cache_skips_truncated_responses_and_expires():
+    provider = ScriptedProvider(
+        script=[
+            ProviderResponse(text="cut", finish_reason="length"),
+            ProviderResponse(text="full", finish_reason="stop"),
+            ProviderResponse(text="fresh", finish_reason="stop"),
+        ]
+    )
+    cache = MemoryResponseCache(ttl_s=60)
+    cfg = Config(
+        provider="anthropic",
+        model=ANTHROPIC_MODEL,
+        use_mock=True,
+        response_cache=cache,
+    )
+
+    async def _run() -> Output:
+        return await execute_interaction(
+            Environment(), Input(content="Q"), OutputRequirements(), cfg, provider
+        )
+
+    assert (await _run()).text == "cut"
+    assert (await _run()).text == "full"
+    hit = await _run()
+    assert hit.text == "full"
+    assert hit.metrics.response_cache_hit
+
+    cache.ttl_s = 1e-9
+    assert (await _run()).text == "fresh"
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_preflight_rejects_context_overflow_before_sending():
+    provider = ScriptedProvider()
+    cfg = Config(
+        provider="anthropic",
+        model=ANTHROPIC_MODEL,
+        use_mock=True,
+        preflight=TokenPreflight(context_window=100),
+    )
+    env = Environment(sources=(Source.from_text("x" * 1_000),))
+
+    with pytest.raises(ContextOverflowError) as exc:
+        await execute_interactions(
+            env,
+            [Input(content="short"), Input(content="also short")],
+            OutputRequirements(),
+            cfg,
+            provider,
+        )
+
+    err = exc.value
+    assert (err.n_ctx, err.phase, err.call_idx) == (100, "preflight", 0)
+    assert err.n_tokens is not None and err.n_tokens > 250
+    assert provider.generate_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_preflight_overflow_fails_only_its_call_with_return_exceptions():
+    provider = ScriptedProvider()
+    cfg = Config(
+        provider="anthropic",
+        model=ANTHROPIC_MODEL,
+        use_mock=True,
+        preflight=TokenPreflight(context_window=100),
+    )
+    inputs = [Input(content="short"), Input(content="x" * 1_000), Input(content="ok")]
+
+    collection = await execute_interactions(
+        Environment(),
+        inputs,
+        OutputRequirements(),
+        cfg,
+        provider,
+        return_exceptions=True,
+    )
+
+    assert [o.text for o in collection.outputs] == ["ok", "", "ok"]
+    failed = collection.outputs[1]
+    assert failed.metrics.completion_status == "error"
+    error = failed.error
+    assert error is not None
+    assert (error.type, error.call_idx) == ("ContextOverflowError", 1)
+    assert error.category == "context_overflow"
+    assert provider.generate_calls == 2
+
+    def _lazy() -> Iterator[Input]:
+        yield from inputs
+
+    streamed = {
+        idx: out
+        async for idx, out in iter_interactions(
+            Environment(),
+            _lazy(),
+            OutputRequirements(),
+            cfg,
+            provider,
+            return_exceptions=True,
+        )
+    }
+    assert sorted(streamed) == [0, 1, 2]
+    assert streamed[1].error is not None
+    assert streamed[1].error.call_idx == 1
+    assert provider.generate_calls == 4
+
+
+@pytest.mark.asyncio
+async def test_preflight_reports_estimates_with_provider_tokenizer():
+    class WordTokenizer:
+        def count_tokens(self, text: str) -> int:
+            return len(text.split())
+
+    cfg = Config(
+        provider="anthropic",
+        model=ANTHROPIC_MODEL,
+        use_mock=True,
+        preflight=TokenPreflight(
+            tokenizers={"anthropic": WordTokenizer()},
+            context_window=5,
+            reject=False,
+        ),
+    )
+    collection = await execute_interactions(
+        Environment(instructions="be brief", sources=(Source.from_text("a b c"),)),
+        [Input(content="one two"), Input(content="one two three four")],
+        OutputRequirements(),
+        cfg,
+        ScriptedProvider(),
+    )
+
+    assert [o.metrics.estimated_input_tokens for o in collection.outputs] == [7, 9]
+    assert _cfg().preflight is None
+    out = await execute_interaction(
+        Environment(), Input(content="Q"), OutputRequirements(), _cfg(), FakeProvider()
+    )
+    assert out.metrics.estimated_input_tokens is None
+
+
+@pytest.mark.parametrize(
+    ("model", "window"),
+    [
+        ("gemini-2.5-flash-lite", 1_048_576),
+        ("anthropic/claude-sonnet-4.5", 200_000),
+        ("gpt-4o-mini", 128_000),
+        ("llama3.1:8b", None),
+        (None, None),
+    ],
+)
+def test_context_window_table_lookup(model, window):
+    assert context_window_for(model) == window
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass, field
+
 from pydantic import BaseModel
 import pytest
 
@@ -169,3 +172,46 @@ def test_local_reasoning_returns_scoped_provider_options() -> None:
     assert pollux.local_reasoning(enabled=False) == {
         "local": {"chat_template_kwargs": {"enable_thinking": False}}
     }
+
+
+@pytest.mark.asyncio
+async def test_session_scheduler_admits_interactive_ahead_of_queued_batch(
+    monkeypatch,
+):
+    @dataclass
+    class GatedProvider(FakeProvider):
+        order: list[str] = field(default_factory=list)
+        release: asyncio.Event = field(default_factory=asyncio.Event)
+
+        async def generate(self, snapshot, input, requirements, config):
+            self.order.append(input.content)
+            await self.release.wait()
+            return ProviderResponse(text="ok", usage={"total_tokens": 1})
+
+    provider = GatedProvider()
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: provider)
+
+    async with pollux.Session(_cfg(), max_concurrency=1) as session:
+        batch = asyncio.create_task(session.run_many([f"B{i}" for i in range(4)]))
+        while not provider.order:
+            await asyncio.sleep(0)
+        chat = asyncio.create_task(session.interact(Environment(), Input("chat")))
+        stats = session.scheduler_stats()
+        while stats is not None and not stats.queued["interactive"]:
+            await asyncio.sleep(0)
+            stats = session.scheduler_stats()
+
+        assert stats is not None
+        assert stats.in_flight == 1
+        assert stats.queued["batch"] == 3
+        provider.release.set()
+        await asyncio.gather(batch, chat)
+
+        stats = session.scheduler_stats()
+
+    # The one slot went to the interactive turn before the queued batch.
+    assert provider.order[:2] == ["B0", "chat"]
+    assert stats is not None
+    assert stats.served == {"interactive": 1, "batch": 4}
+    assert stats.queued == {"interactive": 0, "batch": 0}
+    assert stats.max_wait_s["batch"] >= stats.max_wait_s["interactive"] > 0
@@ -7,16 +7,19 @@ ResultEnvelope-shape tests they replace lived in tests/pipeline).
 
 from __future__ import annotations
 
+import asyncio
+
 from pydantic import BaseModel
 import pytest
 
 import pollux
 from pollux.config import Config
+from pollux.errors import APIError, DeadlineExceededError
 from pollux.interaction.collection import OutputCollection
 from pollux.interaction.output import Output
 from pollux.providers.base import ProviderCapabilities
 from pollux.providers.models import ProviderResponse
-from tests.conftest import ANTHROPIC_MODEL, FakeProvider
+from tests.conftest import ANTHROPIC_MODEL, GEMINI_MODEL, FakeProvider
 from tests.helpers import ScriptedProvider
 
 pytestmark = pytest.mark.integration
@@ -142,3 +145,141 @@ async def test_implicit_caching_reflected_in_metrics(monkeypatch):
     monkeypatch.setattr(pollux, "_get_provider", lambda _config: provider)
     out = await pollux.run("Q", config=_cfg())
     assert out.metrics.cache_mode == "implicit"
+
+
+@pytest.mark.asyncio
+async def test_iter_many_yields_results_as_they_complete(monkeypatch):
+    release_slow = asyncio.Event()
+
+    class _Provider(FakeProvider):
+        async def generate(self, snapshot, input, requirements, config):
+            if input.content == "slow":
+                await release_slow.wait()
+            return await super().generate(snapshot, input, requirements, config)
+
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: _Provider())
+
+    seen: list[tuple[int, str]] = []
+    async for index, out in pollux.iter_many(["slow", "fast"], config=_cfg()):
+        seen.append((index, out.text))
+        release_slow.set()
+
+    assert seen == [(1, "ok:fast"), (0, "ok:slow")]
+
+
+@pytest.mark.asyncio
+async def test_iter_many_failure_raises_and_cancels_in_flight_calls(monkeypatch):
+    cancelled = asyncio.Event()
+
+    class _Provider(FakeProvider):
+        async def generate(self, snapshot, input, requirements, config):
+            if input.content == "bad":
+                raise APIError("bad request", retryable=False, status_code=400)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            raise AssertionError("unreachable")
+
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: _Provider())
+
+    with pytest.raises(APIError, match="bad request") as exc:
+        async for _item in pollux.iter_many(["hang", "bad"], config=_cfg()):
+            pass
+
+    assert exc.value.call_idx == 1
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_run_many_timeout_returns_partial_results(monkeypatch):
+    cancelled: list[str] = []
+
+    class _Provider(FakeProvider):
+        async def generate(self, snapshot, input, requirements, config):
+            if input.content == "slow":
+                try:
+                    await asyncio.sleep(60)
+                except asyncio.CancelledError:
+                    cancelled.append(input.content)
+                    raise
+            return await super().generate(snapshot, input, requirements, config)
+
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: _Provider())
+
+    result = await pollux.run_many(["a", "slow", "b"], config=_cfg(), timeout_s=0.1)
+
+    assert result.answers == ["ok:a", "", "ok:b"]
+    assert result.status == "partial"
+    timed_out = result.outputs[1]
+    assert timed_out.metrics.completion_status == "error"
+    assert timed_out.error is not None
+    assert timed_out.error.type == "DeadlineExceededError"
+    assert cancelled == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_run_timeout_raises_instead_of_returning_empty_output(monkeypatch):
+    class _Provider(FakeProvider):
+        async def generate(self, snapshot, input, requirements, config):
+            await asyncio.sleep(60)
+            raise AssertionError("unreachable")
+
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: _Provider())
+
+    with pytest.raises(DeadlineExceededError):
+        await pollux.run("slow", config=_cfg(), timeout_s=0.05)
+    with pytest.raises(DeadlineExceededError):
+        await pollux.interact(
+            pollux.Environment(), pollux.Input("slow"), config=_cfg(), timeout_s=0.05
+        )
+
+
+@pytest.mark.asyncio
+async def test_timeout_bounds_upload_preparation(monkeypatch, tmp_path):
+    class _Provider(FakeProvider):
+        async def upload_file(self, path, mime_type):
+            await asyncio.sleep(60)
+            raise AssertionError("unreachable")
+
+    fake = _Provider()
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: fake)
+    doc = tmp_path / "doc.pdf"
+    doc.write_bytes(b"%PDF-1.4")
+    cfg = Config(provider="gemini", model=GEMINI_MODEL, use_mock=True)
+
+    with pytest.raises(DeadlineExceededError):
+        await pollux.run_many(
+            ["Q1", "Q2"],
+            sources=[pollux.Source.from_file(doc, mime_type="application/pdf")],
+            config=cfg,
+            timeout_s=0.05,
+        )
+    assert fake.last_parts is None
+
+
+@pytest.mark.asyncio
+async def test_run_many_return_exceptions_salvages_the_batch(monkeypatch):
+    class _Provider(FakeProvider):
+        async def generate(self, snapshot, input, requirements, config):
+            if input.content == "bad":
+                raise APIError("bad request", retryable=False, status_code=400)
+            return await super().generate(snapshot, input, requirements, config)
+
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: _Provider())
+
+    result = await pollux.run_many(
+        ["a", "bad", "b"], config=_cfg(), return_exceptions=True
+    )
+
+    assert result.answers == ["ok:a", "", "ok:b"]
+    assert result.status == "partial"
+    assert result.failed_indexes == [1]
+    failed = result.outputs[1]
+    assert failed.metrics.completion_status == "error"
+    assert failed.error is not None
+    assert failed.error.status_code == 400
+    assert failed.error.call_idx == 1
+    assert isinstance(failed.error.exception, APIError)
+    assert result.to_jsonable()["outputs"][1]["error"]["message"] == "bad request"
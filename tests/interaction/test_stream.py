@@ -14,8 +14,9 @@ import pytest
 
 import pollux
 from pollux import Environment, Event, Input
+from pollux.concurrency import global_limiter_for
 from pollux.config import Config
-from pollux.errors import APIError, ConfigurationError
+from pollux.errors import APIError, ConfigurationError, DeadlineExceededError
 from pollux.interaction.execute import execute_interaction, stream_interaction
 from pollux.interaction.requirements import OutputRequirements
 from pollux.interaction.tools import ToolCallDelta
@@ -229,3 +230,31 @@ async def test_stream_frontdoor_yields_events(monkeypatch: pytest.MonkeyPatch) -
     ]
 
     assert types == ["start", "text_delta", "usage", "finish", "done"]
+
+
+@pytest.mark.asyncio
+async def test_stream_timeout_bounds_the_wait_for_a_slot() -> None:
+    """A stream queued behind a full global cap gives up at its deadline."""
+    cfg = Config(
+        provider="anthropic",
+        model=f"{ANTHROPIC_MODEL}-stream-deadline-test",
+        use_mock=True,
+        global_concurrency=1,
+    )
+    limiter = global_limiter_for(cfg)
+    assert limiter is not None
+    provider = StreamScriptProvider(chunks=[ProviderStreamChunk(text="hi")])
+
+    async with limiter.slot():
+        with pytest.raises(DeadlineExceededError):
+            async for _event in stream_interaction(
+                Environment(),
+                Input("hi"),
+                OutputRequirements(),
+                cfg,
+                provider,
+                timeout_s=0.05,
+            ):
+                pass
+
+    assert limiter.in_flight == 0
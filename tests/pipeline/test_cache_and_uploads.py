@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass, field
+import time
 from typing import Any
 
 import httpx
@@ -17,12 +18,14 @@ from pollux.errors import (
     APIError,
     ConfigurationError,
 )
+from pollux.interaction._uploads import UploadRegistry
 from pollux.providers.local import LocalProvider
 from pollux.providers.models import (
     ProviderFileAsset,
     ProviderResponse,
 )
 from pollux.retry import RetryPolicy
+import pollux.source
 from pollux.source import Source
 from tests.conftest import (
     GEMINI_MODEL,
@@ -155,6 +158,60 @@ async def test_upload_single_flight_propagates_failure_and_can_recover(
     assert fake.generate_calls == 2
 
 
+@pytest.mark.asyncio
+async def test_distinct_uploads_run_concurrently_within_limit_and_keep_order(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    """Uploads overlap up to upload_concurrency; parts stay in source order."""
+
+    @dataclass
+    class TrackingProvider(FakeProvider):
+        in_flight: int = 0
+        peak: int = 0
+        file_ids: list[str] = field(default_factory=list)
+
+        async def upload_file(self, path: Any, mime_type: str) -> ProviderFileAsset:
+            self.upload_calls += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0.01)
+            self.in_flight -= 1
+            return ProviderFileAsset(
+                file_id=f"mock://uploaded/{path.name}",
+                provider="mock",
+                mime_type=mime_type,
+            )
+
+        async def generate(
+            self, snapshot: Any, input: Any, requirements: Any, config: Any
+        ) -> ProviderResponse:
+            self.file_ids = [p.file_id for p in snapshot.prepared_parts]
+            return await super().generate(snapshot, input, requirements, config)
+
+    fake = TrackingProvider()
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: fake)
+
+    names = ["e.pdf", "a.pdf", "d.pdf", "a.pdf", "c.pdf", "b.pdf"]
+    for name in set(names):
+        (tmp_path / name).write_bytes(b"%PDF-1.4 fake")
+
+    cfg = Config(
+        provider="gemini", model=GEMINI_MODEL, use_mock=True, upload_concurrency=2
+    )
+    await pollux.run(
+        "Read these",
+        sources=[
+            Source.from_file(tmp_path / name, mime_type="application/pdf")
+            for name in names
+        ],
+        config=cfg,
+    )
+
+    assert fake.upload_calls == 5
+    assert fake.peak == 2
+    assert fake.file_ids == [f"mock://uploaded/{name}" for name in names]
+
+
 # =============================================================================
 # Upload Cleanup (v1.2)
 # =============================================================================
@@ -339,6 +396,152 @@ async def test_openai_upload_cleanup_runs_even_when_generate_fails(
     assert fake.deleted_file_ids == ["openai://file/file-failed-generate"]
 
 
+@pytest.mark.asyncio
+async def test_session_background_cleanup_returns_first_and_flushes_on_close(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    """Background cleanup must not delay results, and aclose() drains it."""
+
+    @dataclass
+    class SlowDeleteProvider(FakeProvider):
+        release: asyncio.Event = field(default_factory=asyncio.Event)
+        deleted_file_ids: list[str] = field(default_factory=list)
+        closed: bool = False
+
+        async def upload_file(self, path: Any, mime_type: str) -> ProviderFileAsset:
+            self.upload_calls += 1
+            return ProviderFileAsset(
+                file_id=f"openai://file/file-{path.name}",
+                provider="openai",
+                mime_type=mime_type,
+            )
+
+        async def delete_file(self, file_id: str) -> None:
+            await self.release.wait()
+            assert not self.closed
+            self.deleted_file_ids.append(file_id)
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    fake = SlowDeleteProvider()
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: fake)
+
+    paths = [tmp_path / f"doc{i}.pdf" for i in range(3)]
+    for path in paths:
+        path.write_bytes(b"%PDF-1.4 fake")
+
+    cfg = Config(provider="gemini", model=GEMINI_MODEL, use_mock=True)
+    session = pollux.Session(cfg, background_cleanup=True)
+    result = await session.run_many(
+        ["Q"],
+        sources=[Source.from_file(p, mime_type="application/pdf") for p in paths],
+    )
+    assert result.status == "ok"
+    assert fake.deleted_file_ids == []
+
+    close = asyncio.create_task(session.aclose())
+    await asyncio.sleep(0)
+    fake.release.set()
+    await close
+
+    assert sorted(fake.deleted_file_ids) == [
+        f"openai://file/file-{p.name}" for p in paths
+    ]
+    assert fake.closed
+
+
+@pytest.mark.asyncio
+async def test_reuse_uploads_shares_files_by_content_until_expiry(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    """Identical bytes upload once across runs; near-expiry assets re-upload."""
+
+    @dataclass
+    class TrackingProvider(FakeProvider):
+        ttl_s: float = 86_400.0
+        deleted_file_ids: list[str] = field(default_factory=list)
+
+        async def upload_file(self, path: Any, mime_type: str) -> ProviderFileAsset:  # noqa: ARG002
+            self.upload_calls += 1
+            return ProviderFileAsset(
+                file_id=f"openai://file/file-{self.upload_calls}",
+                provider="openai",
+                mime_type=mime_type,
+                expires_at=time.time() + self.ttl_s,
+            )
+
+        async def delete_file(self, file_id: str) -> None:
+            self.deleted_file_ids.append(file_id)
+
+    first, second = tmp_path / "a.pdf", tmp_path / "b.pdf"
+    for path in (first, second):
+        path.write_bytes(f"%PDF-1.4 {tmp_path}".encode())
+
+    for ttl_s, expected_uploads in ((86_400.0, 1), (60.0, 2)):
+        fake = TrackingProvider(ttl_s=ttl_s)
+        monkeypatch.setattr(pollux, "_get_provider", lambda _config, _f=fake: _f)
+        cfg = Config(
+            provider="gemini",
+            model=GEMINI_MODEL,
+            use_mock=True,
+            api_key=f"key-{ttl_s}",
+            reuse_uploads=True,
+        )
+        for path in (first, second):
+            await pollux.run(
+                "Read this",
+                source=Source.from_file(path, mime_type="application/pdf"),
+                config=cfg,
+            )
+
+        assert fake.upload_calls == expected_uploads
+        assert fake.deleted_file_ids == []
+
+
+@pytest.mark.asyncio
+async def test_reuse_uploads_hashes_each_file_once_until_it_changes(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Any
+) -> None:
+    """Repeat runs over an unchanged file reuse its digest instead of re-hashing."""
+    hashed: list[str] = []
+    real_sha256_file = pollux.source.sha256_file
+
+    def _counting(path: Any) -> str:
+        hashed.append(str(path))
+        return real_sha256_file(path)
+
+    monkeypatch.setattr(pollux.source, "sha256_file", _counting)
+    fake = FakeProvider()
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: fake)
+    cfg = Config(
+        provider="gemini",
+        model=GEMINI_MODEL,
+        use_mock=True,
+        api_key="key-digest-memo",
+        reuse_uploads=True,
+    )
+    path = tmp_path / "doc.pdf"
+    path.write_bytes(b"%PDF-1.4 first")
+
+    async def _run() -> None:
+        await pollux.run(
+            "Read this",
+            source=Source.from_file(path, mime_type="application/pdf"),
+            config=cfg,
+        )
+
+    for _ in range(3):
+        await _run()
+    assert hashed == [str(path)]
+    assert fake.upload_calls == 1
+
+    path.write_bytes(b"%PDF-1.4 second version")
+    await _run()
+    assert hashed == [str(path)] * 2
+    assert fake.upload_calls == 2
+
+
 @pytest.mark.asyncio
 async def test_provider_validation_runs_before_uploads(
     monkeypatch: pytest.MonkeyPatch, tmp_path: Any
@@ -450,6 +653,76 @@ async def test_duration_includes_upload_cleanup_latency(
     assert result.metrics.duration_s >= 0.09
 
 
+def test_cache_registry_is_bounded_lru_and_sweeps_expired_entries() -> None:
+    """Capacity evicts least-recently-used handles; sweeps drop expired ones."""
+    registry = pollux.cache.CacheRegistry(max_entries=2, sweep_interval_s=0.0)
+    future = time.time() + 600
+
+    registry.set("a", ("cache-a", future))
+    registry.set("b", ("cache-b", future))
+    assert registry.get("a") == ("cache-a", future)  # "a" is now most recent
+    registry.set("c", ("cache-c", future))
+
+    assert registry.get("b") is None
+    registry.set("d", ("cache-d", time.time() - 1))  # evicts "a", then expires
+    assert registry.get("c") == ("cache-c", future)
+
+    stats = registry.stats()
+    assert (stats.size, stats.hits, stats.misses) == (1, 2, 4)
+    assert (stats.evictions, stats.expirations) == (2, 1)
+
+
+def test_upload_registry_is_bounded_lru_and_sweeps_expiring_entries() -> None:
+    """Capacity evicts least-recently-used uploads; sweeps drop expiring ones."""
+    registry = UploadRegistry(max_entries=2, sweep_interval_s=0.0)
+
+    def _asset(name: str, ttl_s: float = 86_400.0) -> ProviderFileAsset:
+        return ProviderFileAsset(
+            file_id=f"openai://file/{name}",
+            provider="openai",
+            mime_type="application/pdf",
+            expires_at=time.time() + ttl_s,
+        )
+
+    def _key(name: str) -> tuple[str, str, str, str]:
+        return ("openai", "k", name, "application/pdf")
+
+    a, b, c = _asset("a"), _asset("b"), _asset("c")
+    registry.set(_key("a"), a)
+    registry.set(_key("b"), b)
+    assert registry.get(_key("a")) is a  # "a" is now most recent
+    registry.set(_key("c"), c)
+
+    assert registry.get(_key("b")) is None
+    assert not registry.holds(b)
+    # Inside the expiry margin: swept on the next access, never returned.
+    registry.set(_key("d"), _asset("d", ttl_s=60.0))
+    assert registry.get(_key("c")) is c
+    assert list(registry._entries) == [_key("c")]
+    assert registry.holds(c)
+    assert not registry.holds(a)
+
+
+def test_upload_registry_single_flight_state_is_per_event_loop() -> None:
+    """A registry used under contention in one asyncio.run() works in the next."""
+    registry = UploadRegistry()
+
+    async def _contend() -> object:
+        flights = registry.flights()
+        async with flights.lock:
+            waiter = asyncio.create_task(flights.lock.acquire())
+            await asyncio.sleep(0)
+        await waiter
+        flights.lock.release()
+        return flights
+
+    first = asyncio.run(_contend())
+    second = asyncio.run(_contend())
+
+    assert first is not second
+    assert list(registry._flights.values()) == [second]
+
+
 def test_cache_identity_uses_content_digest_not_identifier_only() -> None:
     """Regression: cache identity keys must not collide across distinct sources."""
     model = GEMINI_MODEL
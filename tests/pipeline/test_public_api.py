@@ -2,6 +2,11 @@
 
 from __future__ import annotations
 
+import json
+import subprocess
+import sys
+from typing import Any
+
 import pytest
 
 import pollux
@@ -90,3 +95,71 @@ async def test_provider_options_are_forwarded_for_active_provider(
 
     assert fake.last_generate_kwargs is not None
     assert fake.last_generate_kwargs["provider_options"] == {"seed": 123}
+
+
+# =============================================================================
+# Public API Boundary: Import Cost
+# =============================================================================
+
+_IMPORT_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import pollux
+t1 = time.perf_counter()
+loaded = sorted(sys.modules)
+import pollux._api
+t2 = time.perf_counter()
+print(json.dumps({"lazy_s": t1 - t0, "rest_s": t2 - t1, "loaded": loaded}))
+"""
+
+
+def _probe_import() -> dict[str, Any]:
+    result = subprocess.run(  # noqa: S603 - fixed interpreter and probe script
+        [sys.executable, "-c", _IMPORT_PROBE],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    probe: dict[str, Any] = json.loads(result.stdout)
+    return probe
+
+
+def test_import_pollux_defers_heavy_modules() -> None:
+    """``import pollux`` must not load config, pydantic, providers, or execution."""
+    loaded = set(_probe_import()["loaded"])
+
+    heavy = {
+        "dotenv",
+        "httpx",
+        "pydantic",
+        "pollux.cache",
+        "pollux.config",
+        "pollux.deferred",
+        "pollux.interaction",
+        "pollux.interaction.execute",
+        "pollux.providers",
+        "pollux.retry",
+    }
+    assert loaded & heavy == set()
+
+
+def test_import_pollux_is_cheaper_than_the_eager_surface() -> None:
+    """Import-time benchmark: the lazy import stays a fraction of full load.
+
+    Compared within one interpreter so the bound holds on slow machines; the
+    best of three runs absorbs scheduler noise.
+    """
+    runs = [_probe_import() for _ in range(3)]
+    lazy_s = min(r["lazy_s"] for r in runs)
+    rest_s = min(r["rest_s"] for r in runs)
+
+    assert lazy_s < rest_s, f"import pollux {lazy_s:.3f}s vs deferred {rest_s:.3f}s"
+
+
+def test_lazy_public_names_resolve_and_are_listed() -> None:
+    """Every ``__all__`` name resolves and shows up in ``dir(pollux)``."""
+    for name in pollux.__all__:
+        assert getattr(pollux, name) is not None
+        assert name in dir(pollux)
+    with pytest.raises(AttributeError, match="no_such_name"):
+        _ = pollux.no_such_name
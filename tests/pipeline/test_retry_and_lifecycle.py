@@ -2,23 +2,41 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
+import gc
+import itertools
+import threading
+import time
+from types import SimpleNamespace
 from typing import Any
+import weakref
 
 import pytest
 
 import pollux
 import pollux.cache
+import pollux.concurrency
+from pollux.concurrency import (
+    AdaptiveConcurrency,
+    adaptive_limiter_for,
+    global_limiter_for,
+)
 from pollux.config import Config
 from pollux.errors import (
     APIError,
+    CircuitOpenError,
+    RateLimitError,
 )
 from pollux.providers import _compile
 from pollux.providers.models import (
     ProviderFileAsset,
     ProviderResponse,
 )
-from pollux.retry import RetryPolicy
+import pollux.ratelimit
+from pollux.ratelimit import RateLimit
+import pollux.retry
+from pollux.retry import CircuitBreakerPolicy, RetryPolicy
 from pollux.source import Source
 from tests.conftest import (
     GEMINI_MODEL,
@@ -76,6 +94,539 @@ async def test_provider_is_closed_on_success(monkeypatch: pytest.MonkeyPatch) ->
         assert fake.closed == 1, name
 
 
+@pytest.mark.asyncio
+async def test_reuse_clients_pools_providers_across_one_shot_calls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """reuse_clients shares one provider per key until idle or shutdown()."""
+
+    @dataclass
+    class _Provider(FakeProvider):
+        closed: int = 0
+
+        async def aclose(self) -> None:
+            self.closed += 1
+
+    built: list[_Provider] = []
+
+    def _build(_config: Config) -> _Provider:
+        built.append(_Provider())
+        return built[-1]
+
+    monkeypatch.setattr(pollux, "_get_provider", _build)
+    cfg = Config(
+        provider="gemini", model=GEMINI_MODEL, use_mock=True, reuse_clients=True
+    )
+
+    await asyncio.gather(*(pollux.run(f"Q{i}", config=cfg) for i in range(3)))
+    await pollux.check_ready(cfg)
+    assert len(built) == 1
+    assert built[0].closed == 0
+
+    # A different connection key gets its own client.
+    other = Config(
+        provider="gemini",
+        model=GEMINI_MODEL,
+        use_mock=True,
+        reuse_clients=True,
+        request_timeout_s=5,
+    )
+    await pollux.run("Q", config=other)
+    assert len(built) == 2
+
+    await pollux.shutdown()
+    assert [p.closed for p in built] == [1, 1]
+
+    # Idle clients close on their own.
+    monkeypatch.setattr(pollux._client_pool, "idle_timeout_s", 0.01)
+    await pollux.run("Q", config=cfg)
+    await asyncio.sleep(0.05)
+    assert len(built) == 3
+    assert built[2].closed == 1
+    await pollux.shutdown()
+
+
+def test_reuse_clients_releases_loops_ended_by_asyncio_run(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Each asyncio.run closes its pooled clients and leaves no loop behind."""
+
+    @dataclass
+    class _Provider(FakeProvider):
+        closed: int = 0
+
+        async def aclose(self) -> None:
+            self.closed += 1
+
+    built: list[_Provider] = []
+
+    def _build(_config: Config) -> _Provider:
+        built.append(_Provider())
+        return built[-1]
+
+    monkeypatch.setattr(pollux, "_get_provider", _build)
+    cfg = Config(
+        provider="gemini", model=GEMINI_MODEL, use_mock=True, reuse_clients=True
+    )
+    loops: list[weakref.ref[asyncio.AbstractEventLoop]] = []
+
+    async def _call() -> None:
+        loops.append(weakref.ref(asyncio.get_running_loop()))
+        await pollux.run("Q", config=cfg)
+
+    for _ in range(5):
+        asyncio.run(_call())
+    gc.collect()
+
+    assert [p.closed for p in built] == [1] * 5
+    assert pollux._client_pool.loop_count() == 0
+    assert all(ref() is None for ref in loops)
+
+
+# =============================================================================
+# Rate Limiting (Boundary)
+# =============================================================================
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_paces_calls_over_token_quota_and_is_shared(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Calls beyond the token bucket wait for refill; equal configs share it."""
+    delays: list[float] = []
+
+    async def _sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(
+        pollux.ratelimit,
+        "asyncio",
+        SimpleNamespace(sleep=_sleep, CancelledError=asyncio.CancelledError),
+    )
+
+    class _Provider(FakeProvider):
+        async def generate(
+            self, snapshot: Any, input: Any, requirements: Any, config: Any
+        ) -> ProviderResponse:
+            # Report usage matching the estimate so settling charges nothing.
+            return ProviderResponse(text="ok", usage={"total_tokens": 3000})
+
+    fake = _Provider()
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: fake)
+
+    def _cfg() -> Config:
+        return Config(
+            provider="gemini",
+            model=f"{GEMINI_MODEL}-ratelimit-test",
+            use_mock=True,
+            rate_limit=RateLimit(tokens_per_minute=6000),
+        )
+
+    assert pollux.ratelimit.rate_limiter_for(_cfg()) is (
+        pollux.ratelimit.rate_limiter_for(_cfg())
+    )
+
+    # Each call is estimated at ~3000 tokens (max_tokens dominates), so the
+    # third one finds the 6000-token bucket empty and waits ~30s for refill.
+    result = await pollux.run_many(["Q1", "Q2", "Q3"], config=_cfg(), max_tokens=2999)
+
+    assert result.status == "ok"
+    assert len(delays) == 1
+    assert delays[0] == pytest.approx(30.0, abs=0.5)
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_halves_on_429_and_regrows(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A 429 burst shrinks the shared limit once; saturated success grows it."""
+
+    @dataclass
+    class _Provider(FakeProvider):
+        throttled: int = 0
+        active: int = 0
+        peak: int = 0
+        limits: list[int] = field(default_factory=list)
+
+        async def generate(
+            self, snapshot: Any, input: Any, requirements: Any, config: Any
+        ) -> ProviderResponse:
+            limiter = adaptive_limiter_for(config)
+            assert limiter is not None
+            self.limits.append(limiter.limit)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                await asyncio.sleep(0)
+                if self.throttled:
+                    self.throttled -= 1
+                    raise RateLimitError("slow down", retryable=True, status_code=429)
+                return ProviderResponse(text="ok", usage={"total_tokens": 1})
+            finally:
+                self.active -= 1
+
+    fake = _Provider(throttled=4)
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: fake)
+    cfg = Config(
+        provider="gemini",
+        model=f"{GEMINI_MODEL}-adaptive-test",
+        use_mock=True,
+        request_concurrency=8,
+        adaptive_concurrency=AdaptiveConcurrency(max_limit=8, latency_tolerance=None),
+        retry=RetryPolicy(
+            max_attempts=3, initial_delay_s=0.0, max_delay_s=0.0, jitter=False
+        ),
+    )
+    limiter = adaptive_limiter_for(cfg)
+    assert limiter is not None
+    assert limiter.limit < 16
+
+    result = await pollux.run_many([f"Q{i}" for i in range(8)], config=cfg)
+
+    assert result.status == "ok"
+    assert fake.peak <= 8
+    # All four 429s come from one admission epoch, so the limit halves once
+    # (not down to 1) and then climbs back on saturated successes.
+    assert min(fake.limits) == 4
+    assert adaptive_limiter_for(cfg) is limiter
+    learned = limiter.limit
+
+    await pollux.run_many([f"Q{i}" for i in range(32)], config=cfg)
+    assert limiter.limit > learned
+
+
+@pytest.mark.asyncio
+async def test_adaptive_concurrency_tolerates_jitter_but_sheds_sustained_slowdown(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Ordinary latency spread keeps the limit; a lasting slowdown shrinks it."""
+    now = [0.0]
+    monkeypatch.setattr(
+        pollux.concurrency, "time", SimpleNamespace(monotonic=lambda: now[0])
+    )
+    limiter = pollux.concurrency.AdaptiveLimiter(AdaptiveConcurrency(), 16)
+    # Latencies spread evenly over 20-120 ms, in a scrambled order.
+    jitter = itertools.cycle([0.02 + 0.01 * ((i * 7) % 11) for i in range(11)])
+
+    async def _attempt(latency: float) -> None:
+        async with limiter.slot():
+            now[0] += latency
+
+    for _ in range(500):
+        await _attempt(next(jitter))
+    assert limiter.limit == 16
+
+    for _ in range(20):
+        await _attempt(0.3 + next(jitter))
+    assert limiter.limit < 16
+
+
+@pytest.mark.asyncio
+async def test_global_concurrency_caps_in_flight_calls_across_one_shot_runs(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Independent run() calls share one process-wide in-flight cap."""
+
+    @dataclass
+    class _Provider(FakeProvider):
+        active: int = 0
+        peak: int = 0
+
+        async def generate(
+            self, snapshot: Any, input: Any, requirements: Any, config: Any
+        ) -> ProviderResponse:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                for _ in range(3):
+                    await asyncio.sleep(0)
+                return ProviderResponse(text="ok", usage={"total_tokens": 1})
+            finally:
+                self.active -= 1
+
+    fake = _Provider()
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: fake)
+    cfg = Config(
+        provider="gemini",
+        model=f"{GEMINI_MODEL}-global-cap-test",
+        use_mock=True,
+        global_concurrency=2,
+    )
+
+    results = await asyncio.gather(
+        *(pollux.run(f"Q{i}", config=cfg) for i in range(10))
+    )
+
+    assert all(r.text == "ok" for r in results)
+    assert fake.peak == 2
+    limiter = global_limiter_for(cfg)
+    assert limiter is not None
+    assert limiter.in_flight == 0
+
+
+def test_global_concurrency_conflicts_keep_the_smallest_cap() -> None:
+    """Configs that disagree on the cap share the smallest, without flapping."""
+    base, tighter = (
+        Config(
+            provider="gemini",
+            model=f"{GEMINI_MODEL}-global-conflict-test",
+            use_mock=True,
+            global_concurrency=limit,
+        )
+        for limit in (4, 2)
+    )
+
+    limiter = global_limiter_for(base)
+    assert limiter is not None
+    assert limiter.limit == 4
+    for cfg in (tighter, base, tighter, base):
+        assert global_limiter_for(cfg) is limiter
+        assert limiter.limit == 2
+
+
+def test_global_concurrency_wakes_waiters_on_other_threads_loops(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A slot released in one thread admits a caller waiting in another."""
+    release = threading.Event()
+    first_started = threading.Event()
+
+    class _Provider(FakeProvider):
+        async def generate(
+            self, snapshot: Any, input: Any, requirements: Any, config: Any
+        ) -> ProviderResponse:
+            if input.content == "first":
+                first_started.set()
+                while not release.is_set():
+                    await asyncio.sleep(0.001)
+            return ProviderResponse(text="ok", usage={"total_tokens": 1})
+
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: _Provider())
+    cfg = Config(
+        provider="gemini",
+        model=f"{GEMINI_MODEL}-cross-thread-cap-test",
+        use_mock=True,
+        global_concurrency=1,
+    )
+    limiter = global_limiter_for(cfg)
+    assert limiter is not None
+    texts: dict[str, str | None] = {}
+
+    def _run(prompt: str) -> None:
+        texts[prompt] = asyncio.run(pollux.run(prompt, config=cfg)).text
+
+    first = threading.Thread(target=_run, args=("first",), daemon=True)
+    second = threading.Thread(target=_run, args=("second",), daemon=True)
+    first.start()
+    assert first_started.wait(5)
+    second.start()
+    # The second thread's call queues behind the held slot.
+    while not limiter._waiters:
+        time.sleep(0.001)
+    release.set()
+    first.join(5)
+    second.join(5)
+
+    assert not first.is_alive()
+    assert not second.is_alive()
+    assert texts == {"first": "ok", "second": "ok"}
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_new_dispatches_across_calls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """One call's Retry-After holds every later attempt, not just its own."""
+    now = [0.0]
+
+    async def _sleep(delay: float) -> None:
+        now[0] += delay
+
+    clock = SimpleNamespace(monotonic=lambda: now[0])
+    monkeypatch.setattr(pollux.ratelimit, "time", clock)
+    monkeypatch.setattr(pollux.retry, "time", clock)
+    for module in (pollux.ratelimit, pollux.retry):
+        monkeypatch.setattr(
+            module,
+            "asyncio",
+            SimpleNamespace(
+                sleep=_sleep,
+                CancelledError=asyncio.CancelledError,
+                TimeoutError=asyncio.TimeoutError,
+            ),
+        )
+
+    @dataclass
+    class _Provider(FakeProvider):
+        started: list[tuple[str, float]] = field(default_factory=list)
+
+        async def generate(
+            self, snapshot: Any, input: Any, requirements: Any, config: Any
+        ) -> ProviderResponse:
+            self.started.append((input.content, now[0]))
+            if len(self.started) == 1:
+                raise RateLimitError(
+                    "slow down", retryable=True, status_code=429, retry_after_s=2.0
+                )
+            await asyncio.sleep(0)
+            return ProviderResponse(text="ok", usage={"total_tokens": 1})
+
+    fake = _Provider()
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: fake)
+    cfg = Config(
+        provider="gemini",
+        model=f"{GEMINI_MODEL}-retry-after-test",
+        use_mock=True,
+        request_concurrency=2,
+        retry=RetryPolicy(max_attempts=2, jitter=False),
+    )
+
+    result = await pollux.run_many(["Q0", "Q1", "Q2", "Q3"], config=cfg)
+
+    assert result.status == "ok"
+    # Q0's first attempt got the 429 before any other worker reached the
+    # provider; every later attempt (its own retry included) waited it out.
+    assert fake.started[0] == ("Q0", 0.0)
+    assert all(at >= 2.0 for _q, at in fake.started[1:])
+    assert len(fake.started) == 5
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pause_never_outlasts_the_retry_deadline(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """A Retry-After longer than the call's budget fails by its deadline."""
+
+    @dataclass
+    class _Provider(FakeProvider):
+        calls: int = 0
+
+        async def generate(
+            self, snapshot: Any, input: Any, requirements: Any, config: Any
+        ) -> ProviderResponse:
+            self.calls += 1
+            raise RateLimitError(
+                "slow down", retryable=True, status_code=429, retry_after_s=30.0
+            )
+
+    fake = _Provider()
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: fake)
+    cfg = Config(
+        provider="gemini",
+        model=f"{GEMINI_MODEL}-retry-after-deadline-test",
+        use_mock=True,
+        retry=RetryPolicy(
+            max_attempts=3, initial_delay_s=0.0, jitter=False, max_elapsed_s=0.2
+        ),
+    )
+
+    started = time.monotonic()
+    with pytest.raises(RateLimitError):
+        await pollux.run("Q", config=cfg)
+    assert time.monotonic() - started < 1.0
+
+    # While the 30s pause is still active, a new call fails at once instead of
+    # waiting past its own budget.
+    started = time.monotonic()
+    with pytest.raises(RateLimitError) as exc:
+        await pollux.run("Q2", config=cfg)
+    assert time.monotonic() - started < 0.1
+    assert exc.value.retryable is False
+    assert fake.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_circuit_breaker_fails_fast_while_open_then_probes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Consecutive retryable failures open the circuit; a probe closes it."""
+    now = [0.0]
+    monkeypatch.setattr(pollux.retry, "time", SimpleNamespace(monotonic=lambda: now[0]))
+
+    @dataclass
+    class _Provider(FakeProvider):
+        down: bool = True
+        calls: int = 0
+
+        async def generate(
+            self, snapshot: Any, input: Any, requirements: Any, config: Any
+        ) -> ProviderResponse:
+            self.calls += 1
+            if self.down:
+                raise APIError("unavailable", retryable=True, status_code=503)
+            return ProviderResponse(text="ok", usage={"total_tokens": 1})
+
+    fake = _Provider()
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: fake)
+    cfg = Config(
+        provider="gemini",
+        model=f"{GEMINI_MODEL}-breaker-test",
+        use_mock=True,
+        request_concurrency=1,
+        retry=RetryPolicy(max_attempts=1),
+        circuit_breaker=CircuitBreakerPolicy(failure_threshold=3, reset_timeout_s=30),
+    )
+
+    with pytest.raises(APIError, match="unavailable"):
+        await pollux.run_many([f"Q{i}" for i in range(20)], config=cfg)
+    # Only the first three calls reached the provider; the rest failed fast.
+    assert fake.calls == 3
+    with pytest.raises(CircuitOpenError) as excinfo:
+        await pollux.run("Q", config=cfg)
+    assert excinfo.value.retryable is False
+    assert fake.calls == 3
+
+    # After the reset timeout a single probe goes through and closes it.
+    now[0] += 30
+    fake.down = False
+    result = await pollux.run("Q", config=cfg)
+    assert result.text == "ok"
+    breaker = pollux.retry.circuit_breaker_for(cfg)
+    assert breaker is not None
+    assert breaker.state == "closed"
+
+
+def test_circuit_breaker_closes_only_on_probes_and_ignores_rate_limits(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Late successes from before the open, and 429s, never move the circuit."""
+    now = [0.0]
+    monkeypatch.setattr(pollux.retry, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    breaker = pollux.retry.CircuitBreaker(
+        CircuitBreakerPolicy(failure_threshold=2, reset_timeout_s=30),
+        provider="gemini",
+    )
+
+    def _state() -> str:
+        return breaker.state
+
+    down = APIError("unavailable", retryable=True, status_code=503)
+    throttled = RateLimitError("slow down", retryable=True, status_code=429)
+
+    for _ in range(5):
+        with pytest.raises(RateLimitError), breaker.guard():
+            raise throttled
+    assert _state() == "closed"
+
+    straggler = breaker.guard()
+    straggler.__enter__()  # admitted while the circuit is still closed
+    for _ in range(2):
+        with pytest.raises(APIError), breaker.guard():
+            raise down
+    assert _state() == "open"
+    straggler.__exit__(None, None, None)
+    assert _state() == "open"
+
+    now[0] += 30
+    with pytest.raises(RateLimitError), breaker.guard():
+        raise throttled
+    assert _state() == "half_open"
+    with breaker.guard():
+        pass
+    assert _state() == "closed"
+
+
 # =============================================================================
 # Retry Behavior (Boundary)
 # =============================================================================
@@ -228,3 +779,43 @@ async def test_retry_skipped_for_permanent_errors(
     with pytest.raises(APIError, match="unauthorized"):
         await pollux.run("hello", config=cfg)
     assert fake2.calls == 1  # Should only run once, not retried!
+
+
+@pytest.mark.asyncio
+async def test_retry_budget_caps_retries_across_a_fan_out(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Under a full outage, retries stay near budget_ratio of first attempts."""
+
+    @dataclass
+    class _Provider(FakeProvider):
+        calls: int = 0
+
+        async def generate(
+            self, snapshot: Any, input: Any, requirements: Any, config: Any
+        ) -> ProviderResponse:
+            self.calls += 1
+            raise APIError("unavailable", retryable=True, status_code=503)
+
+    fake = _Provider()
+    monkeypatch.setattr(pollux, "_get_provider", lambda _config: fake)
+    cfg = Config(
+        provider="gemini",
+        model=GEMINI_MODEL,
+        use_mock=True,
+        request_concurrency=1,
+        retry=RetryPolicy(
+            max_attempts=3,
+            initial_delay_s=0.0,
+            max_delay_s=0.0,
+            jitter=False,
+            budget_ratio=0.1,
+            budget_min_retries=0,
+        ),
+    )
+
+    with pytest.raises(APIError, match="unavailable"):
+        await pollux.run_many([f"Q{i}" for i in range(20)], config=cfg)
+
+    # Unbudgeted this would be 60 calls; 10% of 20 first attempts allows 2.
+    assert fake.calls == 22
@@ -899,7 +899,8 @@ async def test_anthropic_upload_success(tmp_path: Any) -> None:
             self.last_kwargs: dict[str, Any] = {}
 
         async def upload(self, **kwargs: Any) -> Any:
-            self.last_kwargs = kwargs
+            name, stream, mime_type = kwargs["file"]
+            self.last_kwargs = {**kwargs, "file": (name, stream.read(), mime_type)}
             return type("Result", (), {"id": "file_123"})()
 
     fake_files = _FakeBetaFiles()
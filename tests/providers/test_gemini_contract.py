@@ -504,6 +504,26 @@ async def test_gemini_generate_attaches_video_metadata_from_source_settings() ->
     assert contents[0].video_metadata.fps == 1.0
 
 
+@pytest.mark.asyncio
+async def test_gemini_refresh_cache_updates_ttl() -> None:
+    """Cache refresh should map to caches.update with the new TTL."""
+    captured: dict[str, Any] = {}
+
+    async def fake_update(*, name: str, config: Any) -> Any:
+        captured["name"] = name
+        captured["config"] = config
+        return type("CacheResult", (), {"name": name})()
+
+    provider = GeminiProvider("test-key")
+    provider._client = MagicMock()
+    provider._client.aio.caches.update = fake_update
+
+    await provider.refresh_cache("cachedContents/abc", ttl_seconds=900)
+
+    assert captured["name"] == "cachedContents/abc"
+    assert captured["config"].ttl == "900s"
+
+
 @pytest.mark.asyncio
 async def test_gemini_generate_uses_url_context_tool_for_url_context_sources() -> None:
     """Gemini URL Context sources should become URL text plus url_context tool."""
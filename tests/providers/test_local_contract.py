@@ -13,6 +13,7 @@ from pollux.errors import APIError, ConfigurationError, ToolCallParseError
 from pollux.interaction.continuation import Continuation, Message, build_continuation
 from pollux.interaction.tools import ToolCall, ToolResult
 from pollux.providers.local import LocalProvider
+from pollux.transport import HttpTransport
 from tests.conftest import (
     LOCAL_MODEL,
 )
@@ -626,6 +627,22 @@ async def test_local_upload_file_inlines_text_and_media(tmp_path: Any) -> None:
     assert image_asset.file_id.startswith("data:image/png;base64,")
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size", [0, 1, 3 * 256 * 1024 + 2])
+async def test_local_upload_file_data_url_round_trips_across_chunks(
+    tmp_path: Any, size: int
+) -> None:
+    """Chunked data-URL encoding matches a one-shot base64 encode of the file."""
+    provider = LocalProvider(base_url=_LOCAL_BASE_URL)
+    data = bytes(i % 251 for i in range(size))
+    audio_path = tmp_path / "clip.wav"
+    audio_path.write_bytes(data)
+
+    asset = await provider.upload_file(audio_path, "audio/wav")
+
+    assert asset.file_id == "data:audio/wav;base64," + base64.b64encode(data).decode()
+
+
 @pytest.mark.asyncio
 async def test_local_create_cache_raises_api_error() -> None:
     """Persistent caches are unsupported; should raise APIError."""
@@ -809,3 +826,45 @@ async def test_local_provider_accepts_custom_timeout() -> None:
     assert client.timeout.read == 45.0
 
     await provider.aclose()
+
+
+@pytest.mark.asyncio
+async def test_local_provider_applies_http_transport_settings() -> None:
+    """HttpTransport splits timeouts and shares an injected transport unclosed."""
+
+    class _Transport(httpx.AsyncBaseTransport):
+        def __init__(self) -> None:
+            self.requests = 0
+            self.closed = False
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            self.requests += 1
+            return httpx.Response(200, json={"ok": True})
+
+        async def aclose(self) -> None:
+            self.closed = True
+
+    shared = _Transport()
+    settings = HttpTransport(connect_timeout_s=5.0, transport=shared)
+    first = LocalProvider(base_url=_LOCAL_BASE_URL, timeout_s=45.0, transport=settings)
+    second = LocalProvider(base_url=_LOCAL_BASE_URL, transport=settings)
+
+    client = first._get_client()
+    assert client.timeout.connect == 5.0
+    assert client.timeout.read == 45.0
+
+    await client.get("/models")
+    await first.aclose()
+    await second._get_client().get("/models")
+    await second.aclose()
+
+    assert shared.requests == 2
+    assert shared.closed is False
+
+
+def test_http_transport_rejects_invalid_limits() -> None:
+    """Pool sizes and timeouts are validated at construction."""
+    with pytest.raises(ValueError, match="max_connections"):
+        HttpTransport(max_connections=0)
+    with pytest.raises(ValueError, match="read_timeout_s"):
+        HttpTransport(read_timeout_s=0)
@@ -1012,3 +1012,15 @@ async def test_openrouter_provider_configures_timeout() -> None:
     assert client.timeout.pool == 300.0
 
     await provider.aclose()
+
+
+@pytest.mark.asyncio
+async def test_openrouter_provider_accepts_custom_timeout() -> None:
+    """Config.request_timeout_s reaches the OpenRouter HTTP client."""
+    provider = OpenRouterProvider("test-key", timeout_s=45.0)
+    client = provider._get_client()
+
+    assert client.timeout.connect == 45.0
+    assert client.timeout.read == 45.0
+
+    await provider.aclose()
@@ -7,6 +7,7 @@ from typing import Any
 import pytest
 
 from pollux.errors import SourceError
+import pollux.source
 from pollux.source import Source
 
 pytestmark = pytest.mark.unit
@@ -159,3 +160,29 @@ def test_with_gemini_url_context_rejects_invalid_sources(source: Source) -> None
     """Gemini URL Context should be limited to HTTP(S) URI sources."""
     with pytest.raises(SourceError):
         source.with_gemini_url_context()
+
+
+def test_file_content_hash_is_memoized_until_the_file_changes(
+    tmp_path: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """File hashes are computed once and recomputed only when the stat stamp moves."""
+    hashed: list[str] = []
+    real_sha256_file = pollux.source.sha256_file
+
+    def _counting(path: Any) -> str:
+        hashed.append(str(path))
+        return real_sha256_file(path)
+
+    monkeypatch.setattr(pollux.source, "sha256_file", _counting)
+
+    path = tmp_path / "doc.bin"
+    path.write_bytes(b"first")
+    source = Source.from_file(path)
+
+    first = source.cache_identity_hash()
+    assert source.cache_identity_hash() == first
+    assert len(hashed) == 1
+
+    path.write_bytes(b"second version")
+    assert source.cache_identity_hash() != first
+    assert len(hashed) == 2